@@ -1,16 +1,31 @@
 # load_excel_to_db.py
 # Reads wide Excel (Date + columns) -> writes SQLite DB (prices_close)
+#
+# Usage:
+#   python load_excel_to_db.py [TARGET_DIR] [--full]
+#
+# Default is an incremental upsert: only rows that are new or whose close
+# changed are written (INSERT ... ON CONFLICT DO UPDATE, chunked
+# transactions). --full restores the old behaviour (wipe table, reload all).
+# Incremental mode never deletes: rows removed from the workbook stay in the
+# DB until a --full reload.
 
 import os, sys, sqlite3
 import pandas as pd
 
+from src.core.price_db import CREATE_INDEX_SQL, CREATE_TABLE_SQL
+
 TARGET_DIR  = r"C:\Code\Metals\Copper"   # folder containing Excel
 EXCEL_NAME  = "pricing_values.xlsx"      # <-- your actual file name
 DB_NAME     = "quant.db"
 DATE_IS_DAYFIRST = True
+CHUNK_ROWS  = 50_000                     # rows per upsert transaction
+
+args = [a for a in sys.argv[1:] if not a.startswith("--")]
+FULL_RELOAD = "--full" in sys.argv[1:]
 
-if len(sys.argv) >= 2:
-    TARGET_DIR = sys.argv[1]
+if args:
+    TARGET_DIR = args[0]
 
 EXCEL_PATH = os.path.join(TARGET_DIR, EXCEL_NAME)
 DB_PATH    = os.path.join(TARGET_DIR, DB_NAME)
@@ -41,29 +56,90 @@ def read_wide_prices(path: str) -> pd.DataFrame:
     print(f"Rows after melt: {len(long_df):,}")
     return long_df[["date", "asset", "close"]]
 
-def write_sqlite(df: pd.DataFrame, db_path: str):
-    print(f"Writing SQLite DB: {db_path}")
+def connect_db(db_path: str) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
+    # WAL: readers (builds, notebooks) are not blocked while a load writes
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute(CREATE_TABLE_SQL)
+    conn.execute(CREATE_INDEX_SQL)  # covering (asset, date) index for PriceDB queries
+    return conn
+
+def write_sqlite(df: pd.DataFrame, db_path: str):
+    print(f"Writing SQLite DB (full reload): {db_path}")
+    conn = connect_db(db_path)
     with conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS prices_close (
-                date  TEXT NOT NULL,
-                asset TEXT NOT NULL,
-                close REAL,
-                PRIMARY KEY (date, asset)
-            )
-        """)
         conn.execute("DELETE FROM prices_close;")
         df.to_sql("prices_close", conn, if_exists="append", index=False)
     conn.close()
     print("Done writing prices_close.")
 
+def diff_against_db(df: pd.DataFrame, conn: sqlite3.Connection):
+    """
+    Split workbook rows into (to_write, n_inserted, n_updated, n_unchanged).
+
+    Rows after an asset's max stored date are new without looking them up;
+    only rows up to that date are compared with the stored close, and only
+    stored rows of those assets from the earliest overlap date are read.
+    """
+    max_dates = pd.read_sql_query(
+        "SELECT asset, MAX(date) AS max_date FROM prices_close GROUP BY asset", conn
+    ).set_index("asset")["max_date"]
+
+    stored_max = df["asset"].map(max_dates)
+    is_tail = stored_max.isna() | (df["date"] > stored_max)
+    tail = df[is_tail]
+    overlap = df[~is_tail]
+
+    if overlap.empty:
+        return tail, len(tail), 0, 0
+
+    assets = overlap["asset"].unique().tolist()
+    stored = pd.read_sql_query(
+        "SELECT date, asset, close AS stored_close FROM prices_close "
+        f"WHERE asset IN ({', '.join('?' * len(assets))}) AND date >= ?",
+        conn,
+        params=[*assets, overlap["date"].min()],
+    )
+    merged = overlap.merge(stored, on=["date", "asset"], how="left")
+    missing = merged["stored_close"].isna()
+    changed = ~missing & (merged["close"] != merged["stored_close"])
+
+    to_write = pd.concat([tail, merged.loc[missing | changed, ["date", "asset", "close"]]])
+    n_inserted = len(tail) + int(missing.sum())
+    n_updated = int(changed.sum())
+    n_unchanged = len(merged) - int(missing.sum()) - n_updated
+    return to_write, n_inserted, n_updated, n_unchanged
+
+def upsert_sqlite(df: pd.DataFrame, db_path: str):
+    print(f"Upserting into SQLite DB: {db_path}")
+    conn = connect_db(db_path)
+    to_write, n_inserted, n_updated, n_unchanged = diff_against_db(df, conn)
+
+    sql = """
+        INSERT INTO prices_close (date, asset, close) VALUES (?, ?, ?)
+        ON CONFLICT(date, asset) DO UPDATE SET close = excluded.close
+    """
+    rows = list(to_write[["date", "asset", "close"]].itertuples(index=False, name=None))
+    for start in range(0, len(rows), CHUNK_ROWS):
+        with conn:  # one transaction per chunk
+            conn.executemany(sql, rows[start:start + CHUNK_ROWS])
+    conn.close()
+
+    print(f"Inserted:  {n_inserted:,}")
+    print(f"Updated:   {n_updated:,}")
+    print(f"Unchanged: {n_unchanged:,}")
+    print("Done upserting prices_close.")
+
 def main():
     print("=== Excel -> SQLite loader starting ===")
     if not os.path.exists(EXCEL_PATH):
         raise FileNotFoundError(f"Excel not found: {EXCEL_PATH}")
     df = read_wide_prices(EXCEL_PATH)
-    write_sqlite(df, DB_PATH)
+    if FULL_RELOAD:
+        write_sqlite(df, DB_PATH)
+    else:
+        upsert_sqlite(df, DB_PATH)
     print("=== All done ===")
 
 if __name__ == "__main__":
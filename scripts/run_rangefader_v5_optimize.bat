@@ -17,14 +17,13 @@ echo.
 echo In-Sample: 2000-2018 (19 years)
 echo Out-of-Sample: 2019-2025 (6.9 years)
 echo.
-echo Parameter Space:
+echo Parameter Space (Config\copper\rangefader_v5.yaml):
 echo   Lookback: 30, 40, 50, 60, 70 days
-echo   Entry: 0.6, 0.7, 0.8, 0.9, 1.0 std
+echo   Entry: 0.6, 0.8, 1.0, 1.2 std
 echo   Exit: 0.2, 0.3, 0.4 std
 echo   ADX: 15, 17, 20
 echo.
-echo Total: 225 combinations
-echo Estimated Time: 7-9 minutes
+echo Total: 180 combinations (single batched sweep)
 echo.
 
 REM Run optimization
@@ -32,6 +31,7 @@ python src\cli\optimize_rangefader_v5.py ^
     --csv-close "C:\Code\Metals\Data\copper\pricing\canonical\copper_lme_3mo.canonical.csv" ^
     --csv-high "C:\Code\Metals\Data\copper\pricing\canonical\copper_lme_3mo_high.canonical.csv" ^
     --csv-low "C:\Code\Metals\Data\copper\pricing\canonical\copper_lme_3mo_low.canonical.csv" ^
+    --config Config\copper\rangefader_v5.yaml ^
     --outdir outputs\Copper\RangeFader_v5_optimization ^
     --target-vol 0.10 ^
     --cost-bps 3.0
@@ -55,7 +55,7 @@ echo OPTIMIZATION COMPLETE!
 echo ========================================
 echo.
 echo Results saved to: outputs\Copper\RangeFader_v5_optimization\
-echo   - optimization_results.csv (all 225 combinations)
+echo   - optimization_results.csv (all grid combinations)
 echo   - optimization_summary.json (best parameters + OOS validation)
 echo.
 echo Next steps:
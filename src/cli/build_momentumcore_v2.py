@@ -35,8 +35,16 @@ import numpy as np
 # Import all layers
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.signals.momentumcore_v2 import generate_momentum_signal
-from src.core.vol_targeting import apply_vol_targeting, get_vol_diagnostics, classify_strategy_type
+from src.core.vol_targeting import (
+    RANGE_ESTIMATORS,
+    align_range_ohlc,
+    apply_vol_targeting,
+    get_vol_diagnostics,
+    classify_strategy_type,
+    get_streak_distribution,
+)
 from src.core.execution import execute_single_sleeve
+from src.core.canonical_store import read_canonical
 
 
 def make_json_serializable(obj):
@@ -67,11 +75,13 @@ def main():
     ap.add_argument("--csv", required=True, help="Path to canonical CSV")
     ap.add_argument("--outdir", required=True, help="Output directory")
     ap.add_argument("--config", required=True, help="Path to YAML config")
+    ap.add_argument("--csv-high", help="Path to high price CSV (range vol estimators)")
+    ap.add_argument("--csv-low", help="Path to low price CSV (range vol estimators)")
     args = ap.parse_args()
 
     # ========== 1. LOAD CANONICAL CSV ==========
     print(f"[MomentumCore v2] Loading canonical CSV: {args.csv}")
-    df = pd.read_csv(args.csv, parse_dates=["date"])
+    df = read_canonical(args.csv)
 
     # Validate schema
     assert (
@@ -131,16 +141,38 @@ def main():
     strategy_type = classify_strategy_type(df["pos_raw"])
     print(f"Strategy Type: {strategy_type}")
     
+    streaks = get_streak_distribution(df["pos_raw"])
+    flat_streaks = streaks["flat"]
+    print(f"Flat Streaks: {flat_streaks['count']} spells, "
+          f"max {flat_streaks['max']}d, p95 {flat_streaks['p95']:.0f}d")
+    
     # Get vol targeting config
     target_vol = cfg["policy"]["sizing"].get("ann_target", 0.10)
     print(f"Target Vol: {target_vol:.1%}")
     
+    # Vol estimator: close-to-close EWMA unless a range estimator is chosen
+    vol_estimator = cfg["policy"]["sizing"].get("vol_estimator", "ewma")
+    vol_kwargs = {"vol_estimator": vol_estimator}
+    if vol_estimator in RANGE_ESTIMATORS:
+        assert args.csv_high and args.csv_low, \
+            f"vol_estimator '{vol_estimator}' needs --csv-high and --csv-low"
+        high = read_canonical(args.csv_high).set_index("date")["price"]
+        low = read_canonical(args.csv_low).set_index("date")["price"]
+        ohlc = align_range_ohlc(df.set_index("date")["price"], high, low)
+        n_gaps = int((~df["date"].isin(high.index) | ~df["date"].isin(low.index)).sum())
+        if n_gaps:
+            print(f"  High/low missing on {n_gaps} close dates (skipped by the range estimator)")
+        vol_kwargs["ohlc"] = ohlc.set_index(df.index)
+        vol_kwargs["vol_window"] = cfg["policy"]["sizing"].get("vol_estimator_window_days", 20)
+    print(f"Vol Estimator: {vol_estimator}")
+    
     # Apply vol targeting
     df["pos_vol_targeted"] = apply_vol_targeting(
         positions=df["pos_raw"],
         underlying_returns=df["ret"],
         target_vol=target_vol,
         strategy_type=strategy_type,
+        **vol_kwargs,
     )
     
     # Diagnostic: Check vol-targeted positions
@@ -163,6 +195,7 @@ def main():
         underlying_returns=df["ret"],
         target_vol=target_vol,
         strategy_type=strategy_type,
+        **vol_kwargs,
     )
     
     # Calculate realized vol
@@ -263,6 +296,7 @@ def main():
         "target_vol": float(target_vol),
         "vol_delta": float(realized_vol - target_vol),
         "strategy_type": str(strategy_type),
+        "streaks": streaks,
         "metrics": metrics,
         "turnover_metrics": turnover_metrics,
         "execution_validation": validation,
@@ -36,6 +36,8 @@ from src.signals.rangefader_v5 import (
     get_signal_statistics,
     validate_regime_behavior,
 )
+from src.core.indicators import rolling_vol
+from src.core.canonical_store import read_canonical
 
 
 def apply_vol_targeting(
@@ -60,7 +62,7 @@ def apply_vol_targeting(
     """
     # Calculate realized vol of strategy
     strat_returns = positions.shift(1) * returns
-    realized_vol = strat_returns.rolling(vol_window).std() * np.sqrt(252)
+    realized_vol = rolling_vol(strat_returns, vol_window, cache=False)  # sleeve-specific input
     
     # Calculate leverage adjustment
     leverage = target_vol / (realized_vol + 1e-6)
@@ -338,9 +340,9 @@ def main():
     
     # Load data
     print("Loading OHLC data...")
-    df_close = pd.read_csv(args.csv_close, parse_dates=['date'], index_col='date')
-    df_high = pd.read_csv(args.csv_high, parse_dates=['date'], index_col='date')
-    df_low = pd.read_csv(args.csv_low, parse_dates=['date'], index_col='date')
+    df_close = read_canonical(args.csv_close).set_index('date')
+    df_high = read_canonical(args.csv_high).set_index('date')
+    df_low = read_canonical(args.csv_low).set_index('date')
     
     df = pd.DataFrame({
         'price': df_close['price'],
@@ -44,21 +44,20 @@ import yaml
 
 # Add paths for imports
 project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))  # src.core.* imports inside core modules
 sys.path.insert(0, str(project_root / "src" / "core"))
 sys.path.insert(0, str(project_root / "src" / "signals"))
 
 # Import from project modules
-from vol_targeting import target_volatility, classify_strategy_type
-from execution import execute_single_sleeve
+from src.core.vol_targeting import target_volatility, classify_strategy_type, get_streak_distribution
+from src.core.execution import execute_single_sleeve
+from src.core.canonical_store import read_canonical
 from tightstocks_v1 import generate_tightstocks_v1_signal
 
 
 def load_canonical_csv(path: str, required_cols: list) -> pd.DataFrame:
-    """Load and validate canonical CSV format."""
-    if not Path(path).exists():
-        raise FileNotFoundError(f"CSV not found: {path}")
-    
-    df = pd.read_csv(path, parse_dates=['date'])
+    """Load and validate canonical CSV format (store-backed, see read_canonical)."""
+    df = read_canonical(path)
     
     # Validate required columns
     missing = [c for c in required_cols if c not in df.columns]
@@ -176,6 +175,9 @@ def main():
     
     # Auto-classify diagnostics
     auto_classification = classify_strategy_type(pos_raw)
+    flat_streaks = get_streak_distribution(pos_raw)['flat']
+    print(f"  ✓ Flat streaks: {flat_streaks['count']} spells, "
+          f"median {flat_streaks['median']:.0f}d, max {flat_streaks['max']}d")
     if auto_classification != strategy_type:
         print(f"  ⚠️  Config says '{strategy_type}' but auto-classification says '{auto_classification}'")
     
@@ -35,70 +35,12 @@ import pandas as pd
 import numpy as np
 import yaml
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-def calculate_realized_vol(returns, window=21):
-    return returns.rolling(window=window).std() * np.sqrt(252) * 100
-
-
-def calculate_vol_spread_zscore(iv, rv, lookback=252):
-    vol_spread = iv - rv
-    zscore = (vol_spread - vol_spread.rolling(lookback).mean()) / vol_spread.rolling(lookback).std()
-    return zscore, vol_spread
-
-
-def generate_volcore_v2_signal(df, short_entry_zscore=1.5, long_entry_zscore=-1.0,
-                                short_exit_zscore=0.5, long_exit_zscore=-0.3,
-                                rv_window=21, zscore_lookback=252, min_hold_days=5,
-                                longs_only=False, shorts_only=False):
-    df = df.copy()
-    rv = calculate_realized_vol(df['ret'], window=rv_window)
-    zscore, vol_spread = calculate_vol_spread_zscore(df['iv'], rv, lookback=zscore_lookback)
-    
-    df['rv'] = rv
-    df['vol_spread'] = vol_spread
-    df['vol_spread_zscore'] = zscore
-    
-    pos_raw = pd.Series(0.0, index=df.index)
-    current_pos = 0
-    days_held = 0
-    
-    for i in range(1, len(df)):
-        prev_z = zscore.iloc[i-1]
-        if pd.isna(prev_z):
-            pos_raw.iloc[i] = current_pos
-            continue
-        
-        if current_pos != 0:
-            days_held += 1
-        else:
-            days_held = 0
-        
-        new_pos = current_pos
-        
-        if current_pos == 0:
-            if prev_z > short_entry_zscore and not longs_only:
-                new_pos = -1
-                days_held = 0
-            elif prev_z < long_entry_zscore and not shorts_only:
-                new_pos = 1
-                days_held = 0
-        elif current_pos == 1:
-            if days_held >= min_hold_days and prev_z > long_exit_zscore:
-                new_pos = 0
-                if prev_z > short_entry_zscore and not longs_only:
-                    new_pos = -1
-                    days_held = 0
-        elif current_pos == -1:
-            if days_held >= min_hold_days and prev_z < short_exit_zscore:
-                new_pos = 0
-                if prev_z < long_entry_zscore and not shorts_only:
-                    new_pos = 1
-                    days_held = 0
-        
-        pos_raw.iloc[i] = new_pos
-        current_pos = new_pos
-    
-    return pos_raw, df
+from src.signals.volcore_v2 import generate_volcore_v2_signal
+from src.core.metrics import metrics_dict
+from src.core.canonical_store import read_canonical
 
 
 def apply_vol_targeting(positions, returns, target_vol=0.10, vol_lookback=63, leverage_cap=2.5):
@@ -127,12 +69,7 @@ def calculate_metrics(pnl_net, positions, warmup=252):
     if len(pnl) < 100:
         return {'error': 'Insufficient data'}
     
-    ann_ret = pnl.mean() * 252
-    ann_vol = pnl.std() * np.sqrt(252)
-    sharpe = ann_ret / ann_vol if ann_vol > 0 else 0
-    
-    cum_ret = (1 + pnl).cumprod()
-    max_dd = (cum_ret / cum_ret.expanding().max() - 1).min()
+    m = metrics_dict(pnl)
     
     long_pct = (pos == 1).mean() * 100
     short_pct = (pos == -1).mean() * 100
@@ -141,8 +78,8 @@ def calculate_metrics(pnl_net, positions, warmup=252):
     trades_per_year = trades / (len(pnl) / 252)
     
     return {
-        'sharpe': float(sharpe), 'annual_return': float(ann_ret),
-        'annual_vol': float(ann_vol), 'max_drawdown': float(max_dd),
+        'sharpe': m['sharpe'], 'annual_return': m['mean_return'],
+        'annual_vol': m['annual_vol'], 'max_drawdown': m['max_drawdown'],
         'long_pct': float(long_pct), 'short_pct': float(short_pct),
         'flat_pct': float(flat_pct), 'trades_per_year': float(trades_per_year),
         'obs': int(len(pnl)),
@@ -163,9 +100,9 @@ def main():
     
     # Load data
     print("\n[1/5] Loading data...")
-    df_price = pd.read_csv(args.csv_price, parse_dates=['date'])
+    df_price = read_canonical(args.csv_price)
     df_price['ret'] = df_price['price'].pct_change()
-    df_iv = pd.read_csv(args.csv_iv, parse_dates=['date'])
+    df_iv = read_canonical(args.csv_iv)
     
     df = pd.merge(df_price, df_iv, on='date', how='left')
     df['iv'] = df['iv'].ffill()
@@ -22,6 +22,7 @@ import pandas as pd
 import numpy as np
 import json
 import sys
+import yaml
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Tuple
@@ -34,6 +35,8 @@ from src.signals.rangefader_v5 import (
     calculate_adx_ohlc,
     validate_regime_behavior,
 )
+from src.core.state_machine import hysteresis_positions_batch
+from src.core.series_cache import load_panel
 
 
 def calculate_sharpe(returns: pd.Series) -> float:
@@ -43,6 +46,47 @@ def calculate_sharpe(returns: pd.Series) -> float:
     return (returns.mean() / returns.std()) * np.sqrt(252)
 
 
+def size_and_cost(
+    positions,
+    returns: pd.Series,
+    target_vol: float = 0.10,
+    cost_bps: float = 3.0,
+):
+    """
+    Vol targeting (simplified) and transaction costs for the optimizer.
+    
+    Shared by test_parameter_combination() (one cell, Series) and
+    sweep_parameter_grid() (one column per cell, DataFrame), so both paths
+    size and cost positions identically.
+    
+    Args:
+        positions: Raw positions, Series or DataFrame (columns = cells)
+        returns: Underlying returns on the same index
+        target_vol: Target volatility for sizing
+        cost_bps: Transaction costs in bps
+        
+    Returns:
+        positions_scaled: Vol-targeted positions (63d realized vol, 3x cap)
+        strat_returns: Gross strategy returns (T-1 position × T return)
+        position_changes: |Δ scaled position| per bar
+        net_returns: strat_returns less costs on position_changes
+    """
+    if isinstance(positions, pd.DataFrame):
+        returns = returns.to_numpy(dtype=float)[:, None]
+    
+    # ========== VOL TARGETING (SIMPLIFIED) ==========
+    realized_vol = (positions.shift(1) * returns).rolling(63).std() * np.sqrt(252)
+    leverage = (target_vol / (realized_vol + 1e-6)).clip(0, 3.0)  # Cap at 3x
+    positions_scaled = positions * leverage
+    
+    # ========== COSTS & PNL ==========
+    strat_returns = positions_scaled.shift(1) * returns
+    position_changes = positions_scaled.diff().abs()
+    net_returns = strat_returns - (position_changes * cost_bps / 10000)
+    
+    return positions_scaled, strat_returns, position_changes, net_returns
+
+
 def test_parameter_combination(
     df: pd.DataFrame,
     lookback: int,
@@ -82,27 +126,18 @@ def test_parameter_combination(
         # Calculate returns
         returns = df['price'].pct_change()
         
-        # Apply vol targeting (simplified)
-        realized_vol = (positions.shift(1) * returns).rolling(63).std() * np.sqrt(252)
-        leverage = target_vol / (realized_vol + 1e-6)
-        leverage = leverage.clip(0, 3.0)  # Cap at 3x
-        
-        positions_scaled = positions * leverage
-        
-        # Calculate strategy returns
-        strat_returns = positions_scaled.shift(1) * returns
+        # Vol targeting, costs and PnL (shared with the grid sweep)
+        positions_scaled, strat_returns, position_changes, net_returns = size_and_cost(
+            positions, returns, target_vol, cost_bps
+        )
         
-        # Calculate turnover and costs
-        position_changes = positions_scaled.diff().abs()
+        # Turnover and costs
         turnover = position_changes.sum()
         annual_turnover = turnover / (len(df) / 252)
         
         total_costs = turnover * (cost_bps / 10000)
         annual_cost = total_costs / (len(df) / 252)
         
-        # Net returns
-        net_returns = strat_returns - (position_changes * cost_bps / 10000)
-        
         # Calculate metrics
         gross_sharpe = calculate_sharpe(strat_returns.dropna())
         net_sharpe = calculate_sharpe(net_returns.dropna())
@@ -146,6 +181,136 @@ def test_parameter_combination(
         }
 
 
+def _column_sharpe(returns: pd.DataFrame) -> np.ndarray:
+    """Column-wise calculate_sharpe() (NaNs dropped per column)."""
+    mean = returns.mean()
+    std = returns.std()
+    count = returns.count()
+    sharpe = (mean / std) * np.sqrt(252)
+    sharpe[(count == 0) | (std == 0)] = 0.0
+    return sharpe.to_numpy(dtype=float)
+
+
+def sweep_parameter_grid(
+    df: pd.DataFrame,
+    lookback_range: list,
+    entry_range: list,
+    exit_range: list,
+    adx_range: list,
+    target_vol: float = 0.10,
+    cost_bps: float = 3.0,
+    adx_window: int = 14,
+) -> pd.DataFrame:
+    """
+    Evaluate the full lookback × entry × exit × ADX grid in one pass.
+    
+    Same rows (same order and metrics) as calling test_parameter_combination()
+    per cell, but every invariant is computed once:
+        - Returns and OHLC ADX: once per sweep
+        - Choppy mask: once per ADX threshold
+        - Z-score: once per lookback
+        - Positions, vol targeting, costs and metrics for all entry/exit
+          pairs: one batched (dates × pairs) computation per lookback/ADX block
+    
+    Args:
+        df: DataFrame with OHLC data ('price', 'high', 'low')
+        lookback_range: Lookback windows to test
+        entry_range: Entry thresholds to test
+        exit_range: Exit thresholds to test
+        adx_range: ADX thresholds to test
+        target_vol: Target volatility for sizing
+        cost_bps: Transaction costs in bps
+        adx_window: ADX calculation window
+        
+    Returns:
+        pd.DataFrame: One row per parameter combination
+    """
+    price = df['price']
+    returns = price.pct_change()
+    n_years = len(df) / 252
+    
+    # ========== INVARIANTS ==========
+    adx = calculate_adx_ohlc(df['high'], df['low'], price, window=adx_window)
+    choppy_masks = {adx_threshold: adx < adx_threshold for adx_threshold in adx_range}
+    
+    zscores = {}
+    for lookback in lookback_range:
+        sma = price.rolling(lookback, min_periods=lookback).mean()
+        rolling_std = price.rolling(lookback, min_periods=lookback).std()
+        zscores[lookback] = ((price - sma) / rolling_std).to_numpy(dtype=float)
+    
+    # Entry/exit pairs in the same nesting order as the per-cell loop
+    pairs = [(entry, exit) for entry in entry_range for exit in exit_range]
+    entries = np.array([entry for entry, _ in pairs], dtype=float)
+    exits = np.array([exit for _, exit in pairs], dtype=float)
+    
+    blocks = {}
+    for lookback in lookback_range:
+        warmup = max(lookback, adx_window * 2)
+        for adx_threshold in adx_range:
+            choppy_mask = choppy_masks[adx_threshold]
+            
+            # ========== LAYER 1: POSITIONS FOR ALL PAIRS ==========
+            positions = hysteresis_positions_batch(
+                zscores[lookback],
+                choppy_mask.to_numpy(dtype=bool),
+                entries,
+                exits,
+                start=warmup,
+            ).astype(float)
+            positions = pd.DataFrame(positions, index=df.index)
+            
+            # ========== LAYERS 2 & 4: VOL TARGETING, COSTS & PNL ==========
+            _, strat_returns, position_changes, net_returns = size_and_cost(
+                positions, returns, target_vol, cost_bps
+            )
+            turnover = position_changes.sum().to_numpy(dtype=float)
+            
+            # ========== METRICS ==========
+            active = positions.abs() > 0.01
+            n_choppy = int(choppy_mask.sum())
+            if n_choppy > 0:
+                activity_in_choppy = active[choppy_mask].sum().to_numpy() / n_choppy * 100
+            else:
+                activity_in_choppy = np.zeros(len(pairs))
+            
+            blocks[(lookback, adx_threshold)] = {
+                'gross_sharpe': _column_sharpe(strat_returns),
+                'net_sharpe': _column_sharpe(net_returns),
+                'choppy_sharpe': _column_sharpe(net_returns[choppy_mask]),
+                'annual_turnover': turnover / n_years,
+                'annual_cost': turnover * (cost_bps / 10000) / n_years,
+                'activity_pct': active.sum().to_numpy() / len(df) * 100,
+                'activity_in_choppy': activity_in_choppy,
+                'choppy_pct_time': choppy_mask.mean() * 100,
+            }
+    
+    # ========== ASSEMBLE RESULT TABLE (per-cell loop order) ==========
+    results = []
+    for lookback in lookback_range:
+        for p, (entry, exit) in enumerate(pairs):
+            for adx_threshold in adx_range:
+                block = blocks[(lookback, adx_threshold)]
+                results.append({
+                    'lookback': lookback,
+                    'entry': entry,
+                    'exit': exit,
+                    'adx_threshold': adx_threshold,
+                    'gross_sharpe': float(block['gross_sharpe'][p]),
+                    'net_sharpe': float(block['net_sharpe'][p]),
+                    'choppy_sharpe': float(block['choppy_sharpe'][p]),
+                    'annual_turnover': float(block['annual_turnover'][p]),
+                    'annual_cost': float(block['annual_cost'][p]),
+                    'activity_pct': float(block['activity_pct'][p]),
+                    'activity_in_choppy': float(block['activity_in_choppy'][p]),
+                    'choppy_pct_time': float(block['choppy_pct_time']),
+                    'n_obs': len(df),
+                    'success': True,
+                })
+    
+    return pd.DataFrame(results)
+
+
 def run_optimization(
     df_is: pd.DataFrame,
     df_oos: pd.DataFrame,
@@ -186,29 +351,24 @@ def run_optimization(
     
     total_combinations = len(lookback_range) * len(entry_range) * len(exit_range) * len(adx_range)
     print(f"\nTotal Combinations: {total_combinations}")
-    print(f"Estimated Time: {total_combinations * 2 / 60:.1f} minutes")
     
     # Run grid search on IS data
     print("\n" + "=" * 80)
     print("PHASE 1: IN-SAMPLE OPTIMIZATION (2000-2018)")
     print("=" * 80)
     
-    results = []
-    for i, lookback in enumerate(lookback_range):
-        for entry in entry_range:
-            for exit in exit_range:
-                for adx in adx_range:
-                    result = test_parameter_combination(
-                        df_is, lookback, entry, exit, adx, target_vol, cost_bps
-                    )
-                    results.append(result)
-                    
-                    if result['success'] and result['net_sharpe'] > 0.25:
-                        print(f"  [{len(results)}/{total_combinations}] "
-                              f"L={lookback:2d} E={entry:.1f} X={exit:.1f} ADX={adx:2.0f} "
-                              f"→ Net={result['net_sharpe']:+.3f} Choppy={result['choppy_sharpe']:+.3f}")
-    
-    results_df = pd.DataFrame(results)
+    results_df = sweep_parameter_grid(
+        df_is, lookback_range, entry_range, exit_range, adx_range,
+        target_vol=target_vol, cost_bps=cost_bps,
+    )
+    
+    for i, result in enumerate(results_df.to_dict('records'), start=1):
+        if result['net_sharpe'] > 0.25:
+            print(f"  [{i}/{total_combinations}] "
+                  f"L={result['lookback']:2d} E={result['entry']:.1f} X={result['exit']:.1f} "
+                  f"ADX={result['adx_threshold']:2.0f} "
+                  f"→ Net={result['net_sharpe']:+.3f} Choppy={result['choppy_sharpe']:+.3f}")
+    
     results_df = results_df[results_df['success']]
     
     # Find best IS parameters
@@ -350,31 +510,47 @@ def main():
                        help='Output directory')
     parser.add_argument('--target-vol', type=float, default=0.10, help='Target volatility')
     parser.add_argument('--cost-bps', type=float, default=3.0, help='Transaction costs in bps')
+    parser.add_argument('--config', default=None,
+                       help='Optional YAML config; grid read from optimization.parameter_space')
     
     args = parser.parse_args()
     
-    # Load data
+    # Parameter grid (defaults unless a config overrides them)
+    grid = {}
+    if args.config:
+        with open(args.config, 'r') as f:
+            cfg = yaml.safe_load(f)
+        space = cfg.get('optimization', {}).get('parameter_space', {})
+        for key, arg_name in [
+            ('lookback_window', 'lookback_range'),
+            ('zscore_entry', 'entry_range'),
+            ('zscore_exit', 'exit_range'),
+            ('adx_threshold', 'adx_range'),
+        ]:
+            if key in space:
+                grid[arg_name] = list(space[key])
+    
+    # Load data (memory-mapped series cache, built on first use; columns are
+    # views of the mapped files when close/high/low share their dates)
     print("Loading data...")
-    df_close = pd.read_csv(args.csv_close, parse_dates=['date'], index_col='date')
-    df_high = pd.read_csv(args.csv_high, parse_dates=['date'], index_col='date')
-    df_low = pd.read_csv(args.csv_low, parse_dates=['date'], index_col='date')
-    
-    df = pd.DataFrame({
-        'price': df_close['price'],
-        'high': df_high['price'],
-        'low': df_low['price'],
-    }).dropna()
+    df = load_panel({
+        'price': args.csv_close,
+        'high': args.csv_high,
+        'low': args.csv_low,
+    })
     
-    # Split IS/OOS
+    # Split IS/OOS (positional slices of the sorted index: views, no copy)
     split_date = '2019-01-01'
-    df_is = df[df.index < split_date]
-    df_oos = df[df.index >= split_date]
+    split = df.index.searchsorted(pd.Timestamp(split_date))
+    df_is = df.iloc[:split]
+    df_oos = df.iloc[split:]
     
     # Run optimization
     results_df, summary = run_optimization(
         df_is, df_oos,
         target_vol=args.target_vol,
         cost_bps=args.cost_bps,
+        **grid,
     )
     
     # Save results
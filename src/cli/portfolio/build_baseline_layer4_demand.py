@@ -25,6 +25,21 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+
+
+# Report key -> src.core.metrics field
+SUMMARY_KEYS = {
+    'sharpe': 'sharpe',
+    'annual_return': 'annual_return',
+    'annual_vol': 'annual_vol',
+    'max_drawdown': 'max_drawdown',
+    'days': 'obs',
+}
 
 
 def load_config(config_path: str) -> dict:
@@ -57,41 +72,6 @@ def load_sleeve(sleeve_config: dict, base_path: Path) -> pd.DataFrame:
     return result
 
 
-def calculate_sharpe(pnl_series: pd.Series, periods_per_year: int = 252) -> float:
-    """Calculate annualized Sharpe ratio."""
-    pnl = pnl_series.dropna()
-    if len(pnl) == 0 or pnl.std() == 0:
-        return 0.0
-    return (pnl.mean() * periods_per_year) / (pnl.std() * np.sqrt(periods_per_year))
-
-
-def calculate_metrics(pnl_series: pd.Series) -> dict:
-    """Calculate comprehensive performance metrics."""
-    pnl = pnl_series.dropna()
-    
-    if len(pnl) == 0:
-        return {'sharpe': 0.0, 'annual_return': 0.0, 'annual_vol': 0.0, 
-                'max_drawdown': 0.0, 'days': 0}
-    
-    cum_returns = (1 + pnl).cumprod()
-    sharpe = calculate_sharpe(pnl)
-    total_return = cum_returns.iloc[-1] - 1
-    annual_return = (1 + total_return) ** (252 / len(pnl)) - 1
-    annual_vol = pnl.std() * np.sqrt(252)
-    
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    return {
-        'sharpe': float(sharpe),
-        'annual_return': float(annual_return),
-        'annual_vol': float(annual_vol),
-        'max_drawdown': float(max_dd),
-        'days': int(len(pnl))
-    }
-
-
 def apply_transaction_costs(positions: pd.Series, cost_bps: float) -> pd.Series:
     """Calculate transaction costs on position changes."""
     trades = positions.diff().abs()
@@ -193,8 +173,8 @@ def main():
     print("-" * 65)
     
     for name in weights.keys():
-        is_sharpe = calculate_sharpe(pnl_dict[name].loc[is_dates])
-        oos_sharpe = calculate_sharpe(pnl_dict[name].loc[oos_dates])
+        is_sharpe = sharpe_ratio(pnl_dict[name].loc[is_dates])
+        oos_sharpe = sharpe_ratio(pnl_dict[name].loc[oos_dates])
         print(f"{name:<40} {is_sharpe:>12.3f} {oos_sharpe:>12.3f}")
     
     # Portfolio metrics
@@ -203,11 +183,11 @@ def main():
     oos_pnl_gross = portfolio_pnl_gross.loc[oos_dates]
     oos_pnl_net = portfolio_pnl_net.loc[oos_dates]
     
-    is_metrics_gross = calculate_metrics(is_pnl_gross)
-    is_metrics_net = calculate_metrics(is_pnl_net)
-    oos_metrics_gross = calculate_metrics(oos_pnl_gross)
-    oos_metrics_net = calculate_metrics(oos_pnl_net)
-    full_metrics_net = calculate_metrics(portfolio_pnl_net)
+    is_metrics_gross = metrics_summary(is_pnl_gross, SUMMARY_KEYS)
+    is_metrics_net = metrics_summary(is_pnl_net, SUMMARY_KEYS)
+    oos_metrics_gross = metrics_summary(oos_pnl_gross, SUMMARY_KEYS)
+    oos_metrics_net = metrics_summary(oos_pnl_net, SUMMARY_KEYS)
+    full_metrics_net = metrics_summary(portfolio_pnl_net, SUMMARY_KEYS)
     
     print("-" * 65)
     print(f"{'PORTFOLIO (Gross)':<40} {is_metrics_gross['sharpe']:>12.3f} {oos_metrics_gross['sharpe']:>12.3f}")
@@ -310,7 +290,7 @@ def main():
             'annual_vol': is_metrics_net['annual_vol'],
             'max_drawdown': is_metrics_net['max_drawdown'],
             'days': is_metrics_net['days'],
-            'sleeves_gross': {name: calculate_sharpe(pnl_dict[name].loc[is_dates]) 
+            'sleeves_gross': {name: sharpe_ratio(pnl_dict[name].loc[is_dates]) 
                              for name in weights.keys()}
         },
         'oos_metrics': {
@@ -320,7 +300,7 @@ def main():
             'annual_vol': oos_metrics_net['annual_vol'],
             'max_drawdown': oos_metrics_net['max_drawdown'],
             'days': oos_metrics_net['days'],
-            'sleeves_gross': {name: calculate_sharpe(pnl_dict[name].loc[oos_dates]) 
+            'sleeves_gross': {name: sharpe_ratio(pnl_dict[name].loc[oos_dates]) 
                              for name in weights.keys()}
         },
         'validation': {
@@ -22,6 +22,7 @@ from datetime import datetime, date
 import sys
 
 # Import blender
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))  # src.core.* inside blender
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from portfolio.blender import (
     blend_sleeves_equal_weight,
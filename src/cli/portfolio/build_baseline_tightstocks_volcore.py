@@ -10,6 +10,22 @@ from pathlib import Path
 import json
 from datetime import datetime
 import itertools
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+
+# Report key -> src.core.metrics field
+SUMMARY_KEYS = {
+    'sharpe': 'sharpe',
+    'total_return': 'total_return',
+    'ann_return': 'annual_return',
+    'ann_vol': 'annual_vol',
+    'max_drawdown': 'max_drawdown',
+    'win_rate': 'hit_rate',
+    'num_days': 'obs',
+}
 
 def load_config(config_path):
     """Load configuration file"""
@@ -40,41 +56,6 @@ def load_component(component_config, base_path):
         pnl_col: 'pnl_gross'
     })
 
-def calculate_sharpe(returns, periods_per_year=252):
-    """Calculate annualized Sharpe ratio"""
-    if len(returns) == 0 or returns.std() == 0:
-        return 0.0
-    return (returns.mean() * periods_per_year) / (returns.std() * np.sqrt(periods_per_year))
-
-def calculate_metrics(pnl_series, label="Portfolio"):
-    """Calculate comprehensive performance metrics"""
-    returns = pnl_series
-    cum_returns = (1 + returns).cumprod()
-    
-    sharpe = calculate_sharpe(returns)
-    total_return = cum_returns.iloc[-1] - 1
-    ann_return = (1 + total_return) ** (252 / len(returns)) - 1
-    ann_vol = returns.std() * np.sqrt(252)
-    
-    # Drawdown
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    # Win rate
-    win_rate = (returns > 0).sum() / len(returns)
-    
-    return {
-        'label': label,
-        'sharpe': sharpe,
-        'total_return': total_return,
-        'ann_return': ann_return,
-        'ann_vol': ann_vol,
-        'max_drawdown': max_dd,
-        'win_rate': win_rate,
-        'num_days': len(returns)
-    }
-
 def blend_three_portfolios(bl_pnl, ts_pnl, vc_pnl, w_bl, w_ts, w_vc):
     """Blend three portfolios with given weights (pre-normalized)"""
     # All three should already be aligned on common dates
@@ -158,9 +139,9 @@ def main():
     print("INDIVIDUAL COMPONENT PERFORMANCE")
     print("-" * 80)
     
-    baseline_metrics = calculate_metrics(baseline_pnl, "Baseline")
-    ts_metrics = calculate_metrics(ts_pnl, "TightStocks")
-    vc_metrics = calculate_metrics(vc_pnl, "VolCore")
+    baseline_metrics = metrics_summary(baseline_pnl, SUMMARY_KEYS, "Baseline")
+    ts_metrics = metrics_summary(ts_pnl, SUMMARY_KEYS, "TightStocks")
+    vc_metrics = metrics_summary(vc_pnl, SUMMARY_KEYS, "VolCore")
     
     all_results.extend([baseline_metrics, ts_metrics, vc_metrics])
     
@@ -216,7 +197,7 @@ def main():
         
         # Calculate metrics
         label = f"{name} ({w_bl_norm:.0%}/{w_ts_norm:.0%}/{w_vc_norm:.0%})"
-        metrics = calculate_metrics(blended_pnl, label)
+        metrics = metrics_summary(blended_pnl, SUMMARY_KEYS, label)
         metrics['weights'] = {
             'baseline': w_bl_norm,
             'tightstocks': w_ts_norm,
@@ -282,7 +263,7 @@ def main():
                                                  w_bl, w_ts, w_vc)
             
             # Calculate metrics
-            sharpe = calculate_sharpe(blended_pnl)
+            sharpe = sharpe_ratio(blended_pnl)
             cum_returns = (1 + blended_pnl).cumprod()
             cum_max = cum_returns.cummax()
             drawdown = (cum_returns - cum_max) / cum_max
@@ -381,15 +362,15 @@ def main():
             continue
         
         # Calculate metrics for this period
-        bl_period_sharpe = calculate_sharpe(period_bl)
-        ts_period_sharpe = calculate_sharpe(period_ts)
-        vc_period_sharpe = calculate_sharpe(period_vc)
+        bl_period_sharpe = sharpe_ratio(period_bl)
+        ts_period_sharpe = sharpe_ratio(period_ts)
+        vc_period_sharpe = sharpe_ratio(period_vc)
         
         # Best allocation for this period
         w = best_allocation['weights']
         period_blended = blend_three_portfolios(period_bl, period_ts, period_vc,
                                                w['baseline'], w['tightstocks'], w['volcore'])
-        blended_sharpe = calculate_sharpe(period_blended)
+        blended_sharpe = sharpe_ratio(period_blended)
         
         # Calculate max DD for period
         cum_ret = (1 + period_blended).cumprod()
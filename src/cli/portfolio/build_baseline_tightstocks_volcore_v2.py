@@ -20,7 +20,12 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from itertools import product
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+from src.portfolio.weight_search import search_blend_weights
 
 
 def load_config(config_path: str) -> dict:
@@ -48,42 +53,6 @@ def load_sleeve(sleeve_config: dict, base_path: Path) -> pd.DataFrame:
     return result
 
 
-def calculate_sharpe(pnl_series: pd.Series, periods_per_year: int = 252) -> float:
-    """Calculate annualized Sharpe ratio"""
-    pnl = pnl_series.dropna()
-    if len(pnl) == 0 or pnl.std() == 0:
-        return 0.0
-    return (pnl.mean() * periods_per_year) / (pnl.std() * np.sqrt(periods_per_year))
-
-
-def calculate_metrics(pnl_series: pd.Series, label: str = "Portfolio") -> dict:
-    """Calculate comprehensive performance metrics"""
-    pnl = pnl_series.dropna()
-    
-    if len(pnl) == 0:
-        return {'label': label, 'sharpe': 0.0, 'annual_return': 0.0, 
-                'annual_vol': 0.0, 'max_drawdown': 0.0, 'days': 0}
-    
-    cum_returns = (1 + pnl).cumprod()
-    sharpe = calculate_sharpe(pnl)
-    total_return = cum_returns.iloc[-1] - 1
-    annual_return = (1 + total_return) ** (252 / len(pnl)) - 1
-    annual_vol = pnl.std() * np.sqrt(252)
-    
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    return {
-        'label': label,
-        'sharpe': float(sharpe),
-        'annual_return': float(annual_return),
-        'annual_vol': float(annual_vol),
-        'max_drawdown': float(max_dd),
-        'days': int(len(pnl))
-    }
-
-
 def blend_three_pnls(bl_pnl: pd.Series, ts_pnl: pd.Series, vc_pnl: pd.Series,
                      bl_wt: float, ts_wt: float, vc_wt: float) -> pd.Series:
     """Blend three PnL series with given weights"""
@@ -97,64 +66,38 @@ def grid_search_three_weights(bl_pnl: pd.Series, ts_pnl: pd.Series, vc_pnl: pd.S
     """
     Grid search for optimal three-way weights.
     
+    Sharpe of every simplex point (weights summing to 1) from the sleeve
+    mean vector and covariance, no blended series built per cell.
+    
     Returns: (best_weights, best_sharpe, all_results)
     """
-    weight_range = np.arange(0.0, 1.0 + step, step)
-    
-    best_sharpe = -np.inf
-    best_weights = {'baseline': 0.33, 'tightstocks': 0.33, 'volcore': 0.34}
-    all_results = []
+    pnls = pd.DataFrame({'baseline': bl_pnl, 'tightstocks': ts_pnl, 'volcore': vc_pnl})
+    weights, sharpes, best = search_blend_weights(pnls, step=step)
     
-    for bl_wt, ts_wt, vc_wt in product(weight_range, repeat=3):
-        # Skip if weights don't sum to ~1.0
-        if abs(bl_wt + ts_wt + vc_wt - 1.0) > 0.01:
-            continue
-        
-        blended = blend_three_pnls(bl_pnl, ts_pnl, vc_pnl, bl_wt, ts_wt, vc_wt)
-        sharpe = calculate_sharpe(blended)
-        
-        all_results.append({
-            'baseline': bl_wt,
-            'tightstocks': ts_wt,
-            'volcore': vc_wt,
-            'sharpe': sharpe
-        })
-        
-        if sharpe > best_sharpe:
-            best_sharpe = sharpe
-            best_weights = {'baseline': bl_wt, 'tightstocks': ts_wt, 'volcore': vc_wt}
+    all_results = [
+        {'baseline': float(bl_wt), 'tightstocks': float(ts_wt), 'volcore': float(vc_wt),
+         'sharpe': float(sharpe)}
+        for (bl_wt, ts_wt, vc_wt), sharpe in zip(weights, sharpes)
+    ]
+    best_weights = dict(zip(pnls.columns, (float(w) for w in weights[best])))
     
-    return best_weights, best_sharpe, all_results
+    return best_weights, float(sharpes[best]), all_results
 
 
 def find_best_two_way(bl_pnl: pd.Series, ts_pnl: pd.Series, vc_pnl: pd.Series,
                       step: float = 0.05) -> dict:
     """Find best two-way combinations for comparison"""
-    weight_range = np.arange(0.0, 1.0 + step, step)
-    
     results = {}
     
     # BL + TS (no VC)
-    best_bl_ts = -np.inf
-    best_bl_ts_wt = 0.5
-    for bl_wt in weight_range:
-        blended = bl_pnl.fillna(0) * bl_wt + ts_pnl.fillna(0) * (1 - bl_wt)
-        sharpe = calculate_sharpe(blended)
-        if sharpe > best_bl_ts:
-            best_bl_ts = sharpe
-            best_bl_ts_wt = bl_wt
-    results['bl_ts'] = {'sharpe': best_bl_ts, 'bl': best_bl_ts_wt, 'ts': 1 - best_bl_ts_wt}
+    weights, sharpes, best = search_blend_weights(pd.concat([bl_pnl, ts_pnl], axis=1), step=step)
+    best_bl_ts_wt = float(weights[best, 0])
+    results['bl_ts'] = {'sharpe': float(sharpes[best]), 'bl': best_bl_ts_wt, 'ts': 1 - best_bl_ts_wt}
     
     # BL + VC (no TS)
-    best_bl_vc = -np.inf
-    best_bl_vc_wt = 0.5
-    for bl_wt in weight_range:
-        blended = bl_pnl.fillna(0) * bl_wt + vc_pnl.fillna(0) * (1 - bl_wt)
-        sharpe = calculate_sharpe(blended)
-        if sharpe > best_bl_vc:
-            best_bl_vc = sharpe
-            best_bl_vc_wt = bl_wt
-    results['bl_vc'] = {'sharpe': best_bl_vc, 'bl': best_bl_vc_wt, 'vc': 1 - best_bl_vc_wt}
+    weights, sharpes, best = search_blend_weights(pd.concat([bl_pnl, vc_pnl], axis=1), step=step)
+    best_bl_vc_wt = float(weights[best, 0])
+    results['bl_vc'] = {'sharpe': float(sharpes[best]), 'bl': best_bl_vc_wt, 'vc': 1 - best_bl_vc_wt}
     
     return results
 
@@ -251,9 +194,9 @@ def main():
     print("-"*80)
     
     # Standalone IS performance
-    is_bl_sharpe = calculate_sharpe(is_bl)
-    is_ts_sharpe = calculate_sharpe(is_ts)
-    is_vc_sharpe = calculate_sharpe(is_vc)
+    is_bl_sharpe = sharpe_ratio(is_bl)
+    is_ts_sharpe = sharpe_ratio(is_ts)
+    is_vc_sharpe = sharpe_ratio(is_vc)
     
     print(f"IS Standalone:")
     print(f"  Baseline:    {is_bl_sharpe:.3f}")
@@ -330,9 +273,9 @@ def main():
     print()
     
     # Standalone OOS
-    oos_bl_sharpe = calculate_sharpe(oos_bl)
-    oos_ts_sharpe = calculate_sharpe(oos_ts)
-    oos_vc_sharpe = calculate_sharpe(oos_vc)
+    oos_bl_sharpe = sharpe_ratio(oos_bl)
+    oos_ts_sharpe = sharpe_ratio(oos_ts)
+    oos_vc_sharpe = sharpe_ratio(oos_vc)
     
     print(f"OOS Standalone:")
     print(f"  Baseline:    {oos_bl_sharpe:.3f}")
@@ -348,7 +291,7 @@ def main():
         oos_bl, oos_ts, oos_vc,
         best_weights['baseline'], best_weights['tightstocks'], best_weights['volcore']
     )
-    oos_sharpe = calculate_sharpe(oos_blended)
+    oos_sharpe = sharpe_ratio(oos_blended)
     
     print(f"OOS Weights (from IS):")
     print(f"  Baseline:    {best_weights['baseline']:.0%}")
@@ -23,6 +23,21 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+
+
+# Report key -> src.core.metrics field
+SUMMARY_KEYS = {
+    'sharpe': 'sharpe',
+    'annual_return': 'annual_return',
+    'annual_vol': 'annual_vol',
+    'max_drawdown': 'max_drawdown',
+    'days': 'obs',
+}
 
 
 def load_config(config_path: str) -> dict:
@@ -48,39 +63,6 @@ def load_sleeve(sleeve_config: dict, base_path: Path) -> pd.DataFrame:
     return result
 
 
-def calculate_sharpe(pnl_series: pd.Series, periods_per_year: int = 252) -> float:
-    pnl = pnl_series.dropna()
-    if len(pnl) == 0 or pnl.std() == 0:
-        return 0.0
-    return (pnl.mean() * periods_per_year) / (pnl.std() * np.sqrt(periods_per_year))
-
-
-def calculate_metrics(pnl_series: pd.Series) -> dict:
-    pnl = pnl_series.dropna()
-    
-    if len(pnl) == 0:
-        return {'sharpe': 0.0, 'annual_return': 0.0, 'annual_vol': 0.0, 
-                'max_drawdown': 0.0, 'days': 0}
-    
-    cum_returns = (1 + pnl).cumprod()
-    sharpe = calculate_sharpe(pnl)
-    total_return = cum_returns.iloc[-1] - 1
-    annual_return = (1 + total_return) ** (252 / len(pnl)) - 1
-    annual_vol = pnl.std() * np.sqrt(252)
-    
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    return {
-        'sharpe': float(sharpe),
-        'annual_return': float(annual_return),
-        'annual_vol': float(annual_vol),
-        'max_drawdown': float(max_dd),
-        'days': int(len(pnl))
-    }
-
-
 def main():
     parser = argparse.ArgumentParser(description='Validate final portfolio with fixed weights')
     parser.add_argument('--config', required=True, help='Path to config YAML')
@@ -161,14 +143,14 @@ def main():
     print("-"*65)
     
     for name in weights.keys():
-        is_sharpe = calculate_sharpe(pnl_dict[name].loc[is_dates])
-        oos_sharpe = calculate_sharpe(pnl_dict[name].loc[oos_dates])
+        is_sharpe = sharpe_ratio(pnl_dict[name].loc[is_dates])
+        oos_sharpe = sharpe_ratio(pnl_dict[name].loc[oos_dates])
         print(f"{name:<40} {is_sharpe:>12.3f} {oos_sharpe:>12.3f}")
     
     # Portfolio
-    is_metrics = calculate_metrics(is_portfolio)
-    oos_metrics = calculate_metrics(oos_portfolio)
-    full_metrics = calculate_metrics(full_portfolio)
+    is_metrics = metrics_summary(is_portfolio, SUMMARY_KEYS)
+    oos_metrics = metrics_summary(oos_portfolio, SUMMARY_KEYS)
+    full_metrics = metrics_summary(full_portfolio, SUMMARY_KEYS)
     
     print("-"*65)
     print(f"{'PORTFOLIO (fixed weights)':<40} {is_metrics['sharpe']:>12.3f} {oos_metrics['sharpe']:>12.3f}")
@@ -251,7 +233,7 @@ def main():
             'annual_vol': is_metrics['annual_vol'],
             'max_drawdown': is_metrics['max_drawdown'],
             'days': is_metrics['days'],
-            'sleeves': {name: calculate_sharpe(pnl_dict[name].loc[is_dates]) 
+            'sleeves': {name: sharpe_ratio(pnl_dict[name].loc[is_dates]) 
                        for name in weights.keys()}
         },
         'oos_metrics': {
@@ -260,7 +242,7 @@ def main():
             'annual_vol': oos_metrics['annual_vol'],
             'max_drawdown': oos_metrics['max_drawdown'],
             'days': oos_metrics['days'],
-            'sleeves': {name: calculate_sharpe(pnl_dict[name].loc[oos_dates]) 
+            'sleeves': {name: sharpe_ratio(pnl_dict[name].loc[oos_dates]) 
                        for name in weights.keys()}
         },
         'validation': {
@@ -9,6 +9,22 @@ import yaml
 from pathlib import Path
 import json
 from datetime import datetime
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+
+# Report key -> src.core.metrics field
+SUMMARY_KEYS = {
+    'sharpe': 'sharpe',
+    'total_return': 'total_return',
+    'ann_return': 'annual_return',
+    'ann_vol': 'annual_vol',
+    'max_drawdown': 'max_drawdown',
+    'win_rate': 'hit_rate',
+    'num_trades': 'obs',
+}
 
 def load_config(config_path):
     """Load configuration file"""
@@ -39,41 +55,6 @@ def load_component(component_config, base_path):
         pnl_col: 'pnl_gross'
     })
 
-def calculate_sharpe(returns, periods_per_year=252):
-    """Calculate annualized Sharpe ratio"""
-    if len(returns) == 0 or returns.std() == 0:
-        return 0.0
-    return (returns.mean() * periods_per_year) / (returns.std() * np.sqrt(periods_per_year))
-
-def calculate_metrics(pnl_series, label="Portfolio"):
-    """Calculate comprehensive performance metrics"""
-    returns = pnl_series
-    cum_returns = (1 + returns).cumprod()
-    
-    sharpe = calculate_sharpe(returns)
-    total_return = cum_returns.iloc[-1] - 1
-    ann_return = (1 + total_return) ** (252 / len(returns)) - 1
-    ann_vol = returns.std() * np.sqrt(252)
-    
-    # Drawdown
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    # Win rate
-    win_rate = (returns > 0).sum() / len(returns)
-    
-    return {
-        'label': label,
-        'sharpe': sharpe,
-        'total_return': total_return,
-        'ann_return': ann_return,
-        'ann_vol': ann_vol,
-        'max_drawdown': max_dd,
-        'win_rate': win_rate,
-        'num_trades': len(returns)
-    }
-
 def blend_portfolios(baseline_pnl, vc_pnl, baseline_weight, vc_weight):
     """Blend two portfolios with given weights"""
     # Align on common dates
@@ -144,7 +125,7 @@ def main():
     print("-" * 80)
     print("TEST 1: BASELINE ALONE")
     print("-" * 80)
-    baseline_metrics = calculate_metrics(baseline_pnl, "Baseline")
+    baseline_metrics = metrics_summary(baseline_pnl, SUMMARY_KEYS, "Baseline")
     all_results.append(baseline_metrics)
     print(f"Sharpe: {baseline_metrics['sharpe']:.3f}")
     print(f"Return: {baseline_metrics['total_return']:.1%}")
@@ -155,7 +136,7 @@ def main():
     print("-" * 80)
     print("TEST 2: VOLCORE ALONE")
     print("-" * 80)
-    vc_metrics = calculate_metrics(vc_pnl, "VolCore")
+    vc_metrics = metrics_summary(vc_pnl, SUMMARY_KEYS, "VolCore")
     all_results.append(vc_metrics)
     print(f"Sharpe: {vc_metrics['sharpe']:.3f}")
     print(f"Return: {vc_metrics['total_return']:.1%}")
@@ -195,7 +176,7 @@ def main():
         
         # Calculate metrics
         label = f"{name} ({baseline_wt_norm:.0%}/{vc_wt_norm:.0%})"
-        metrics = calculate_metrics(blended_pnl, label)
+        metrics = metrics_summary(blended_pnl, SUMMARY_KEYS, label)
         all_results.append(metrics)
         
         # Calculate marginal contribution
@@ -255,14 +236,14 @@ def main():
             period_vc = period_vc[period_vc.index <= end_date]
         
         # Calculate metrics for this period
-        baseline_period_metrics = calculate_metrics(period_baseline, f"Baseline {period_name}")
-        vc_period_metrics = calculate_metrics(period_vc, f"VolCore {period_name}")
+        baseline_period_metrics = metrics_summary(period_baseline, SUMMARY_KEYS, f"Baseline {period_name}")
+        vc_period_metrics = metrics_summary(period_vc, SUMMARY_KEYS, f"VolCore {period_name}")
         
         # Best allocation for this period
         best_wt = best_allocation['baseline_weight']
         vc_wt = best_allocation['vc_weight']
         period_blended = blend_portfolios(period_baseline, period_vc, best_wt, vc_wt)
-        blended_period_metrics = calculate_metrics(period_blended, f"Blended {period_name}")
+        blended_period_metrics = metrics_summary(period_blended, SUMMARY_KEYS, f"Blended {period_name}")
         
         print(f"  Baseline: {baseline_period_metrics['sharpe']:.3f} Sharpe")
         print(f"  VolCore:  {vc_period_metrics['sharpe']:.3f} Sharpe")
@@ -20,6 +20,12 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import sys
+
+# Project root on path for src.core imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_summary, sharpe_ratio
+from src.portfolio.weight_search import search_blend_weights
 
 
 def load_config(config_path: str) -> dict:
@@ -47,42 +53,6 @@ def load_sleeve(sleeve_config: dict, base_path: Path) -> pd.DataFrame:
     return result
 
 
-def calculate_sharpe(pnl_series: pd.Series, periods_per_year: int = 252) -> float:
-    """Calculate annualized Sharpe ratio"""
-    pnl = pnl_series.dropna()
-    if len(pnl) == 0 or pnl.std() == 0:
-        return 0.0
-    return (pnl.mean() * periods_per_year) / (pnl.std() * np.sqrt(periods_per_year))
-
-
-def calculate_metrics(pnl_series: pd.Series, label: str = "Portfolio") -> dict:
-    """Calculate comprehensive performance metrics"""
-    pnl = pnl_series.dropna()
-    
-    if len(pnl) == 0:
-        return {'label': label, 'sharpe': 0.0, 'annual_return': 0.0, 
-                'annual_vol': 0.0, 'max_drawdown': 0.0, 'days': 0}
-    
-    cum_returns = (1 + pnl).cumprod()
-    sharpe = calculate_sharpe(pnl)
-    total_return = cum_returns.iloc[-1] - 1
-    annual_return = (1 + total_return) ** (252 / len(pnl)) - 1
-    annual_vol = pnl.std() * np.sqrt(252)
-    
-    cum_max = cum_returns.cummax()
-    drawdown = (cum_returns - cum_max) / cum_max
-    max_dd = drawdown.min()
-    
-    return {
-        'label': label,
-        'sharpe': float(sharpe),
-        'annual_return': float(annual_return),
-        'annual_vol': float(annual_vol),
-        'max_drawdown': float(max_dd),
-        'days': int(len(pnl))
-    }
-
-
 def blend_pnls(bl_pnl: pd.Series, vc_pnl: pd.Series, bl_weight: float) -> pd.Series:
     """Blend two PnL series"""
     vc_weight = 1.0 - bl_weight
@@ -93,29 +63,20 @@ def grid_search_weights(bl_pnl: pd.Series, vc_pnl: pd.Series, step: float = 0.05
     """
     Grid search for optimal baseline weight.
     
+    Sharpe of every weight pair from the sleeve means and covariance
+    (closed form), no blended series built per weight.
+    
     Returns: (best_bl_weight, best_sharpe, all_results)
     """
-    weight_range = np.arange(0.0, 1.0 + step, step)
-    
-    best_sharpe = -np.inf
-    best_bl_weight = 0.5
-    all_results = []
-    
-    for bl_weight in weight_range:
-        blended = blend_pnls(bl_pnl, vc_pnl, bl_weight)
-        sharpe = calculate_sharpe(blended)
-        
-        all_results.append({
-            'baseline_weight': bl_weight,
-            'volcore_weight': 1.0 - bl_weight,
-            'sharpe': sharpe
-        })
-        
-        if sharpe > best_sharpe:
-            best_sharpe = sharpe
-            best_bl_weight = bl_weight
-    
-    return best_bl_weight, best_sharpe, all_results
+    weights, sharpes, best = search_blend_weights(pd.concat([bl_pnl, vc_pnl], axis=1), step=step)
+    
+    all_results = [
+        {'baseline_weight': float(bl_weight), 'volcore_weight': float(vo_weight),
+         'sharpe': float(sharpe)}
+        for (bl_weight, vo_weight), sharpe in zip(weights, sharpes)
+    ]
+    
+    return float(weights[best, 0]), float(sharpes[best]), all_results
 
 
 def main():
@@ -191,8 +152,8 @@ def main():
     print("-"*80)
     
     # Standalone IS performance
-    is_bl_sharpe = calculate_sharpe(is_bl_pnl)
-    is_vc_sharpe = calculate_sharpe(is_vc_pnl)
+    is_bl_sharpe = sharpe_ratio(is_bl_pnl)
+    is_vc_sharpe = sharpe_ratio(is_vc_pnl)
     
     print(f"IS Standalone - Baseline: {is_bl_sharpe:.3f} Sharpe")
     print(f"IS Standalone - VolCore: {is_vc_sharpe:.3f} Sharpe")
@@ -238,8 +199,8 @@ def main():
     print()
     
     # Standalone OOS performance
-    oos_bl_sharpe = calculate_sharpe(oos_bl_pnl)
-    oos_vc_sharpe = calculate_sharpe(oos_vc_pnl)
+    oos_bl_sharpe = sharpe_ratio(oos_bl_pnl)
+    oos_vc_sharpe = sharpe_ratio(oos_vc_pnl)
     
     print(f"OOS Standalone - Baseline: {oos_bl_sharpe:.3f} Sharpe")
     print(f"OOS Standalone - VolCore: {oos_vc_sharpe:.3f} Sharpe")
@@ -247,7 +208,7 @@ def main():
     
     # Apply frozen IS weights to OOS
     oos_blended = blend_pnls(oos_bl_pnl, oos_vc_pnl, best_bl_weight)
-    oos_sharpe = calculate_sharpe(oos_blended)
+    oos_sharpe = sharpe_ratio(oos_blended)
     
     print(f"OOS Weights (from IS):")
     print(f"  Baseline: {best_bl_weight:.0%}")
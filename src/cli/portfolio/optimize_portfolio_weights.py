@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Optimize Portfolio Weights - N Sleeves, IS/OOS
+===============================================
+Solves max-Sharpe, min-variance and max-diversification weights for every
+sleeve listed in the YAML `components` block (any number of sleeves).
+
+  1. IS: optimize weights under the `optimization` constraints
+  2. OOS: apply IS weights FROZEN, report Sharpe
+  3. Optional `walk_forward` block: re-fit weights on expanding/rolling
+     windows and report the stitched out-of-sample PnL
+
+Usage:
+  python optimize_portfolio_weights.py --config Config/copper/portfolio_optimizer.yaml
+"""
+
+import argparse
+import json
+import yaml
+from pathlib import Path
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import sys
+
+# Project root on path for src.* imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+from src.core.metrics import metrics_dict
+from src.portfolio.optimizer import OBJECTIVES, load_component_pnls, optimize_weights
+from src.portfolio.walk_forward import walk_forward_weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize N-sleeve portfolio weights')
+    parser.add_argument('--config', required=True, help='Path to config YAML')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("PORTFOLIO WEIGHT OPTIMIZER (N SLEEVES)")
+    print("=" * 80)
+
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+
+    base_path = Path(config.get('base_path', '.'))
+    opt_cfg = config.get('optimization', {})
+    objectives = opt_cfg.get('objectives', list(OBJECTIVES))
+    bounds = opt_cfg.get('bounds', {})
+    fixed = opt_cfg.get('fixed', {})
+
+    # ========== LOAD SLEEVES ==========
+    pnls = load_component_pnls(config['components'], base_path)
+    print(f"\nSleeves: {', '.join(pnls.columns)}")
+    print(f"Common dates: {len(pnls)} ({pnls.index.min().date()} to {pnls.index.max().date()})")
+
+    if 'is_oos_cutoff' in config:
+        is_cutoff = pd.Timestamp(config['is_oos_cutoff'])
+        is_pnls = pnls[pnls.index < is_cutoff]
+        oos_pnls = pnls[pnls.index >= is_cutoff]
+        print(f"IS: {len(is_pnls)} days, OOS: {len(oos_pnls)} days (cutoff {is_cutoff.date()})")
+    else:
+        is_pnls, oos_pnls = pnls, pnls.iloc[:0]
+
+    # ========== OPTIMIZE ON IS ==========
+    results = {}
+    for objective in objectives:
+        result = optimize_weights(is_pnls, objective=objective, bounds=bounds, fixed=fixed)
+
+        weights = pd.Series(result['weights'])
+        if len(oos_pnls) > 0:
+            result['oos'] = metrics_dict(oos_pnls.fillna(0) @ weights)
+        results[objective] = result
+
+        print(f"\n{objective}  (IS Sharpe {result['sharpe']:.3f}, "
+              f"vol {result['annual_vol']:.2%}, DR {result['diversification_ratio']:.2f}"
+              f"{'' if result['converged'] else ', NOT CONVERGED'})")
+        for name, wt in result['weights'].items():
+            print(f"  {name:<25} {wt:>7.1%}")
+        if 'oos' in result:
+            print(f"  OOS Sharpe: {result['oos']['sharpe']:.3f}")
+
+    # ========== WALK-FORWARD (OPTIONAL) ==========
+    wf_cfg = config.get('walk_forward')
+    walk_forward = {}
+    if wf_cfg:
+        print("\n" + "-" * 80)
+        print(f"WALK-FORWARD ({wf_cfg.get('window', 'expanding')}, "
+              f"refit {wf_cfg.get('refit_frequency', 'M')})")
+        print("-" * 80)
+        for objective in objectives:
+            walk_forward[objective] = walk_forward_weights(
+                pnls,
+                objective=objective,
+                window=wf_cfg.get('window', 'expanding'),
+                lookback=wf_cfg.get('lookback_days', 756),
+                refit_frequency=wf_cfg.get('refit_frequency', 'M'),
+                min_history=wf_cfg.get('min_history_days', 252),
+                bounds=bounds,
+                fixed=fixed,
+                n_jobs=wf_cfg.get('n_jobs', 1),
+            )
+            wf_metrics = metrics_dict(walk_forward[objective]['pnl'])
+            results[objective]['walk_forward'] = wf_metrics
+            print(f"  {objective:<22} {len(walk_forward[objective]['weights'])} refits, "
+                  f"stitched OOS Sharpe {wf_metrics['sharpe']:.3f}")
+    
+    # ========== SAVE ==========
+    base_outdir = Path(config.get('output_dir', 'outputs/Copper/Portfolio/WeightOptimizer'))
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    outdir = base_outdir / timestamp
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    if walk_forward:
+        for objective, wf in walk_forward.items():
+            wf['weights'].to_csv(outdir / f'weight_path_{objective}.csv')
+        pd.DataFrame({
+            objective: wf['pnl'] for objective, wf in walk_forward.items()
+        }).to_csv(outdir / 'walk_forward_pnl.csv')
+
+    with open(outdir / 'optimized_weights.json', 'w') as f:
+        json.dump({
+            'timestamp': timestamp,
+            'config': str(args.config),
+            'sleeves': list(pnls.columns),
+            'constraints': {'bounds': bounds, 'fixed': fixed},
+            'results': results,
+        }, f, indent=2)
+
+    print(f"\nSaved: {outdir / 'optimized_weights.json'}")
+
+
+if __name__ == '__main__':
+    main()
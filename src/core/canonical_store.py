@@ -0,0 +1,204 @@
+"""
+Canonical Store - Typed Parquet Dataset per Metal
+==================================================
+One columnar file per metal holding every canonical field, instead of one
+.canonical.csv per field that each build re-parses (text dates are most of
+a build's startup time).
+
+Layout:
+    Data/<metal>/pricing/canonical/canonical.parquet
+        date                      date64
+        copper_lme_3mo            float64
+        copper_lme_1mo_impliedvol float64
+        ...                       (one column per field, outer-joined on date)
+
+Readers get column projection (only the requested fields are read) and
+date-range predicate pushdown (row groups outside [start, end] are skipped).
+
+The CLIs keep their --csv-* arguments: read_canonical() takes the usual
+.canonical.csv path, serves the field from the store next to it when the
+store has it and is not older than the CSV, and falls back to the CSV
+otherwise (pyarrow not installed, a field that was never written to the
+store, or a CSV rewritten/edited after the store). The CSV may also be
+absent: the store alone is enough.
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+import datetime as dt
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: readers fall back to the CSVs
+    pa = None
+    pq = None
+
+
+STORE_FILENAME = "canonical.parquet"
+CSV_SUFFIX = ".canonical.csv"
+
+
+def canonical_value_column(field: str) -> str:
+    """
+    Value column name of a canonical series, from its field name.
+
+    - 'impliedvol' or '*_iv' → 'iv'
+    - 'volume' → 'volume'
+    - everything else → 'price'
+    """
+    field = field.lower()
+    if "impliedvol" in field or field.endswith("_iv"):
+        return "iv"
+    if "volume" in field:
+        return "volume"
+    return "price"
+
+
+def canonical_field(csv_path: Union[str, Path]) -> str:
+    """Field name of a canonical CSV path (file name without .canonical.csv)."""
+    name = Path(csv_path).name
+    return name[: -len(CSV_SUFFIX)] if name.endswith(CSV_SUFFIX) else Path(csv_path).stem
+
+
+def _require_pyarrow() -> None:
+    if pq is None:
+        raise ImportError(
+            "pyarrow is required for the canonical Parquet store "
+            "(pip install pyarrow); CSV files still work without it"
+        )
+
+
+def write_canonical_store(
+    series: Dict[str, pd.DataFrame],
+    path: Union[str, Path],
+) -> Path:
+    """
+    Write canonical series to one typed Parquet dataset.
+
+    Args:
+        series: {field: DataFrame with 'date' and one value column}, as
+            produced for the .canonical.csv files
+        path: Store file (usually <canonical dir>/canonical.parquet)
+
+    Returns:
+        Path: The written store
+    """
+    _require_pyarrow()
+
+    columns = {}
+    for field, df in series.items():
+        value_col = [c for c in df.columns if c != "date"][0]
+        columns[field] = df.set_index("date")[value_col].astype("float64")
+
+    wide = pd.DataFrame(columns).sort_index()
+
+    table = pa.table(
+        {"date": pa.array(wide.index.date, type=pa.date64()),
+         **{field: pa.array(wide[field].to_numpy(), type=pa.float64(), from_pandas=True)
+            for field in wide.columns}}
+    )
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, path, row_group_size=1024)
+    return path
+
+
+def _as_date(value) -> Optional[dt.date]:
+    return None if value is None else pd.Timestamp(value).date()
+
+
+def read_canonical_store(
+    path: Union[str, Path],
+    fields: Optional[Sequence[str]] = None,
+    start=None,
+    end=None,
+) -> pd.DataFrame:
+    """
+    Read fields from a canonical store.
+
+    Args:
+        path: Store file
+        fields: Fields to read (None = all); other columns are not read
+        start, end: Optional inclusive date range, pushed down to the
+            Parquet reader
+
+    Returns:
+        pd.DataFrame: 'date' (datetime64) plus one float64 column per field
+    """
+    _require_pyarrow()
+
+    filters = []
+    if start is not None:
+        filters.append(("date", ">=", _as_date(start)))
+    if end is not None:
+        filters.append(("date", "<=", _as_date(end)))
+
+    columns = None if fields is None else ["date", *fields]
+    table = pq.read_table(path, columns=columns, filters=filters or None)
+
+    df = table.to_pandas(date_as_object=False)
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def store_fields(path: Union[str, Path]) -> list:
+    """Fields available in a store (schema only, no data read)."""
+    _require_pyarrow()
+    return [name for name in pq.read_schema(path).names if name != "date"]
+
+
+def _store_is_current(store: Path, csv_path: Path) -> bool:
+    """Store exists and is at least as new as the CSV (if there is one)."""
+    if not store.exists():
+        return False
+    if not csv_path.exists():
+        return True
+    return store.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+
+
+def read_canonical(
+    csv_path: Union[str, Path],
+    start=None,
+    end=None,
+) -> pd.DataFrame:
+    """
+    Load one canonical series, from the store when possible.
+
+    Drop-in for pd.read_csv(csv_path, parse_dates=['date']) on a
+    .canonical.csv file: same 'date' + value column ('price' / 'iv' /
+    'volume'), same rows (dates where the series has a value). The store
+    is used only when it is not older than the CSV, so a rewritten or
+    hand-edited CSV always wins over a stale store.
+
+    Args:
+        csv_path: Path of the series' .canonical.csv
+        start, end: Optional inclusive date range
+
+    Returns:
+        pd.DataFrame: Columns ['date', <value column>], sorted by date
+    """
+    csv_path = Path(csv_path)
+    field = canonical_field(csv_path)
+    store = csv_path.parent / STORE_FILENAME
+
+    if pq is not None and _store_is_current(store, csv_path) and field in store_fields(store):
+        df = read_canonical_store(store, [field], start, end)
+        df = df.dropna(subset=[field]).reset_index(drop=True)
+        return df.rename(columns={field: canonical_value_column(field)})
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV not found (and not in {STORE_FILENAME}): {csv_path}")
+
+    df = pd.read_csv(csv_path, parse_dates=["date"])
+    if start is not None:
+        df = df[df["date"] >= pd.Timestamp(start)]
+    if end is not None:
+        df = df[df["date"] <= pd.Timestamp(end)]
+    return df.reset_index(drop=True)
@@ -9,6 +9,8 @@ ALL sleeves use this. No exceptions.
 import numpy as np
 import pandas as pd
 
+from src.core.metrics import metrics_dict
+
 
 def build_core(df: pd.DataFrame, cfg: dict) -> tuple[pd.DataFrame, dict]:
     """
@@ -80,33 +82,15 @@ def build_core(df: pd.DataFrame, cfg: dict) -> tuple[pd.DataFrame, dict]:
     df["pnl_net"] = df["pnl_gross"] + df["cost"]
 
     # ========== 9. METRICS ==========
-    pnl_net_clean = df["pnl_net"].dropna()
-    N = len(pnl_net_clean)
-
-    # Compounded return
-    cum_ret = (1 + pnl_net_clean).prod() - 1
-    annual_return = (1 + cum_ret) ** (252 / N) - 1 if N > 0 else 0.0
-
-    # Vol & Sharpe
-    annual_vol = pnl_net_clean.std(ddof=0) * np.sqrt(252) if N > 0 else 0.0
-    sharpe = (
-        (pnl_net_clean.mean() / pnl_net_clean.std(ddof=0)) * np.sqrt(252)
-        if N > 0 and pnl_net_clean.std(ddof=0) > 0
-        else 0.0
-    )
-
-    # Max drawdown
-    cum_pnl = (1 + pnl_net_clean).cumprod()
-    running_max = cum_pnl.cummax()
-    drawdown = (cum_pnl - running_max) / running_max
-    max_drawdown = drawdown.min() if N > 0 else 0.0
+    # Compounded return, population std (ddof=0), NaN bars dropped
+    m = metrics_dict(df["pnl_net"], ddof=0)
 
     metrics = {
-        "annual_return": float(annual_return),
-        "annual_vol": float(annual_vol),
-        "sharpe": float(sharpe),
-        "max_drawdown": float(max_drawdown),
-        "obs": int(N),
+        "annual_return": m["annual_return"],
+        "annual_vol": m["annual_vol"],
+        "sharpe": m["sharpe"],
+        "max_drawdown": m["max_drawdown"],
+        "obs": m["obs"],
         "cost_bps": float(one_way_bps),
     }
 
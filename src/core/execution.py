@@ -17,6 +17,8 @@ import numpy as np
 import pandas as pd
 from typing import Tuple, Dict
 
+from src.core.metrics import performance_metrics
+
 
 def execute_single_sleeve(
     positions: pd.Series,
@@ -82,6 +84,137 @@ def execute_single_sleeve(
     return result, metrics, turnover_metrics, validation
 
 
+def execute_many(
+    positions: pd.DataFrame,
+    returns: pd.Series,
+    cost_bps: float = 3.0,
+    warmup: int = 63,
+    validate: str = "sample",
+    n_validate: int = 3,
+) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame, Dict]:
+    """
+    Execute many position sets against one return series in one call.
+    
+    Same Layer 4 logic as execute_single_sleeve(), applied column-wise as
+    array operations: one trade/cost/PnL matrix, one metrics kernel call for
+    every gross and net column, and turnover statistics from column
+    reductions. Use this for portfolio blends and parameter sweeps.
+    
+    Args:
+        positions: Vol-targeted positions (dates × strategies). A 2D array
+            is accepted and gets the returns index and integer columns
+        returns: Underlying asset returns (aligned to positions' index)
+        cost_bps: One-way transaction cost in basis points
+        warmup: Leading days excluded from metrics (63 = single-sleeve)
+        validate: 'sample' (validate_execution on n_validate evenly spaced
+            columns), 'all', or 'none'
+        n_validate: Columns checked when validate='sample'
+        
+    Returns:
+        frames: Dict of DataFrames (dates × strategies): 'pos', 'trade',
+            'cost', 'pnl_gross', 'pnl_net'
+        table: One row per strategy with the calculate_metrics() and
+            calculate_turnover() fields
+        validation: Check name -> passed (on all validated columns)
+    """
+    assert validate in ("sample", "all", "none"), \
+        f"validate must be 'sample', 'all' or 'none', got {validate}"
+    
+    if not isinstance(positions, pd.DataFrame):
+        positions = pd.DataFrame(np.asarray(positions, dtype=float), index=returns.index)
+    
+    returns = returns.reindex(positions.index)
+    pos = positions.to_numpy(dtype=float)
+    ret = returns.to_numpy(dtype=float)
+    
+    # ========== STEP 1-4: TRADES, COSTS, PNL (ARRAYS) ==========
+    trade = np.nan_to_num(np.diff(pos, axis=0, prepend=np.nan), nan=0.0)
+    cost = -np.abs(trade) * (cost_bps / 10000)
+    pos_for_ret = np.vstack([np.full((1, pos.shape[1]), np.nan), pos[:-1]])
+    pnl_gross = pos_for_ret * ret[:, None]
+    pnl_net = pnl_gross + cost
+    
+    frames = {
+        name: pd.DataFrame(values, index=positions.index, columns=positions.columns)
+        for name, values in [
+            ("pos", pos), ("trade", trade), ("cost", cost),
+            ("pnl_gross", pnl_gross), ("pnl_net", pnl_net),
+        ]
+    }
+    
+    # ========== STEP 5: METRICS (ONE KERNEL CALL) ==========
+    n_cols = pos.shape[1]
+    kernel = performance_metrics(np.hstack([pnl_gross, pnl_net]), warmup=warmup)
+    gross, net = kernel[:n_cols], kernel[n_cols:]
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Sharpe = geometric annual return / vol, as in calculate_metrics()
+        gross_sharpe = np.where(
+            gross["annual_vol"] > 0, gross["annual_return"] / gross["annual_vol"], 0.0
+        )
+        net_sharpe = np.where(
+            net["annual_vol"] > 0, net["annual_return"] / net["annual_vol"], 0.0
+        )
+        
+        # ========== STEP 6: TURNOVER (COLUMN REDUCTIONS) ==========
+        abs_trade = np.abs(trade[warmup:])
+        years = len(abs_trade) / 252
+        annual_turnover = abs_trade.sum(axis=0) / years
+        n_trades = (abs_trade > 0).sum(axis=0)
+        mean_trade_size = np.where(n_trades > 0, abs_trade.sum(axis=0) / n_trades, 0.0)
+        max_trade_size = abs_trade.max(axis=0, initial=0.0)
+        total_cost = cost[warmup:].sum(axis=0)
+        gross_pnl_sum = np.nansum(pnl_gross[warmup:], axis=0)
+        cost_as_pct_gross = np.where(
+            gross_pnl_sum != 0, np.abs(total_cost / gross_pnl_sum), 0.0
+        )
+        avg_holding_days = np.where(annual_turnover > 0, 252 / annual_turnover, np.inf)
+    
+    table = pd.DataFrame({
+        # Net (primary)
+        "sharpe": net_sharpe,
+        "annual_return": net["annual_return"],
+        "annual_vol": net["annual_vol"],
+        "max_drawdown": net["max_drawdown"],
+        
+        # Gross (for comparison)
+        "gross_sharpe": gross_sharpe,
+        "gross_annual_return": gross["annual_return"],
+        
+        # Cost impact
+        "cost_drag_sharpe": gross_sharpe - net_sharpe,
+        "cost_drag_return": gross["annual_return"] - net["annual_return"],
+        "observations": net["obs"],
+        
+        # Turnover
+        "annual_turnover": annual_turnover,
+        "mean_trade_size": mean_trade_size,
+        "max_trade_size": max_trade_size,
+        "trades_per_year": n_trades / years,
+        "annual_cost": total_cost / years,
+        "cost_as_pct_gross": cost_as_pct_gross,
+        "avg_holding_days": avg_holding_days,
+    }, index=positions.columns)
+    
+    # ========== STEP 7: VALIDATE (SAMPLED) ==========
+    validation = {}
+    if validate != "none" and n_cols > 0:
+        if validate == "all":
+            checked = np.arange(n_cols)
+        else:
+            checked = np.unique(np.linspace(0, n_cols - 1, max(n_validate, 1)).astype(int))
+        
+        for j in checked:
+            column = pd.DataFrame({
+                name: frame.iloc[:, j] for name, frame in frames.items()
+            })
+            column["pos_for_ret"] = pos_for_ret[:, j]
+            for check, passed in validate_execution(column, returns).items():
+                validation[check] = validation.get(check, True) and bool(passed)
+    
+    return frames, table, validation
+
+
 def calculate_metrics(df: pd.DataFrame, expected_vol: float = 0.10) -> Dict:
     """
     Calculate performance metrics from PnL series.
@@ -95,27 +228,24 @@ def calculate_metrics(df: pd.DataFrame, expected_vol: float = 0.10) -> Dict:
     """
     
     # Remove warmup period (first 63 days)
-    df_clean = df.iloc[63:].copy()
+    df_clean = df.iloc[63:]
+    
+    # Gross and net in one kernel call (column 0 = gross, 1 = net)
+    gross, net = performance_metrics(
+        np.column_stack([df_clean["pnl_gross"], df_clean["pnl_net"]])
+    )
     
-    # Gross metrics
-    gross_cum_ret = (1 + df_clean["pnl_gross"]).cumprod() - 1
-    gross_total_ret = gross_cum_ret.iloc[-1]
-    gross_annual_ret = (1 + gross_total_ret) ** (252 / len(df_clean)) - 1
-    gross_annual_vol = df_clean["pnl_gross"].std() * np.sqrt(252)
+    # Sharpe here is geometric annual return / vol
+    gross_annual_ret = gross["annual_return"]
+    gross_annual_vol = gross["annual_vol"]
     gross_sharpe = gross_annual_ret / gross_annual_vol if gross_annual_vol > 0 else 0
     
-    # Net metrics
-    net_cum_ret = (1 + df_clean["pnl_net"]).cumprod() - 1
-    net_total_ret = net_cum_ret.iloc[-1]
-    net_annual_ret = (1 + net_total_ret) ** (252 / len(df_clean)) - 1
-    net_annual_vol = df_clean["pnl_net"].std() * np.sqrt(252)
+    net_annual_ret = net["annual_return"]
+    net_annual_vol = net["annual_vol"]
     net_sharpe = net_annual_ret / net_annual_vol if net_annual_vol > 0 else 0
     
     # Max drawdown (net)
-    cumulative = (1 + df_clean["pnl_net"]).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    max_drawdown = drawdown.min()
+    max_drawdown = net["max_drawdown"]
     
     # Cost impact
     cost_drag_sharpe = gross_sharpe - net_sharpe
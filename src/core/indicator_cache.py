@@ -0,0 +1,227 @@
+"""
+Indicator Cache - Compute Each Indicator Once Per Process
+
+One build run touches the same indicator many times: RangeFader's OHLC ADX
+is needed by the signal, the regime statistics, the regime validation and
+the optimizer; rolling/EWMA vol of copper returns is needed by several
+sleeves and by vol targeting. This module memoizes those results.
+
+Design:
+- Key = (indicator name, input fingerprints, params)
+- Fingerprint = hash of values AND index of each input series, so the same
+  data under a different date range is a different entry
+- LRU eviction under a memory budget (bytes of cached results)
+- Results are handed out as copies, so callers can mutate them freely
+
+Usage:
+    from src.core.indicator_cache import cached_indicator
+
+    adx = cached_indicator(
+        'adx_ohlc', (high, low, close), {'window': 14},
+        lambda: _compute_adx(high, low, close, 14),
+    )
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+import hashlib
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+def series_fingerprint(obj: Any) -> str:
+    """
+    Content hash of a Series / DataFrame / array (values + index).
+
+    Args:
+        obj: pd.Series, pd.DataFrame, np.ndarray or scalar
+
+    Returns:
+        str: Hex digest identifying the data
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    if isinstance(obj, (pd.Series, pd.DataFrame)):
+        h.update(type(obj).__name__.encode())
+        h.update(str(obj.shape).encode())
+        if isinstance(obj, pd.DataFrame):
+            h.update(str(list(obj.columns)).encode())
+        row_hashes = pd.util.hash_pandas_object(obj, index=True)
+        h.update(row_hashes.to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        h.update(str(arr.dtype).encode())
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+    else:
+        h.update(repr(obj).encode())
+
+    return h.hexdigest()
+
+
+def _nbytes(obj: Any) -> int:
+    """Approximate memory footprint of a cached result."""
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (tuple, list)):
+        return sum(_nbytes(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def _copy(obj: Any) -> Any:
+    """Copy a result so callers cannot mutate the cached object."""
+    if isinstance(obj, (pd.Series, pd.DataFrame, np.ndarray)):
+        return obj.copy()
+    if isinstance(obj, tuple):
+        return tuple(_copy(item) for item in obj)
+    if isinstance(obj, list):
+        return [_copy(item) for item in obj]
+    return obj
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> tuple:
+    """Order-independent, hashable form of an indicator's parameters."""
+    if not params:
+        return ()
+    return tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results with a memory budget.
+
+    Entries are keyed by (indicator, input fingerprints, params). When the
+    cached bytes exceed max_bytes the least recently used entries are
+    evicted. Results larger than the whole budget are computed but not kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(
+        self,
+        indicator: str,
+        inputs: Sequence[Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> tuple:
+        """Build the cache key for an indicator call."""
+        fingerprints = tuple(series_fingerprint(x) for x in inputs)
+        return (indicator, fingerprints, _params_key(params))
+
+    def get_or_compute(
+        self,
+        indicator: str,
+        inputs: Sequence[Any],
+        params: Optional[Dict[str, Any]],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached result for this call, computing it on a miss.
+
+        Args:
+            indicator: Indicator name (e.g. 'adx_ohlc', 'rolling_vol')
+            inputs: Input series the result depends on
+            params: Indicator parameters (window, decay, ...)
+            compute: Zero-argument function producing the result
+
+        Returns:
+            Copy of the (possibly cached) result
+        """
+        key = self.make_key(indicator, inputs, params)
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy(self._entries[key][0])
+
+        self.misses += 1
+        result = compute()
+        size = _nbytes(result)
+
+        if size <= self.max_bytes:
+            self._entries[key] = (result, size)
+            self._bytes += size
+            self._evict()
+
+        return _copy(result)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget."""
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """Change the memory budget (evicts immediately if now over)."""
+        self.max_bytes = int(max_bytes)
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Process-wide cache shared by all signal modules and CLIs
+_DEFAULT_CACHE = IndicatorCache()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Return the process-wide indicator cache."""
+    return _DEFAULT_CACHE
+
+
+def cached_indicator(
+    indicator: str,
+    inputs: Sequence[Any],
+    params: Optional[Dict[str, Any]],
+    compute: Callable[[], Any],
+) -> Any:
+    """
+    Convenience wrapper: get_or_compute() on the process-wide cache.
+
+    Args:
+        indicator: Indicator name
+        inputs: Input series the result depends on
+        params: Indicator parameters
+        compute: Zero-argument function producing the result
+
+    Returns:
+        Copy of the (possibly cached) result
+    """
+    return _DEFAULT_CACHE.get_or_compute(indicator, inputs, params, compute)
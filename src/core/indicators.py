@@ -0,0 +1,335 @@
+"""
+Shared Indicators - Volatility Estimates and Rolling Order Statistics
+
+Indicators that more than one sleeve (or a sleeve and vol targeting) needs
+for the same data. All of them go through the process-wide indicator cache,
+so within one run each (series, indicator, params) is computed once.
+
+Contents:
+- rolling_vol / ewma_variance: volatility estimates
+- moving_average_surface: many simple MAs from one cumulative sum
+- rolling_percentile_rank / rolling_quantile: order statistics over a
+  trailing window, kept in a rank-indexed Fenwick tree (O(log n) per bar)
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.indicator_cache import cached_indicator
+
+
+def rolling_vol(
+    returns: pd.Series,
+    window: int,
+    annualization: int = 252,
+    cache: bool = True,
+) -> pd.Series:
+    """
+    Rolling standard deviation of returns, annualized.
+
+    Args:
+        returns: Daily returns series
+        window: Rolling window in days
+        annualization: Periods per year (sqrt scaling)
+        cache: Memoize the result. Pass False for inputs that are unique to
+            one call (e.g. a strategy's own returns): they never hit, and
+            fingerprinting them only costs time and evicts shared entries.
+
+    Returns:
+        pd.Series: Annualized rolling vol (decimal, e.g. 0.20 = 20%)
+    """
+    def compute():
+        return returns.rolling(window=window).std() * np.sqrt(annualization)
+
+    if not cache:
+        return compute()
+    return cached_indicator(
+        'rolling_vol',
+        (returns,),
+        {'window': window, 'annualization': annualization},
+        compute,
+    )
+
+
+def ewma_variance(
+    returns: pd.Series,
+    lambda_decay: float = 0.94,
+    min_periods: int = 63,
+    cache: bool = True,
+) -> pd.Series:
+    """
+    RiskMetrics EWMA of squared returns (daily variance).
+
+    Args:
+        returns: Daily returns series
+        lambda_decay: EWMA decay factor (0.94 = RiskMetrics standard)
+        min_periods: Minimum observations before producing a value
+        cache: Memoize the result (False for call-specific inputs, see
+            rolling_vol)
+
+    Returns:
+        pd.Series: Daily EWMA variance (NaN before min_periods)
+    """
+    def compute():
+        return (
+            returns.pow(2)
+            .ewm(alpha=1-lambda_decay, min_periods=min_periods)
+            .mean()
+        )
+
+    if not cache:
+        return compute()
+    return cached_indicator(
+        'ewma_variance',
+        (returns,),
+        {'lambda_decay': lambda_decay, 'min_periods': min_periods},
+        compute,
+    )
+
+
+def moving_average_surface(
+    price: pd.Series,
+    lookbacks,
+) -> np.ndarray:
+    """
+    Simple moving averages for many windows from one cumulative sum.
+
+    Each MA is a strided difference of the same cumulative sum, so the
+    whole surface costs one pass per window over a float array instead of
+    one rolling() per window. Prices are de-meaned by their first valid
+    value before summing to keep the running sum small (agrees with
+    rolling().mean() to ~1e-12 relative).
+
+    Args:
+        price: Price series
+        lookbacks: MA windows in bars (e.g. range(5, 401))
+
+    Returns:
+        np.ndarray: Shape (n_bars, n_lookbacks). Column j is
+            price.rolling(lookbacks[j], min_periods=lookbacks[j]).mean()
+            (NaN until the window is full or while it contains a NaN)
+    """
+    lookbacks = [int(w) for w in np.atleast_1d(lookbacks)]
+
+    def compute():
+        values = price.to_numpy(dtype=float)
+        n = len(values)
+        surface = np.full((n, len(lookbacks)), np.nan)
+
+        valid = ~np.isnan(values)
+        if not valid.any():
+            return surface
+        anchor = values[valid][0]
+
+        cum_sum = np.concatenate([[0.0], np.cumsum(np.where(valid, values - anchor, 0.0))])
+        cum_nan = np.concatenate([[0], np.cumsum(~valid)])
+
+        for j, w in enumerate(lookbacks):
+            if w > n:
+                continue
+            window_sum = cum_sum[w:] - cum_sum[:-w]
+            window_nan = cum_nan[w:] - cum_nan[:-w]
+            surface[w - 1:, j] = np.where(window_nan == 0, window_sum / w + anchor, np.nan)
+
+        return surface
+
+    return cached_indicator(
+        'moving_average_surface',
+        (price,),
+        {'lookbacks': tuple(lookbacks)},
+        compute,
+    )
+
+
+# ========================================================================
+# ROLLING ORDER STATISTICS (RANK-INDEXED FENWICK TREE)
+# ========================================================================
+
+class _RankWindow:
+    """
+    Multiset of window values as counts over the series' distinct values.
+
+    A Fenwick (binary indexed) tree over value ranks gives insert, delete,
+    "how many below" and "k-th smallest" in O(log m) each, m = number of
+    distinct values in the series, regardless of the window length.
+    """
+
+    def __init__(self, distinct_values: list):
+        self.values = distinct_values
+        self.size = len(distinct_values)
+        self.tree = [0] * (self.size + 1)
+        self.counts = [0] * self.size
+        self.total = 0
+        self.top = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def add(self, rank: int, delta: int) -> None:
+        self.counts[rank] += delta
+        self.total += delta
+        i = rank + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def count_below(self, rank: int) -> int:
+        """Number of window values with a smaller rank."""
+        total = 0
+        i = rank
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def kth(self, k: int) -> float:
+        """k-th smallest window value (0-based)."""
+        pos = 0
+        remaining = k + 1
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] < remaining:
+                pos = nxt
+                remaining -= self.tree[nxt]
+            step >>= 1
+        return self.values[pos]
+
+
+def _sorted_window_scan(
+    values: np.ndarray,
+    window: int,
+    min_periods: int,
+    statistic,
+) -> np.ndarray:
+    """
+    Slide an order-statistics window along the series.
+
+    Values are replaced by their rank among the series' distinct values;
+    the window is a _RankWindow, so entering/leaving values and the
+    statistic each cost O(log m). Total O(n log m), m <= n distinct values.
+
+    Args:
+        values: 1D float array
+        window: Window length in bars
+        min_periods: Minimum non-NaN values in window to produce output
+        statistic: f(rank_window, current_rank) -> float (rank -1 = NaN)
+
+    Returns:
+        np.ndarray: Statistic per bar (NaN where fewer than min_periods)
+    """
+    values = np.asarray(values, dtype=float)
+    out = np.full(len(values), np.nan)
+
+    valid = ~np.isnan(values)
+    distinct = np.unique(values[valid])
+    ranks = np.full(len(values), -1, dtype=np.int64)
+    ranks[valid] = np.searchsorted(distinct, values[valid])
+    ranks = ranks.tolist()  # Python ints: fast scalar loop
+
+    rank_window = _RankWindow(distinct.tolist())
+    for i, rank in enumerate(ranks):
+        if rank >= 0:
+            rank_window.add(rank, 1)
+        if i >= window:
+            leaving = ranks[i - window]
+            if leaving >= 0:
+                rank_window.add(leaving, -1)
+        if rank_window.total >= min_periods:
+            out[i] = statistic(rank_window, rank)
+
+    return out
+
+
+def _percentile_rank_of(rank_window: _RankWindow, rank: int) -> float:
+    """Average-method percentile rank of the current value within the window."""
+    if rank < 0:
+        return np.nan
+    below = rank_window.count_below(rank)
+    equal = rank_window.counts[rank]
+    return (below + (equal + 1) / 2) / rank_window.total
+
+
+def rolling_percentile_rank(
+    series: pd.Series,
+    window: int,
+    min_periods: Optional[int] = None,
+) -> pd.Series:
+    """
+    Percentile rank of each value within its trailing window.
+
+    Same values as
+        series.rolling(window, min_periods).apply(
+            lambda x: pd.Series(x).rank(pct=True).iloc[-1])
+    (average rank for ties, NaNs ignored, NaN current value -> NaN), in
+    O(log n) per bar instead of a full rank per bar.
+
+    Args:
+        series: Input series (e.g. rolling vol)
+        window: Trailing window in bars (includes current bar)
+        min_periods: Minimum non-NaN values in window (default: window)
+
+    Returns:
+        pd.Series: Percentile rank in (0, 1]
+    """
+    min_periods = window if min_periods is None else min_periods
+
+    def compute():
+        ranks = _sorted_window_scan(
+            series.to_numpy(dtype=float), window, min_periods, _percentile_rank_of
+        )
+        return pd.Series(ranks, index=series.index, name=series.name)
+
+    return cached_indicator(
+        'rolling_percentile_rank',
+        (series,),
+        {'window': window, 'min_periods': min_periods},
+        compute,
+    )
+
+
+def rolling_quantile(
+    series: pd.Series,
+    window: int,
+    quantile: float,
+    min_periods: Optional[int] = None,
+) -> pd.Series:
+    """
+    Rolling quantile with linear interpolation between order statistics.
+
+    Matches series.rolling(window, min_periods).quantile(quantile).
+
+    Args:
+        series: Input series
+        window: Trailing window in bars (includes current bar)
+        quantile: Quantile in [0, 1]
+        min_periods: Minimum non-NaN values in window (default: window)
+
+    Returns:
+        pd.Series: Rolling quantile
+    """
+    assert 0 <= quantile <= 1, f"quantile must be in [0, 1], got {quantile}"
+    min_periods = window if min_periods is None else min_periods
+
+    def quantile_of(rank_window: _RankWindow, _rank: int) -> float:
+        position = quantile * (rank_window.total - 1)
+        lower = int(position)
+        if position == lower:
+            return rank_window.kth(lower)
+        low, high = rank_window.kth(lower), rank_window.kth(lower + 1)
+        return low + (high - low) * (position - lower)
+
+    def compute():
+        quantiles = _sorted_window_scan(
+            series.to_numpy(dtype=float), window, max(min_periods, 1), quantile_of
+        )
+        return pd.Series(quantiles, index=series.index, name=series.name)
+
+    return cached_indicator(
+        'rolling_quantile',
+        (series,),
+        {'window': window, 'quantile': quantile, 'min_periods': min_periods},
+        compute,
+    )
@@ -0,0 +1,194 @@
+"""
+Performance Metrics - One Kernel for Every Sleeve, Blend and Grid
+
+Annual return, vol, Sharpe, max drawdown, hit rate, turnover and cost drag
+for one PnL series or thousands of PnL columns at once. Replaces the
+per-script calculate_metrics / calculate_sharpe copies, which each made
+several pandas passes (cumprod, cummax, std, mean) per series.
+
+Conventions (shared by all callers):
+- PnL is daily simple return on capital; NaN bars are skipped (dropna)
+- annual_return is geometric (CAGR from compounded PnL)
+- mean_return is arithmetic (mean × 252)
+- sharpe = mean / std × sqrt(252), 0 when std is 0
+- max_drawdown on the compounded equity curve (negative number)
+
+Usage:
+    from src.core.metrics import performance_metrics, metrics_dict
+
+    table = performance_metrics(pnl_matrix)      # one record per column
+    best = table['sharpe'].argmax()
+    summary = metrics_dict(pnl_series)           # plain floats for JSON
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+METRIC_FIELDS = [
+    ('obs', np.int64),
+    ('total_return', np.float64),
+    ('annual_return', np.float64),
+    ('mean_return', np.float64),
+    ('annual_vol', np.float64),
+    ('sharpe', np.float64),
+    ('max_drawdown', np.float64),
+    ('hit_rate', np.float64),
+    ('annual_turnover', np.float64),
+    ('cost_drag', np.float64),
+]
+
+METRICS_DTYPE = np.dtype(METRIC_FIELDS)
+
+
+def performance_metrics(
+    pnl,
+    positions=None,
+    cost_bps: float = 0.0,
+    warmup: int = 0,
+    ddof: int = 1,
+    periods_per_year: int = 252,
+) -> np.ndarray:
+    """
+    Performance metrics for every PnL column in one vectorized call.
+
+    All statistics come from the same float matrix (NaNs zero-filled once,
+    masked counts reused), with no intermediate Series, so a grid of
+    thousands of candidates costs a handful of array reductions.
+
+    Args:
+        pnl: Daily PnL, 1D (one series) or 2D (bars × columns); Series and
+            DataFrames are accepted
+        positions: Optional positions, same shape as pnl (or 1D, shared by
+            all columns). Enables annual_turnover and cost_drag
+        cost_bps: One-way cost in basis points, for cost_drag
+        warmup: Leading bars to drop before measuring. Trades are taken
+            before the cut, so the first measured bar counts its trade
+        ddof: Degrees of freedom for the std (1 = pandas, 0 = population)
+        periods_per_year: Annualization factor
+
+    Returns:
+        np.ndarray: Structured array of METRICS_DTYPE, one record per column
+            (length 1 for 1D input). pd.DataFrame(result) gives a table.
+            Columns with no observations are all zeros.
+    """
+    x = np.asarray(pnl, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    x = x[warmup:]
+    n_bars, n_cols = x.shape
+
+    result = np.zeros(n_cols, dtype=METRICS_DTYPE)
+
+    # ========== MOMENTS ==========
+    valid = ~np.isnan(x)
+    filled = np.where(valid, x, 0.0)
+    n = valid.sum(axis=0)
+    has_obs = n > 0
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=0) / n
+        dev = np.where(valid, x - mean, 0.0)
+        std = np.sqrt((dev * dev).sum(axis=0) / (n - ddof))
+
+        # ========== COMPOUNDING & DRAWDOWN ==========
+        # NaN bars contribute a growth factor of 1 (same as dropna)
+        if n_bars > 0:
+            equity = np.cumprod(1 + filled, axis=0)
+            peak = np.maximum.accumulate(equity, axis=0)
+            max_drawdown = ((equity - peak) / peak).min(axis=0)
+            total_return = equity[-1] - 1
+        else:
+            max_drawdown = total_return = np.zeros(n_cols)
+        annual_return = (1 + total_return) ** (periods_per_year / n) - 1
+
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+        hit_rate = (filled > 0).sum(axis=0) / n
+
+    result['obs'] = n
+    result['total_return'] = np.where(has_obs, total_return, 0.0)
+    result['annual_return'] = np.where(has_obs, annual_return, 0.0)
+    result['mean_return'] = np.where(has_obs, mean * periods_per_year, 0.0)
+    result['annual_vol'] = np.where(has_obs, std * np.sqrt(periods_per_year), 0.0)
+    result['sharpe'] = np.where(has_obs, sharpe, 0.0)
+    result['max_drawdown'] = np.where(has_obs, max_drawdown, 0.0)
+    result['hit_rate'] = np.where(has_obs, hit_rate, 0.0)
+
+    # ========== TURNOVER & COST DRAG ==========
+    if positions is not None:
+        pos = np.asarray(positions, dtype=float)
+        if pos.ndim == 1:
+            pos = pos[:, None]
+        trades = np.abs(np.diff(pos, axis=0, prepend=np.nan))
+        trades = np.nan_to_num(trades, nan=0.0)[warmup:]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            annual_turnover = trades.sum(axis=0) / (n / periods_per_year)
+        annual_turnover = np.where(has_obs, annual_turnover, 0.0)
+        result['annual_turnover'] = annual_turnover
+        result['cost_drag'] = annual_turnover * cost_bps / 10000
+
+    return result
+
+
+def metrics_dict(
+    pnl: pd.Series,
+    positions: Optional[pd.Series] = None,
+    **kwargs
+) -> Dict:
+    """
+    performance_metrics() for a single series, as plain Python numbers.
+
+    Args:
+        pnl: Daily PnL series
+        positions: Optional positions (for turnover / cost drag)
+        **kwargs: Passed to performance_metrics()
+
+    Returns:
+        Dict: {field: float, 'obs': int}
+    """
+    record = performance_metrics(pnl, positions, **kwargs)[0]
+    return {
+        name: (int(record[name]) if name == 'obs' else float(record[name]))
+        for name in METRICS_DTYPE.names
+    }
+
+
+def sharpe_ratio(pnl: pd.Series, periods_per_year: int = 252) -> float:
+    """
+    Annualized Sharpe of one PnL series (NaN bars skipped).
+
+    Args:
+        pnl: Daily PnL series
+        periods_per_year: Annualization factor
+
+    Returns:
+        float: mean / std × sqrt(periods_per_year), 0 when std is 0
+    """
+    return float(performance_metrics(pnl, periods_per_year=periods_per_year)['sharpe'][0])
+
+
+def metrics_summary(
+    pnl: pd.Series,
+    keys: Dict[str, str],
+    label: Optional[str] = None,
+) -> Dict:
+    """
+    metrics_dict() under a caller's own key names (for JSON reports).
+
+    Args:
+        pnl: Daily PnL series
+        keys: {output key: metric field}, e.g. {'days': 'obs'}
+        label: Optional 'label' entry, placed first
+
+    Returns:
+        Dict: {'label': label (if given), output key: value, ...}
+    """
+    m = metrics_dict(pnl)
+    summary = {} if label is None else {'label': label}
+    summary.update({key: m[field] for key, field in keys.items()})
+    return summary
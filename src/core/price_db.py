@@ -0,0 +1,182 @@
+"""
+Price DB - Wide-Panel Queries over the SQLite prices_close Table
+=================================================================
+prices_close is stored long (date, asset, close) with PRIMARY KEY (date,
+asset), which is the wrong order for "these assets over this date range":
+every consumer ended up reading the whole table and pivoting it.
+
+This module adds:
+- A covering index on (asset, date, close), so a per-asset range query is
+  an index range scan that never touches the table rows (created by
+  load_excel_to_db.py)
+- Parameterized queries (asset list and date bounds bound as parameters)
+- One reusable connection per PriceDB, for many queries per process
+- Alignment straight into a wide NumPy array / DataFrame (dates x assets)
+
+Usage:
+    with PriceDB("quant.db") as db:
+        panel = db.panel(["copper_lme_3mo", "copper_lme_3mo_volume"],
+                         start="2010-01-01")
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+TABLE = "prices_close"
+
+CREATE_TABLE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {TABLE} (
+        date  TEXT NOT NULL,
+        asset TEXT NOT NULL,
+        close REAL,
+        PRIMARY KEY (date, asset)
+    )
+"""
+
+# Covering: (asset, date) range scans return close from the index itself
+CREATE_INDEX_SQL = f"""
+    CREATE INDEX IF NOT EXISTS idx_{TABLE}_asset_date
+    ON {TABLE} (asset, date, close)
+"""
+
+
+def _date_text(value) -> Optional[str]:
+    """Date bound as stored in the table ('YYYY-MM-DD')."""
+    return None if value is None else pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def _asset_key(asset: str) -> str:
+    """Asset name as stored by load_excel_to_db.py (stripped, lower-case)."""
+    return str(asset).strip().lower()
+
+
+class PriceDB:
+    """
+    Reusable read connection to a prices_close database.
+
+    Args:
+        db_path: SQLite file
+        create_index: Create the covering (asset, date) index if missing.
+            The loader already creates it, so this is only for databases
+            written by other tools (needs write access).
+    """
+
+    def __init__(self, db_path: Union[str, Path], create_index: bool = False):
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Database not found: {self.db_path}")
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        if create_index:
+            with self.conn:
+                self.conn.execute(CREATE_INDEX_SQL)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "PriceDB":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ========== METADATA ==========
+
+    def assets(self) -> List[str]:
+        """All assets in the table (distinct, from the index)."""
+        rows = self.conn.execute(
+            f"SELECT DISTINCT asset FROM {TABLE} ORDER BY asset"
+        ).fetchall()
+        return [asset for (asset,) in rows]
+
+    def date_range(self, asset: str) -> Tuple[Optional[str], Optional[str]]:
+        """First and last stored date of one asset."""
+        return self.conn.execute(
+            f"SELECT MIN(date), MAX(date) FROM {TABLE} WHERE asset = ?",
+            (_asset_key(asset),),
+        ).fetchone()
+
+    # ========== QUERIES ==========
+
+    def _fetch(self, assets: Sequence[str], start, end) -> list:
+        clauses = [f"asset IN ({', '.join('?' * len(assets))})"]
+        params = list(assets)
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(_date_text(start))
+        if end is not None:
+            clauses.append("date <= ?")
+            params.append(_date_text(end))
+
+        sql = f"SELECT date, asset, close FROM {TABLE} WHERE {' AND '.join(clauses)}"
+        return self.conn.execute(sql, params).fetchall()
+
+    def panel_array(
+        self,
+        assets: Sequence[str],
+        start=None,
+        end=None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aligned wide panel as NumPy arrays.
+
+        Args:
+            assets: Assets to read (unique), in output column order; matched
+                case-insensitively, as the loader lower-cases names
+            start, end: Optional inclusive date bounds
+
+        Returns:
+            dates: Sorted union of the assets' dates, datetime64[ns]
+            values: Shape (n_dates, n_assets), NaN where an asset has no row
+        """
+        keys = [_asset_key(a) for a in assets]
+        assert len(keys) > 0, "assets must not be empty"
+        duplicates = sorted({k for k in keys if keys.count(k) > 1})
+        assert not duplicates, f"assets must be unique, got duplicates: {duplicates}"
+        rows = self._fetch(keys, start, end)
+
+        if not rows:
+            return np.array([], dtype="M8[ns]"), np.empty((0, len(keys)))
+
+        row_dates, row_assets, row_close = zip(*rows)
+        unique_dates, date_pos = np.unique(np.array(row_dates), return_inverse=True)
+        column = {key: i for i, key in enumerate(keys)}
+        asset_pos = np.fromiter((column[a] for a in row_assets), dtype=np.intp, count=len(rows))
+
+        values = np.full((len(unique_dates), len(keys)), np.nan)
+        values[date_pos, asset_pos] = np.array(row_close, dtype=float)
+        return unique_dates.astype("M8[ns]"), values
+
+    def panel(
+        self,
+        assets: Sequence[str],
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        """
+        Aligned wide panel: DatetimeIndex 'date' x one column per asset.
+
+        Args:
+            assets: Assets to read, in output column order (names kept as
+                given; matched case-insensitively)
+            start, end: Optional inclusive date bounds
+
+        Returns:
+            pd.DataFrame: close per asset, NaN where an asset has no row
+        """
+        dates, values = self.panel_array(assets, start, end)
+        return pd.DataFrame(
+            values, index=pd.DatetimeIndex(dates, name="date"), columns=list(assets)
+        )
+
+    def series(self, asset: str, start=None, end=None) -> pd.Series:
+        """One asset's close as a date-indexed Series."""
+        return self.panel([asset], start, end)[asset].dropna()
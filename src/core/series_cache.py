@@ -0,0 +1,247 @@
+"""
+Series Cache - Memory-Mapped Binary Copies of Canonical Series
+===============================================================
+Sweeps re-read the same price history on every run and in every worker
+process. This cache keeps a binary copy next to each canonical series:
+
+    copper_lme_3mo.canonical.csv              (source, unchanged)
+    copper_lme_3mo.canonical.json             header: field, value column,
+                                              rows, date range, source
+                                              fingerprint, data file name
+    copper_lme_3mo.canonical.<token>.npy      structured array:
+                                              date (M8[ns]), value (f8)
+
+The .npy is opened with np.load(mmap_mode='r'): opening costs no parsing,
+and the OS page cache holds one physical copy for every process that maps
+it. The sharing lasts only as far as the consumer keeps views of the mapped
+arrays: open_series_cache() and load_panel() (when the series share their
+dates) hand out views; anything that builds new frames from them copies.
+
+Refreshes never overwrite a data file. Each rebuild writes a new
+<token>.npy and then atomically replaces the small header that names it,
+so a reader always gets a header and the data it describes, and a file
+still mapped by a running sweep is never replaced (Windows refuses that).
+If the header cannot be replaced (e.g. held open on Windows), the call
+falls back to the freshly read data in memory. Superseded .npy files are
+removed once nothing maps them.
+
+The header fingerprints the source files (size + mtime of the CSV and of
+the canonical.parquet store). When the source changes the cache is rebuilt
+on next open.
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.core.canonical_store import (
+    CSV_SUFFIX,
+    STORE_FILENAME,
+    canonical_field,
+    canonical_value_column,
+    read_canonical,
+)
+
+
+CACHE_DTYPE = np.dtype([('date', 'M8[ns]'), ('value', 'f8')])
+CACHE_VERSION = 2
+
+
+def _cache_stem(csv_path: Path) -> str:
+    return canonical_field(csv_path) + CSV_SUFFIX[:-len('.csv')]
+
+
+def cache_header_path(csv_path: Union[str, Path]) -> Path:
+    """Header (.json) path of a canonical CSV's cache."""
+    csv_path = Path(csv_path)
+    return csv_path.with_name(_cache_stem(csv_path) + '.json')
+
+
+def _source_fingerprint(csv_path: Path) -> Dict[str, list]:
+    """Size and mtime of every file a canonical read can come from."""
+    fingerprint = {}
+    for source in (csv_path, csv_path.parent / STORE_FILENAME):
+        if source.exists():
+            stat = source.stat()
+            fingerprint[source.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _read_records(csv_path: Path) -> Tuple[np.ndarray, dict]:
+    """Canonical series as cache records plus its header (no file written)."""
+    df = read_canonical(csv_path)
+    value_col = [c for c in df.columns if c != 'date'][0]
+
+    records = np.empty(len(df), dtype=CACHE_DTYPE)
+    records['date'] = df['date'].to_numpy(dtype='M8[ns]')
+    records['value'] = df[value_col].to_numpy(dtype='f8')
+
+    header = {
+        'version': CACHE_VERSION,
+        'field': canonical_field(csv_path),
+        'value_column': value_col,
+        'rows': len(records),
+        'start': str(df['date'].min().date()) if len(df) else None,
+        'end': str(df['date'].max().date()) if len(df) else None,
+        'source': _source_fingerprint(csv_path),
+    }
+    return records, header
+
+
+def _remove_stale_data(csv_path: Path, keep: str) -> None:
+    """Delete superseded .npy versions; ones still mapped elsewhere stay."""
+    for old in csv_path.parent.glob(_cache_stem(csv_path) + '.*.npy'):
+        if old.name != keep:
+            try:
+                old.unlink()
+            except OSError:
+                pass  # Mapped by a running process (Windows); next rebuild
+
+
+def write_series_cache(csv_path: Union[str, Path]) -> Tuple[np.ndarray, dict]:
+    """
+    Build the binary cache of one canonical series.
+
+    Args:
+        csv_path: Path of the series' .canonical.csv
+
+    Returns:
+        records: The series as CACHE_DTYPE records (in memory)
+        header: The header that now names the written data file
+
+    Raises:
+        OSError: The header could not be replaced (the data file was written)
+    """
+    csv_path = Path(csv_path)
+    records, header = _read_records(csv_path)
+
+    # New data file per rebuild: never replaces a file another process maps
+    token = f'{time.time_ns():x}{os.getpid():x}'
+    data_path = csv_path.with_name(f'{_cache_stem(csv_path)}.{token}.npy')
+    with open(data_path, 'wb') as f:
+        np.save(f, records)
+    header['data_file'] = data_path.name
+
+    # Header swap is the commit point: readers see old or new pair, never mixed
+    header_path = cache_header_path(csv_path)
+    tmp_header = header_path.with_name(f'{header_path.name}.{token}.tmp')
+    with open(tmp_header, 'w') as f:
+        json.dump(header, f, indent=2)
+    try:
+        os.replace(tmp_header, header_path)
+    except OSError:
+        tmp_header.unlink()
+        data_path.unlink()
+        raise
+
+    _remove_stale_data(csv_path, keep=data_path.name)
+    return records, header
+
+
+def _current_header(csv_path: Path) -> Optional[dict]:
+    """Header if the cache is up to date with its sources, else None."""
+    try:
+        with open(cache_header_path(csv_path), 'r') as f:
+            header = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        header.get('version') != CACHE_VERSION
+        or header.get('source') != _source_fingerprint(csv_path)
+        or not (csv_path.parent / header['data_file']).exists()
+    ):
+        return None
+    return header
+
+
+def open_series_cache(
+    csv_path: Union[str, Path],
+) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    Memory-map one canonical series, (re)building its cache if needed.
+
+    Args:
+        csv_path: Path of the series' .canonical.csv
+
+    Returns:
+        dates: Read-only datetime64[ns] view into the mapped file
+        values: Read-only float64 view into the mapped file
+        header: Cache header (field, value_column, rows, start, end, source)
+        (If the cache cannot be refreshed, dates/values are in-memory
+        arrays read from the source instead.)
+    """
+    csv_path = Path(csv_path)
+    header = _current_header(csv_path)
+
+    if header is None:
+        try:
+            records, header = write_series_cache(csv_path)
+        except OSError:
+            records, header = _read_records(csv_path)
+        return records['date'], records['value'], header
+
+    try:
+        records = np.load(csv_path.parent / header['data_file'], mmap_mode='r')
+    except OSError:
+        # Superseded and removed between reading the header and mapping it
+        records, header = _read_records(csv_path)
+    return records['date'], records['value'], header
+
+
+def load_series(csv_path: Union[str, Path]) -> pd.Series:
+    """
+    Canonical series as a date-indexed pd.Series over the mapped values.
+
+    Same data as read_canonical(csv_path).set_index('date')[value column].
+    The values are a read-only view of the mapped file (the index is
+    built in memory); treat the result as read-only.
+
+    Args:
+        csv_path: Path of the series' .canonical.csv
+
+    Returns:
+        pd.Series: Named after the value column ('price' / 'iv' / 'volume')
+    """
+    dates, values, header = open_series_cache(csv_path)
+    index = pd.DatetimeIndex(dates, name='date')
+    value_col = header.get('value_column', canonical_value_column(header['field']))
+    return pd.Series(values, index=index, name=value_col, copy=False)
+
+
+def load_panel(csv_paths: Dict[str, Union[str, Path]]) -> pd.DataFrame:
+    """
+    Several canonical series as one date-aligned frame.
+
+    When every series has the same dates (e.g. close/high/low from one
+    sheet), the columns are read-only views of the mapped files: no copy.
+    Otherwise the series are inner-joined on date, which copies.
+
+    Args:
+        csv_paths: {column name: path of the series' .canonical.csv}
+
+    Returns:
+        pd.DataFrame: One column per series, DatetimeIndex 'date', only
+            dates where every series has a value
+    """
+    opened = {name: open_series_cache(path) for name, path in csv_paths.items()}
+    first_dates = next(iter(opened.values()))[0]
+
+    if all(np.array_equal(dates, first_dates) for dates, _, _ in opened.values()):
+        return pd.DataFrame(
+            {name: values for name, (_, values, _) in opened.items()},
+            index=pd.DatetimeIndex(first_dates, name='date'),
+            copy=False,
+        )
+
+    return pd.DataFrame({
+        name: pd.Series(values, index=pd.DatetimeIndex(dates, name='date'))
+        for name, (dates, values, _) in opened.items()
+    }).dropna()
@@ -0,0 +1,343 @@
+"""
+Position State Machines - Array Kernels for Layer 1 Signals
+
+Reusable NumPy kernels for the entry/exit/flip position logic that the
+sleeves previously ran as per-bar Python loops with .iloc lookups.
+
+Every kernel here:
+- Takes plain arrays (z-scores, regime masks) and returns an int8 position
+  array in {-1, 0, +1}
+- Reproduces the bar-by-bar loop of the sleeve it replaces exactly
+- Runs in O(n) vectorized passes for well-formed thresholds, so parameter
+  grids and intraday histories stay cheap
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+import numpy as np
+
+
+def _last_true_index(mask: np.ndarray) -> np.ndarray:
+    """
+    For each bar, index of the most recent bar (inclusive) where mask is True.
+
+    Works along the last axis. Returns -1 where there is none.
+    """
+    idx = np.where(mask, np.arange(mask.shape[-1]), -1)
+    return np.maximum.accumulate(idx, axis=-1) if idx.size > 0 else idx
+
+
+def hysteresis_positions_batch(
+    zscore: np.ndarray,
+    active: np.ndarray,
+    entries,
+    exits,
+    start: int = 0,
+) -> np.ndarray:
+    """
+    Mean reversion entry/exit/flip state machine (RangeFader logic),
+    evaluated for many (entry, exit) pairs in one call.
+
+    State Machine (evaluated on each bar from `start`):
+        ANY   → FLAT  (when regime mask is False)
+        ANY   → SHORT (when z > +entry; FLAT entry or LONG flip)
+        ANY   → LONG  (when z < -entry; FLAT entry or SHORT flip)
+        LONG  → FLAT  (when z > -exit)
+        SHORT → FLAT  (when z < +exit)
+        Bars with NaN z-score are skipped: position 0, state carried over.
+
+    Vectorization:
+        Entries and regime resets are "events" that set the state outright.
+        Between events a LONG survives only while z <= -exit (SHORT while
+        z >= +exit), so the state on any bar is the last event's direction
+        if no exit has occurred since, which is two running-max scans over a
+        (pairs × bars) matrix.
+        This needs exit <= entry (exit band inside entry band). A wider exit
+        band makes entries state-dependent, so those pairs fall back to an
+        array loop with identical results.
+
+    Args:
+        zscore: Z-score array (NaN during warmup)
+        active: Regime mask (True = allowed to trade, e.g. ADX < threshold)
+        entries: Z-score magnitudes to enter / flip (scalar or one per pair)
+        exits: Z-score magnitudes to exit back to flat (scalar or one per pair)
+        start: First bar the state machine evaluates (earlier bars are flat)
+
+    Returns:
+        np.ndarray: int8 positions of shape (n_bars, n_pairs)
+    """
+    z = np.asarray(zscore, dtype=float)
+    active = np.asarray(active, dtype=bool)
+    entries, exits = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(entries, dtype=float)),
+        np.atleast_1d(np.asarray(exits, dtype=float)),
+    )
+    n = len(z)
+    positions = np.zeros((n, len(entries)), dtype=np.int8)
+
+    # Bars the loop actually evaluates (NaN z leaves state untouched)
+    evaluated = np.flatnonzero(~np.isnan(z[start:])) + start
+    if len(evaluated) == 0 or len(entries) == 0:
+        return positions
+
+    zv = z[evaluated][None, :]
+    av = active[evaluated][None, :]
+    entry = entries[:, None]
+    exit = exits[:, None]
+
+    # ========== EVENTS: SET STATE OUTRIGHT ==========
+    reset = ~av
+    enter_short = av & (zv > entry)
+    enter_long = av & (zv < -entry) & ~enter_short
+    event = reset | enter_short | enter_long
+
+    event_value = enter_long.astype(np.int8) - enter_short.astype(np.int8)
+
+    last_event = _last_true_index(event)
+    state = np.where(
+        last_event >= 0,
+        np.take_along_axis(event_value, np.maximum(last_event, 0), axis=-1),
+        0,
+    )
+
+    # ========== EXITS: BREAK A HELD STATE ==========
+    # Non-event bars that fail the hold condition send LONG/SHORT to FLAT
+    exit_long = ~event & (zv > -exit)
+    exit_short = ~event & (zv < exit)
+
+    state = np.where((state == 1) & (_last_true_index(exit_long) > last_event), 0, state)
+    state = np.where((state == -1) & (_last_true_index(exit_short) > last_event), 0, state)
+
+    # Wide exit bands: replay the bar-by-bar machine for those pairs only
+    for p in np.flatnonzero(exits > entries):
+        state[p] = _hysteresis_loop(zv[0], av[0], entries[p], exits[p])
+
+    positions[evaluated] = state.T
+    return positions
+
+
+def hysteresis_positions(
+    zscore: np.ndarray,
+    active: np.ndarray,
+    entry: float,
+    exit: float,
+    start: int = 0,
+) -> np.ndarray:
+    """
+    Single-pair version of hysteresis_positions_batch().
+
+    Returns:
+        np.ndarray: int8 positions in {-1, 0, +1}, same length as zscore
+    """
+    return hysteresis_positions_batch(zscore, active, entry, exit, start=start)[:, 0]
+
+
+def _hysteresis_loop(
+    z: np.ndarray,
+    active: np.ndarray,
+    entry: float,
+    exit: float,
+) -> np.ndarray:
+    """Reference bar-by-bar state machine over pre-filtered (non-NaN) bars."""
+    state = np.zeros(len(z), dtype=np.int8)
+    current = 0
+    for i in range(len(z)):
+        if not active[i]:
+            current = 0
+        elif current == 0:
+            if z[i] > entry:
+                current = -1
+            elif z[i] < -entry:
+                current = 1
+        elif current == 1:
+            if z[i] > entry:
+                current = -1
+            elif z[i] > -exit:
+                current = 0
+        else:
+            if z[i] < -entry:
+                current = 1
+            elif z[i] < exit:
+                current = 0
+        state[i] = current
+    return state
+
+
+def hold_on_schedule(
+    positions: np.ndarray,
+    update_frequency: int,
+    warmup: int = 0,
+) -> np.ndarray:
+    """
+    Only let positions change every `update_frequency` bars.
+
+    Bar i takes a fresh position when i % update_frequency == 0 or i < warmup,
+    otherwise it repeats the last refreshed position.
+
+    Args:
+        positions: Raw position array
+        update_frequency: Bars between updates (1 = daily, no-op)
+        warmup: Bars that always refresh (signal warmup period)
+
+    Returns:
+        np.ndarray: Held positions, same dtype as input
+    """
+    positions = np.asarray(positions)
+    if update_frequency <= 1:
+        return positions
+
+    bars = np.arange(len(positions))
+    refresh = (bars % update_frequency == 0) | (bars < warmup)
+    last_refresh = _last_true_index(refresh)
+
+    held = np.zeros_like(positions)
+    has_refresh = last_refresh >= 0
+    held[has_refresh] = positions[last_refresh[has_refresh]]
+    return held
+
+
+def _next_true_index(mask: np.ndarray) -> np.ndarray:
+    """
+    For each bar, index of the next bar (inclusive) where mask is True.
+
+    Works along the last axis. Returns mask.shape[-1] where there is none.
+    """
+    m = mask.shape[-1]
+    idx = np.where(mask, np.arange(m), m)
+    return np.minimum.accumulate(idx[..., ::-1], axis=-1)[..., ::-1]
+
+
+def min_hold_positions_batch(
+    signal: np.ndarray,
+    thresholds: np.ndarray,
+    min_hold_days=0,
+    longs_only: bool = False,
+    shorts_only: bool = False,
+) -> np.ndarray:
+    """
+    Hysteresis state machine with minimum holding period (VolCore logic),
+    evaluated for many threshold tuples in one call.
+
+    State Machine (per bar, using that bar's decision signal):
+        FLAT  → SHORT (signal > short_entry, unless longs_only)
+        FLAT  → LONG  (signal < long_entry, unless shorts_only)
+        LONG  → FLAT  (held >= min_hold_days and signal > long_exit)
+        LONG  → SHORT (held >= min_hold_days and signal > short_entry)
+        SHORT → FLAT  (held >= min_hold_days and signal < short_exit)
+        SHORT → LONG  (held >= min_hold_days and signal < long_entry)
+        NaN signal: position carried, holding clock does not advance.
+
+    Vectorization:
+        The comparisons for every tuple are one broadcast over a
+        (tuples × bars) matrix, and "next bar where the condition fires"
+        comes from a reversed running-min scan. The remaining loop jumps
+        straight from one position change to the next (entry → earliest
+        eligible exit), so it costs O(trades), not O(bars).
+
+    Args:
+        signal: Decision signal per bar, already lagged for no forward bias
+            (e.g. z-score of T-1 used for the T position)
+        thresholds: Array of shape (n_tuples, 4) with columns
+            (short_entry, long_entry, short_exit, long_exit)
+        min_hold_days: Minimum days held before exit/flip (scalar or one
+            value per tuple)
+        longs_only: If True, never go short
+        shorts_only: If True, never go long
+
+    Returns:
+        np.ndarray: int8 positions of shape (n_bars, n_tuples)
+    """
+    s = np.asarray(signal, dtype=float)
+    thresholds = np.atleast_2d(np.asarray(thresholds, dtype=float))
+    n = len(s)
+    n_tuples = thresholds.shape[0]
+    min_hold = np.broadcast_to(np.asarray(min_hold_days, dtype=int), (n_tuples,))
+    positions = np.zeros((n, n_tuples), dtype=np.int8)
+
+    # Only bars with a signal can change state
+    bars = np.flatnonzero(~np.isnan(s))
+    m = len(bars)
+    if m == 0 or n_tuples == 0:
+        return positions
+
+    sv = s[bars][None, :]
+    short_entry, long_entry, short_exit, long_exit = (
+        thresholds[:, [c]] for c in range(4)
+    )
+
+    # ========== CONDITION MATRICES (tuples × signal bars) ==========
+    go_short = (sv > short_entry) & (not longs_only)
+    go_long = (sv < long_entry) & (not shorts_only)
+    leave_long = (sv > long_exit) | go_short
+    leave_short = (sv < short_exit) | go_long
+
+    next_entry = _next_true_index(go_short | go_long)
+    next_leave_long = _next_true_index(leave_long)
+    next_leave_short = _next_true_index(leave_short)
+
+    # ========== JUMP BETWEEN POSITION CHANGES ==========
+    for t in range(n_tuples):
+        hold = max(int(min_hold[t]), 1)
+        changes = np.zeros(m, dtype=bool)
+        values = np.zeros(m, dtype=np.int8)
+
+        k, state = 0, 0
+        while k < m:
+            if state == 0:
+                j = next_entry[t, k]
+                if j >= m:
+                    break
+                state = -1 if go_short[t, j] else 1
+            elif state == 1:
+                j = next_leave_long[t, k]
+                if j >= m:
+                    break
+                state = -1 if go_short[t, j] else 0
+            else:
+                j = next_leave_short[t, k]
+                if j >= m:
+                    break
+                state = 1 if go_long[t, j] else 0
+
+            changes[j] = True
+            values[j] = state
+            # Fresh entries/flips restart the holding clock
+            k = j + hold if state != 0 else j + 1
+
+        last_change = _last_true_index(changes)
+        state_at_bar = np.where(last_change >= 0, values[np.maximum(last_change, 0)], 0)
+        positions[bars, t] = state_at_bar
+
+    # NaN-signal bars carry the previous position
+    carried = _last_true_index(~np.isnan(s))
+    has_prev = carried >= 0
+    positions[has_prev] = positions[carried[has_prev]]
+
+    return positions
+
+
+def min_hold_positions(
+    signal: np.ndarray,
+    short_entry: float,
+    long_entry: float,
+    short_exit: float,
+    long_exit: float,
+    min_hold_days: int = 0,
+    longs_only: bool = False,
+    shorts_only: bool = False,
+) -> np.ndarray:
+    """
+    Single-tuple version of min_hold_positions_batch().
+
+    Returns:
+        np.ndarray: int8 positions in {-1, 0, +1}, same length as signal
+    """
+    thresholds = [[short_entry, long_entry, short_exit, long_exit]]
+    return min_hold_positions_batch(
+        signal,
+        thresholds,
+        min_hold_days=min_hold_days,
+        longs_only=longs_only,
+        shorts_only=shorts_only,
+    )[:, 0]
@@ -10,7 +10,8 @@ Enhanced classification logic now considers BOTH % active AND max flat streak.
 This fixes TrendImpulse V5 misclassification (90% active, 8-day gaps).
 
 Methodology:
-- EWMA vol estimation (λ=0.94, RiskMetrics 1996 standard)
+- EWMA vol estimation (λ=0.94, RiskMetrics 1996 standard) by default;
+  Parkinson / Garman-Klass / Yang-Zhang range estimators via vol_estimator
 - Conservative floors/caps to prevent extreme leverage
 - Two modes: strategy-level vol (always-on) vs underlying vol × exposure (sparse)
 - Fully backward-looking (no forward bias)
@@ -19,9 +20,82 @@ Author: Systematic Trading Team
 Date: November 2025
 """
 
+import heapq
+
 import numpy as np
 import pandas as pd
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
+
+from src.core.indicators import ewma_variance
+
+
+def run_length_encode(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run-length encode a boolean array in one vectorized pass.
+    
+    Args:
+        mask: Boolean array
+        
+    Returns:
+        values: Value of each run (bool)
+        starts: Start index of each run
+        lengths: Length of each run
+    """
+    mask = np.asarray(mask, dtype=bool)
+    if len(mask) == 0:
+        empty = np.array([], dtype=int)
+        return np.array([], dtype=bool), empty, empty
+    
+    starts = np.flatnonzero(np.concatenate([[True], mask[1:] != mask[:-1]]))
+    lengths = np.diff(np.append(starts, len(mask)))
+    return mask[starts], starts, lengths
+
+
+def _streak_stats(lengths: np.ndarray) -> dict:
+    """Distribution summary of streak lengths (days)."""
+    if len(lengths) == 0:
+        return {'count': 0, 'max': 0, 'mean': 0.0, 'median': 0.0, 'p90': 0.0, 'p95': 0.0}
+    return {
+        'count': int(len(lengths)),
+        'max': int(lengths.max()),
+        'mean': float(lengths.mean()),
+        'median': float(np.median(lengths)),
+        'p90': float(np.percentile(lengths, 90)),
+        'p95': float(np.percentile(lengths, 95)),
+    }
+
+
+def get_streak_distribution(
+    positions: pd.Series,
+    include_edges: bool = False,
+) -> dict:
+    """
+    Distribution of flat and active streaks (consecutive days).
+    
+    Flat = |position| < 0.01 or NaN. By default only complete streaks are
+    counted: a streak touching the first bar (signal warmup) or the last bar
+    (still running) is excluded, which is what calculate_max_flat_streak()
+    has always measured.
+    
+    Args:
+        positions: Strategy positions series
+        include_edges: Also count streaks touching the start/end of history
+        
+    Returns:
+        dict: {'flat': stats, 'active': stats}, stats = count, max, mean,
+            median, p90, p95 of streak lengths in days
+    """
+    is_flat = ((positions.abs() < 0.01) | positions.isna()).to_numpy()
+    values, starts, lengths = run_length_encode(is_flat)
+    
+    if not include_edges:
+        interior = (starts > 0) & (starts + lengths < len(is_flat))
+        values, lengths = values[interior], lengths[interior]
+    
+    return {
+        'flat': _streak_stats(lengths[values]),
+        'active': _streak_stats(lengths[~values]),
+    }
 
 
 def calculate_max_flat_streak(positions: pd.Series) -> int:
@@ -36,27 +110,10 @@ def calculate_max_flat_streak(positions: pd.Series) -> int:
         positions: Strategy positions series
         
     Returns:
-        Maximum number of consecutive flat days
+        Maximum number of consecutive flat days (complete streaks only,
+        see get_streak_distribution)
     """
-    is_flat = (positions.abs() < 0.01) | positions.isna()
-    
-    # Find changes in flat state
-    flat_changes = is_flat.astype(int).diff().fillna(0)
-    flat_starts = flat_changes[flat_changes == 1].index
-    flat_ends = flat_changes[flat_changes == -1].index
-    
-    max_streak = 0
-    for start_idx in range(len(flat_starts)):
-        start = flat_starts[start_idx]
-        # Find next end after this start
-        matching_ends = flat_ends[flat_ends > start]
-        if len(matching_ends) > 0:
-            end = matching_ends[0]
-            streak = (positions.index.get_loc(end) - 
-                     positions.index.get_loc(start))
-            max_streak = max(max_streak, streak)
-    
-    return max_streak
+    return get_streak_distribution(positions)['flat']['max']
 
 
 def classify_strategy_type(
@@ -110,8 +167,8 @@ def classify_strategy_type(
     total_days = len(positions)
     pct_active = (active_days / total_days) * 100
     
-    # Calculate max flat streak
-    max_flat = calculate_max_flat_streak(positions)
+    # Calculate max flat streak (run-length encoded)
+    max_flat = get_streak_distribution(positions)['flat']['max']
     
     # Enhanced classification logic
     if pct_active > threshold_pct_active:
@@ -134,10 +191,498 @@ def classify_strategy_type(
     return strategy_type
 
 
+class StreamingMedian:
+    """
+    Running median of a growing sample (two heaps).
+    
+    Lower half in a max-heap, upper half in a min-heap; push is O(log n)
+    and median is O(1). Same value as pandas expanding().median().
+    """
+    
+    def __init__(self):
+        self._low = []   # max-heap (stored negated)
+        self._high = []  # min-heap
+    
+    def __len__(self) -> int:
+        return len(self._low) + len(self._high)
+    
+    def push(self, value: float) -> None:
+        """Add one observation."""
+        if self._low and value > -self._low[0]:
+            heapq.heappush(self._high, value)
+        else:
+            heapq.heappush(self._low, -value)
+        
+        # Rebalance: len(low) == len(high) or len(high) + 1
+        if len(self._low) > len(self._high) + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+        elif len(self._high) > len(self._low):
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+    
+    @property
+    def median(self) -> float:
+        """Current median (NaN if empty)."""
+        if not self._low:
+            return np.nan
+        if len(self._low) > len(self._high):
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+    
+    def to_dict(self) -> dict:
+        """Serializable state (for live daily runs)."""
+        return {'low': [-v for v in self._low], 'high': list(self._high)}
+    
+    @classmethod
+    def from_dict(cls, state: dict) -> 'StreamingMedian':
+        """Restore from to_dict() output."""
+        obj = cls()
+        obj._low = [-float(v) for v in state['low']]
+        obj._high = [float(v) for v in state['high']]
+        heapq.heapify(obj._low)
+        heapq.heapify(obj._high)
+        return obj
+
+
+class TypicalExposureState:
+    """
+    Streaming typical exposure for sparse-mode vol targeting.
+    
+    Typical exposure = median |position| over all active days so far
+    (|position| > active_threshold), once min_history active days exist;
+    default before that. Inactive days carry the last value forward.
+    
+    Feeding a whole history through update() reproduces the batch series in
+    target_volatility(); a live run can restore the state and append one
+    day at a time.
+    """
+    
+    def __init__(
+        self,
+        min_history: int = 63,
+        active_threshold: float = 0.05,
+        default: float = 0.5,
+    ):
+        self.min_history = min_history
+        self.active_threshold = active_threshold
+        self.default = default
+        self._median = StreamingMedian()
+    
+    @property
+    def n_active(self) -> int:
+        """Number of active days observed."""
+        return len(self._median)
+    
+    @property
+    def value(self) -> float:
+        """Current typical exposure."""
+        if self.n_active >= max(self.min_history, 1):
+            return self._median.median
+        return self.default
+    
+    def update(self, position: float) -> float:
+        """
+        Add one day's position and return that day's typical exposure.
+        
+        Args:
+            position: Strategy position for the day (NaN = inactive)
+            
+        Returns:
+            float: Typical exposure as of this day
+        """
+        exposure = abs(position)
+        if exposure > self.active_threshold:
+            self._median.push(exposure)
+        return self.value
+    
+    def to_dict(self) -> dict:
+        """Serializable state (for live daily runs)."""
+        return {
+            'min_history': self.min_history,
+            'active_threshold': self.active_threshold,
+            'default': self.default,
+            'median': self._median.to_dict(),
+        }
+    
+    @classmethod
+    def from_dict(cls, state: dict) -> 'TypicalExposureState':
+        """Restore from to_dict() output."""
+        obj = cls(
+            min_history=state['min_history'],
+            active_threshold=state['active_threshold'],
+            default=state['default'],
+        )
+        obj._median = StreamingMedian.from_dict(state['median'])
+        return obj
+
+
+def calculate_typical_exposure(
+    positions: pd.Series,
+    min_history: int = 63,
+    active_threshold: float = 0.05,
+    default: float = 0.5,
+) -> pd.Series:
+    """
+    Expanding median of |position| on active days, carried over flat days.
+    
+    Streams the history through TypicalExposureState (O(n log n)).
+    
+    Args:
+        positions: Strategy positions
+        min_history: Active days required before using the median
+        active_threshold: |position| above this counts as active
+        default: Exposure before min_history active days
+        
+    Returns:
+        pd.Series: Typical exposure per day
+    """
+    state = TypicalExposureState(min_history, active_threshold, default)
+    values = [state.update(p) for p in positions.to_numpy(dtype=float).tolist()]
+    return pd.Series(values, index=positions.index)
+
+
+class EWMAVolState:
+    """
+    Online (one day at a time) version of target_volatility().
+    
+    Holds the EWMA variance recursion plus, for sparse strategies, the
+    typical exposure state, so a live morning run updates sizing in O(1)
+    instead of recomputing the full history. Feeding a history through
+    update() reproduces target_volatility() exactly: same EWMA arithmetic
+    as pandas ewm(adjust=True), min_history warmup, vol floor/cap and
+    leverage cap.
+    
+    Usage:
+        state = EWMAVolState.from_history(strategy_returns, target_vol=0.10)
+        json.dump(state.to_dict(), f)                # persist overnight
+        state = EWMAVolState.from_dict(json.load(f))
+        lev = state.update(todays_strategy_return)  # leverage for today
+    
+    Sparse mode: pass underlying returns and the day's position,
+    update(underlying_ret, position=pos).
+    """
+    
+    def __init__(
+        self,
+        target_vol: float = 0.10,
+        strategy_type: str = 'always_on',
+        lambda_decay: float = 0.94,
+        vol_floor: float = 0.02,
+        vol_cap: float = 0.40,
+        max_leverage: float = 3.0,
+        min_history: int = 63,
+    ):
+        assert strategy_type in ['always_on', 'sparse'], \
+            f"strategy_type must be 'always_on' or 'sparse', got {strategy_type}"
+        assert 0 < lambda_decay < 1, f"lambda_decay must be in (0,1), got {lambda_decay}"
+        assert vol_floor > 0, f"vol_floor must be positive, got {vol_floor}"
+        assert vol_cap > vol_floor, f"vol_cap must exceed vol_floor"
+        assert max_leverage > 0, f"max_leverage must be positive"
+        
+        self.target_vol = target_vol
+        self.strategy_type = strategy_type
+        self.lambda_decay = lambda_decay
+        self.vol_floor = vol_floor
+        self.vol_cap = vol_cap
+        self.max_leverage = max_leverage
+        self.min_history = min_history
+        
+        # EWMA recursion state (pandas adjust=True form)
+        self.n_bars = 0
+        self.n_obs = 0
+        self.weighted = np.nan
+        self.old_wt = 1.0
+        
+        self.exposure = (
+            TypicalExposureState(min_history=min_history)
+            if strategy_type == 'sparse' else None
+        )
+    
+    @property
+    def _decay(self) -> float:
+        """Weight decay per bar, derived exactly as pandas does (via com)."""
+        alpha = 1 - self.lambda_decay
+        com = (1 - alpha) / alpha
+        return 1.0 - 1.0 / (1.0 + com)
+    
+    def update(self, ret: float, position: Optional[float] = None) -> float:
+        """
+        Add one day and return that day's leverage.
+        
+        Args:
+            ret: Strategy return (always_on) or underlying return (sparse)
+                for the day; NaN allowed
+            position: Day's strategy position (required for sparse)
+            
+        Returns:
+            float: Leverage scalar for the day (0 during warmup)
+        """
+        sq = ret * ret
+        is_observation = sq == sq
+        
+        if self.n_bars == 0:
+            self.weighted = sq
+        elif self.weighted == self.weighted:
+            self.old_wt *= self._decay
+            if is_observation:
+                if self.weighted != sq:
+                    self.weighted = self.old_wt * self.weighted + sq
+                    self.weighted /= (self.old_wt + 1.0)
+                self.old_wt += 1.0
+        elif is_observation:
+            self.weighted = sq
+        
+        self.n_obs += int(is_observation)
+        self.n_bars += 1
+        
+        if self.exposure is not None:
+            assert position is not None, "sparse mode needs the day's position"
+            self.exposure.update(position)
+        
+        return self.leverage()
+    
+    def variance(self) -> float:
+        """Current daily variance estimate (NaN before min_history obs)."""
+        if self.n_obs < max(self.min_history, 1):
+            return np.nan
+        if self.exposure is not None:
+            typical_exposure = self.exposure.value
+            return self.weighted * (typical_exposure * typical_exposure)
+        return self.weighted
+    
+    def realized_vol(self) -> float:
+        """Current annualized vol estimate (0 if not yet available)."""
+        vol = np.sqrt(self.variance() * 252)
+        return 0.0 if np.isnan(vol) else float(vol)
+    
+    def leverage(self) -> float:
+        """Leverage for the latest day (same rules as target_volatility)."""
+        if self.n_bars <= self.min_history:
+            return 0.0
+        vol = np.sqrt(self.variance() * 252)
+        if np.isnan(vol):
+            return 0.0
+        effective_vol = min(max(vol, self.vol_floor), self.vol_cap)
+        return float(min(self.target_vol / effective_vol, self.max_leverage))
+    
+    def to_dict(self) -> dict:
+        """Serializable state."""
+        return {
+            'params': {
+                'target_vol': self.target_vol,
+                'strategy_type': self.strategy_type,
+                'lambda_decay': self.lambda_decay,
+                'vol_floor': self.vol_floor,
+                'vol_cap': self.vol_cap,
+                'max_leverage': self.max_leverage,
+                'min_history': self.min_history,
+            },
+            'n_bars': self.n_bars,
+            'n_obs': self.n_obs,
+            'weighted': None if np.isnan(self.weighted) else self.weighted,
+            'old_wt': self.old_wt,
+            'exposure': self.exposure.to_dict() if self.exposure is not None else None,
+        }
+    
+    @classmethod
+    def from_dict(cls, state: dict) -> 'EWMAVolState':
+        """Restore from to_dict() output."""
+        obj = cls(**state['params'])
+        obj.n_bars = state['n_bars']
+        obj.n_obs = state['n_obs']
+        obj.weighted = np.nan if state['weighted'] is None else state['weighted']
+        obj.old_wt = state['old_wt']
+        if state['exposure'] is not None:
+            obj.exposure = TypicalExposureState.from_dict(state['exposure'])
+        return obj
+    
+    @classmethod
+    def from_history(
+        cls,
+        returns: pd.Series,
+        positions: Optional[pd.Series] = None,
+        **kwargs
+    ) -> 'EWMAVolState':
+        """
+        Build the state by replaying a history.
+        
+        Args:
+            returns: Strategy returns (always_on) or underlying returns (sparse)
+            positions: Strategy positions (sparse mode only)
+            **kwargs: EWMAVolState parameters
+            
+        Returns:
+            EWMAVolState: State after the last day of history
+        """
+        obj = cls(**kwargs)
+        rets = returns.to_numpy(dtype=float).tolist()
+        if positions is None:
+            for r in rets:
+                obj.update(r)
+        else:
+            for r, p in zip(rets, positions.to_numpy(dtype=float).tolist()):
+                obj.update(r, p)
+        return obj
+
+
+# ========================================================================
+# VOL ESTIMATORS (selected via policy.sizing.vol_estimator)
+# ========================================================================
+
+# Close-to-close EWMA (default). 'simple_returns_std' is the legacy policy
+# name for the same close-to-close estimator.
+CLOSE_TO_CLOSE_ESTIMATORS = ('ewma', 'simple_returns_std')
+
+
+def _range_min_periods(window: int) -> int:
+    """Bars a range estimator needs in its window (a gap bar is skipped, not fatal)."""
+    return max(2, window // 2)
+
+
+def parkinson_variance(
+    high: pd.Series,
+    low: pd.Series,
+    window: int = 20,
+) -> pd.Series:
+    """
+    Parkinson (1980) high-low range variance.
+    
+    σ² = mean[(ln H/L)²] / (4 ln 2). About 5x more efficient than
+    close-to-close, so short windows give stable estimates.
+    
+    Returns:
+        pd.Series: Daily variance (rolling mean over window)
+    """
+    hl = np.log(high / low)
+    return hl.pow(2).rolling(window, min_periods=_range_min_periods(window)).mean() / (4 * np.log(2))
+
+
+def garman_klass_variance(
+    open_: pd.Series,
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    window: int = 20,
+) -> pd.Series:
+    """
+    Garman-Klass (1980) OHLC variance.
+    
+    σ² = mean[0.5 (ln H/L)² - (2 ln 2 - 1)(ln C/O)²]
+    
+    Returns:
+        pd.Series: Daily variance (rolling mean over window)
+    """
+    hl = np.log(high / low)
+    co = np.log(close / open_)
+    return (
+        (0.5 * hl.pow(2) - (2 * np.log(2) - 1) * co.pow(2))
+        .rolling(window, min_periods=_range_min_periods(window))
+        .mean()
+    )
+
+
+def yang_zhang_variance(
+    open_: pd.Series,
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    window: int = 20,
+) -> pd.Series:
+    """
+    Yang-Zhang (2000) variance: overnight + open-to-close + Rogers-Satchell.
+    
+    σ² = σ²_overnight + k σ²_open-close + (1 - k) σ²_RS,
+    k = 0.34 / (1.34 + (n + 1) / (n - 1)). Robust to opening jumps and drift.
+    
+    Returns:
+        pd.Series: Daily variance over the rolling window
+    """
+    overnight = np.log(open_ / close.shift(1))
+    open_close = np.log(close / open_)
+    rogers_satchell = (
+        np.log(high / close) * np.log(high / open_)
+        + np.log(low / close) * np.log(low / open_)
+    )
+    k = 0.34 / (1.34 + (window + 1) / (window - 1))
+    min_periods = _range_min_periods(window)
+    
+    return (
+        overnight.rolling(window, min_periods=min_periods).var()
+        + k * open_close.rolling(window, min_periods=min_periods).var()
+        + (1 - k) * rogers_satchell.rolling(window, min_periods=min_periods).mean()
+    )
+
+
+# Range-based estimators: name -> f(open, high, low, close, window)
+RANGE_ESTIMATORS = {
+    'parkinson': lambda o, h, l, c, w: parkinson_variance(h, l, w),
+    'garman_klass': garman_klass_variance,
+    'yang_zhang': yang_zhang_variance,
+}
+
+
+def align_range_ohlc(
+    close: pd.Series,
+    high: pd.Series,
+    low: pd.Series,
+) -> pd.DataFrame:
+    """
+    Put high/low on the close's dates for the range estimators.
+    
+    Dates missing from the high/low files stay NaN: the estimators skip
+    them (min_periods) instead of inventing a range from stale values.
+    
+    Args:
+        close: Close prices (index = trading dates)
+        high: High prices, date-indexed
+        low: Low prices, date-indexed
+        
+    Returns:
+        pd.DataFrame: 'price', 'high', 'low' on close.index
+    """
+    return pd.DataFrame({
+        'price': close,
+        'high': high.reindex(close.index),
+        'low': low.reindex(close.index),
+    })
+
+
+def estimate_range_variance(
+    ohlc: pd.DataFrame,
+    vol_estimator: str,
+    window: int = 20,
+) -> pd.Series:
+    """
+    Daily variance of the underlying from a range-based estimator.
+    
+    Args:
+        ohlc: DataFrame with 'price' (close), 'high', 'low' and optionally
+            'open'. Without an open (LME 3M canonical files have none),
+            the previous close is used, i.e. no overnight gap.
+        vol_estimator: 'parkinson', 'garman_klass' or 'yang_zhang'
+        window: Rolling window in days
+        
+    Returns:
+        pd.Series: Daily variance (NaN during warmup)
+    """
+    if vol_estimator not in RANGE_ESTIMATORS:
+        raise ValueError(
+            f"Unknown vol_estimator '{vol_estimator}'. Options: "
+            f"{list(CLOSE_TO_CLOSE_ESTIMATORS) + list(RANGE_ESTIMATORS)}"
+        )
+    for col in ['price', 'high', 'low']:
+        if col not in ohlc.columns:
+            raise ValueError(f"Range estimator '{vol_estimator}' needs '{col}' column")
+    
+    close = ohlc['price']
+    open_ = ohlc['open'] if 'open' in ohlc.columns else close.shift(1)
+    
+    return RANGE_ESTIMATORS[vol_estimator](open_, ohlc['high'], ohlc['low'], close, window)
+
+
 def target_volatility(
-    strategy_returns: pd.Series,
+    strategy_returns: Union[pd.Series, pd.DataFrame, np.ndarray],
     underlying_returns: pd.Series,
-    positions: pd.Series,
+    positions: Union[pd.Series, pd.DataFrame, np.ndarray],
     target_vol: float = 0.10,
     strategy_type: str = 'always_on',
     lambda_decay: float = 0.94,
@@ -145,10 +690,19 @@ def target_volatility(
     vol_cap: float = 0.40,
     max_leverage: float = 3.0,
     min_history: int = 63,
-) -> Tuple[pd.Series, pd.Series]:
+    vol_estimator: str = 'ewma',
+    ohlc: Optional[pd.DataFrame] = None,
+    vol_window: int = 20,
+) -> Tuple[Union[pd.Series, pd.DataFrame, np.ndarray], Union[pd.Series, pd.DataFrame, np.ndarray]]:
     """
     Apply closed-loop volatility targeting to strategy.
     
+    Matrix mode: strategy_returns and positions may be 2D (DataFrame or
+    array, one column per sleeve / parameter variant, same shape). All
+    columns are sized in one vectorized pass and leverage / realized_vol
+    come back in the same 2D type; each column equals the 1D result.
+    underlying_returns stays 1D (shared by all columns).
+    
     Args:
         strategy_returns: Daily strategy returns (positions.shift(1) * underlying_returns)
         underlying_returns: Daily underlying asset returns (copper)
@@ -164,10 +718,20 @@ def target_volatility(
         vol_cap: Maximum vol estimate (prevents under-leverage in extreme vol)
         max_leverage: Hard cap on leverage scalar
         min_history: Minimum days before applying leverage
+        vol_estimator: 'ewma' (close-to-close, default) or a range-based
+            estimator: 'parkinson', 'garman_klass', 'yang_zhang'. Range
+            estimators measure underlying variance from OHLC; always_on
+            strategies scale it by the rolling mean of squared (lagged)
+            positions, sparse ones by typical exposure².
+        ohlc: Underlying OHLC (required for range estimators, see
+            estimate_range_variance)
+        vol_window: Window for range estimators (days)
         
     Returns:
-        leverage: Scalar to multiply strategy positions (0 to max_leverage)
-        realized_vol: Estimated annualized volatility (for monitoring)
+        leverage: Scalar to multiply strategy positions (0 to max_leverage);
+            Series for 1D input, DataFrame / 2D array in matrix mode
+        realized_vol: Estimated annualized volatility (for monitoring),
+            same type and shape as leverage
         
     Scrutiny Questions & Answers:
         Q: "Why EWMA with λ=0.94?"
@@ -188,6 +752,12 @@ def target_volatility(
            concentration and margin issues. Higher leverage increases
            implementation risk without proportional returns.
            
+        Q: "Why offer range-based estimators?"
+        A: High/low ranges carry more information per day than closes
+           (Parkinson ~5x, Garman-Klass ~7x efficiency), so a 20-day window
+           is about as stable as a much longer close-to-close one and reacts
+           faster to regime shifts. EWMA stays the default.
+           
         Q: "What if vol estimates are wrong?"
         A: Floor/cap bounds contain worst-case scenarios. Max leverage cap
            prevents blowups. This is risk management, not prediction.
@@ -200,47 +770,88 @@ def target_volatility(
     assert vol_cap > vol_floor, f"vol_cap must exceed vol_floor"
     assert max_leverage > 0, f"max_leverage must be positive"
     
+    # Matrix mode from plain arrays: run on DataFrames, return arrays
+    if isinstance(strategy_returns, np.ndarray):
+        assert strategy_returns.ndim == 2, "array input must be 2D (dates × columns)"
+        assert np.shape(positions) == strategy_returns.shape, \
+            "positions must have the same shape as strategy_returns"
+        leverage, realized_vol = target_volatility(
+            pd.DataFrame(strategy_returns),
+            pd.Series(np.asarray(underlying_returns, dtype=float)),
+            pd.DataFrame(np.asarray(positions, dtype=float)),
+            target_vol=target_vol,
+            strategy_type=strategy_type,
+            lambda_decay=lambda_decay,
+            vol_floor=vol_floor,
+            vol_cap=vol_cap,
+            max_leverage=max_leverage,
+            min_history=min_history,
+            vol_estimator=vol_estimator,
+            ohlc=None if ohlc is None else ohlc.reset_index(drop=True),
+            vol_window=vol_window,
+        )
+        return leverage.to_numpy(), realized_vol.to_numpy()
+    
     # Align all series
     strategy_returns = strategy_returns.copy()
     underlying_returns = underlying_returns.copy()
     positions = positions.copy()
     
-    # Calculate EWMA variance based on strategy type
-    if strategy_type == 'always_on':
-        # Use strategy returns directly (captures strategy behavior)
-        ewma_var = (
-            strategy_returns.pow(2)
-            .ewm(alpha=1-lambda_decay, min_periods=min_history)
-            .mean()
-        )
+    range_based = vol_estimator not in CLOSE_TO_CLOSE_ESTIMATORS
+    if range_based:
+        if ohlc is None:
+            raise ValueError(f"vol_estimator '{vol_estimator}' requires ohlc data")
+        range_var = estimate_range_variance(ohlc, vol_estimator, vol_window)
+    
+    # Calculate variance based on strategy type
+    if strategy_type == 'always_on' and not range_based:
+        # Use strategy returns directly (captures strategy behavior).
+        # Strategy returns are unique to this call: skip the indicator cache
+        strategy_var = ewma_variance(strategy_returns, lambda_decay, min_history, cache=False)
+        
+    elif strategy_type == 'always_on':
+        # Range estimators see the underlying, not the strategy: scale by the
+        # recent mean squared exposure held over each day (lagged position)
+        exposure_sq = positions.shift(1).pow(2).rolling(vol_window).mean()
+        if isinstance(positions, pd.DataFrame):
+            strategy_var = exposure_sq.mul(range_var, axis=0)
+        else:
+            strategy_var = range_var * exposure_sq
         
     elif strategy_type == 'sparse':
         # Use underlying vol × typical exposure (prevents false low vol)
-        underlying_var = (
-            underlying_returns.pow(2)
-            .ewm(alpha=1-lambda_decay, min_periods=min_history)
-            .mean()
+        # Shared across sleeves on the same underlying (indicator cache)
+        if range_based:
+            underlying_var = range_var
+        else:
+            underlying_var = ewma_variance(underlying_returns, lambda_decay, min_history)
+        
+        # Typical exposure when strategy is active: expanding median of
+        # |position| on active days (streaming, see TypicalExposureState)
+        exposure_params = dict(
+            min_history=min_history,
+            active_threshold=0.05,  # Non-trivial positions
+            default=0.5,  # Default to 50% exposure if no history
         )
         
-        # Calculate typical exposure when strategy is active
-        active_mask = positions.abs() > 0.05  # Non-trivial positions
-        if active_mask.sum() > 0:
-            # Rolling median of absolute position when active
-            typical_exposure = (
-                positions[active_mask].abs()
-                .expanding(min_periods=min_history)
-                .median()
-                .reindex(positions.index, method='ffill')
-                .fillna(0.5)  # Default to 50% exposure if no history
+        # Effective variance = underlying variance × (typical exposure)²
+        if isinstance(positions, pd.DataFrame):
+            # Same streaming median per column as the 1D path
+            typical_exposure = pd.DataFrame(
+                np.column_stack([
+                    calculate_typical_exposure(positions.iloc[:, j], **exposure_params).to_numpy()
+                    for j in range(positions.shape[1])
+                ]),
+                index=positions.index,
+                columns=positions.columns,
             )
+            strategy_var = typical_exposure.pow(2).mul(underlying_var, axis=0)
         else:
-            typical_exposure = pd.Series(0.5, index=positions.index)
-        
-        # Effective variance = underlying variance × (typical exposure)²
-        ewma_var = underlying_var * typical_exposure.pow(2)
+            typical_exposure = calculate_typical_exposure(positions, **exposure_params)
+            strategy_var = underlying_var * typical_exposure.pow(2)
     
     # Convert variance to annualized volatility
-    realized_vol = np.sqrt(ewma_var * 252)
+    realized_vol = np.sqrt(strategy_var * 252)
     
     # Apply conservative bounds
     effective_vol = realized_vol.clip(lower=vol_floor, upper=vol_cap)
@@ -259,17 +870,17 @@ def target_volatility(
 
 
 def apply_vol_targeting(
-    positions: pd.Series,
+    positions: Union[pd.Series, pd.DataFrame],
     underlying_returns: pd.Series,
     target_vol: float = 0.10,
     strategy_type: str = 'always_on',
     **kwargs
-) -> pd.Series:
+) -> Union[pd.Series, pd.DataFrame]:
     """
     Convenience function: Apply vol targeting to positions directly.
     
     Args:
-        positions: Raw strategy positions
+        positions: Raw strategy positions (DataFrame = one column per variant)
         underlying_returns: Underlying asset returns
         target_vol: Target volatility
         strategy_type: 'always_on' or 'sparse'
@@ -278,8 +889,11 @@ def apply_vol_targeting(
     Returns:
         positions_scaled: Vol-targeted positions (positions × leverage)
     """
-    # Calculate strategy returns
-    strategy_returns = positions.shift(1) * underlying_returns
+    # Calculate strategy returns (row-wise for a DataFrame of variants)
+    if isinstance(positions, pd.DataFrame):
+        strategy_returns = positions.shift(1).mul(underlying_returns, axis=0)
+    else:
+        strategy_returns = positions.shift(1) * underlying_returns
     
     # Get leverage scalar
     leverage, _ = target_volatility(
@@ -347,4 +961,166 @@ def get_vol_diagnostics(
         'targeted_returns': targeted_returns,
     })
     
-    return diagnostics
\ No newline at end of file
+    return diagnostics
+
+
+def _ewma_variance_grid(
+    returns: np.ndarray,
+    lambdas: np.ndarray,
+    min_periods: int,
+) -> np.ndarray:
+    """
+    EWMA of squared returns for many decay factors in one recursion.
+    
+    Same arithmetic as pandas ewm(alpha=1-lambda, adjust=True).mean() on
+    returns**2 (see EWMAVolState), vectorized across lambdas.
+    
+    Returns:
+        np.ndarray: Daily variance, shape (n_bars, n_lambdas)
+    """
+    sq = np.asarray(returns, dtype=float) ** 2
+    lambdas = np.asarray(lambdas, dtype=float)
+    alpha = 1 - lambdas
+    decay = 1.0 - 1.0 / (1.0 + (1 - alpha) / alpha)
+    
+    out = np.full((len(sq), len(lambdas)), np.nan)
+    weighted = np.full(len(lambdas), np.nan)
+    old_wt = np.ones(len(lambdas))
+    started = False
+    n_obs = 0
+    
+    for i, cur in enumerate(sq.tolist()):
+        is_observation = cur == cur
+        n_obs += is_observation
+        
+        if started:
+            old_wt = old_wt * decay
+            if is_observation:
+                update = weighted != cur
+                blended = (old_wt * weighted + cur) / (old_wt + 1.0)
+                weighted = np.where(update, blended, weighted)
+                old_wt = old_wt + 1.0
+        elif is_observation:
+            weighted[:] = cur
+            started = True
+        
+        if n_obs >= max(min_periods, 1):
+            out[i] = weighted
+    
+    return out
+
+
+def sweep_vol_targeting(
+    positions: pd.Series,
+    underlying_returns: pd.Series,
+    lambda_grid: tuple = (0.90, 0.94, 0.97),
+    floor_grid: tuple = (0.01, 0.02, 0.04),
+    cap_grid: tuple = (0.30, 0.40, 0.60),
+    leverage_grid: tuple = (2.0, 3.0, 5.0),
+    target_vol: float = 0.10,
+    strategy_type: str = 'always_on',
+    min_history: int = 63,
+    cost_bps: float = 3.0,
+) -> pd.DataFrame:
+    """
+    Evaluate vol targeting over a lambda × floor × cap × max leverage grid.
+    
+    One squared-return array feeds a batched EWMA recursion for all lambdas;
+    floors, caps and leverage caps are then broadcast over each lambda's
+    variance, so every cell's leverage equals target_volatility() with
+    those parameters. PnL follows execute_single_sleeve() (position at T-1
+    earns return at T, one-way costs on |trade|), measured after the
+    min_history warmup.
+    
+    Args:
+        positions: Raw strategy positions
+        underlying_returns: Underlying asset returns
+        lambda_grid: EWMA decay factors
+        floor_grid: Vol floors
+        cap_grid: Vol caps (cells with cap <= floor are skipped)
+        leverage_grid: Max leverage caps
+        target_vol: Target annualized vol
+        strategy_type: 'always_on' or 'sparse'
+        min_history: Warmup days (no leverage, excluded from metrics)
+        cost_bps: One-way transaction cost in basis points
+        
+    Returns:
+        pd.DataFrame: One row per cell with realized_vol, vol_error
+            (realized - target), abs_vol_error, annual_turnover,
+            gross_sharpe and sharpe (net)
+    """
+    assert strategy_type in ['always_on', 'sparse'], \
+        f"strategy_type must be 'always_on' or 'sparse', got {strategy_type}"
+    
+    returns = underlying_returns.to_numpy(dtype=float)
+    strategy_returns = (positions.shift(1) * underlying_returns).to_numpy(dtype=float)
+    
+    # ========== EWMA VARIANCE FOR ALL LAMBDAS ==========
+    if strategy_type == 'always_on':
+        ewma_var = _ewma_variance_grid(strategy_returns, lambda_grid, min_history)
+    else:
+        typical_exposure = calculate_typical_exposure(positions, min_history=min_history)
+        te = typical_exposure.to_numpy()
+        ewma_var = _ewma_variance_grid(returns, lambda_grid, min_history) * (te * te)[:, None]
+    
+    realized_vol_est = np.sqrt(ewma_var * 252)  # (bars × lambdas)
+    
+    # Floor/cap/leverage cells (cap must exceed floor)
+    cells = [
+        (f, c, m)
+        for f in floor_grid for c in cap_grid for m in leverage_grid
+        if c > f
+    ]
+    floors = np.array([f for f, _, _ in cells])
+    caps = np.array([c for _, c, _ in cells])
+    max_levs = np.array([m for _, _, m in cells])
+    
+    pos = positions.to_numpy(dtype=float)[:, None]
+    ret = returns[:, None]
+    years = max(len(positions) - min_history, 0) / 252
+    
+    rows = []
+    for j, lambda_decay in enumerate(lambda_grid):
+        # ========== LEVERAGE FOR ALL CELLS (bars × cells) ==========
+        effective_vol = np.minimum(np.maximum(realized_vol_est[:, [j]], floors), caps)
+        leverage = np.minimum(target_vol / effective_vol, max_levs)
+        leverage[:min_history] = 0
+        leverage = np.nan_to_num(leverage, nan=0.0)
+        
+        # ========== EXECUTION (as execute_single_sleeve) ==========
+        scaled = pd.DataFrame(pos * leverage)
+        trade = scaled.diff().fillna(0)
+        cost = trade.abs() * (cost_bps / 10000)
+        pnl_gross = scaled.shift(1).mul(ret[:, 0], axis=0)
+        pnl_net = pnl_gross - cost
+        
+        # ========== METRICS (post warmup) ==========
+        gross = pnl_gross.iloc[min_history:]
+        net = pnl_net.iloc[min_history:]
+        n_obs = len(net)
+        
+        gross_vol = gross.std() * np.sqrt(252)
+        net_vol = net.std() * np.sqrt(252)
+        if n_obs > 0:
+            gross_ret = (1 + gross).prod() ** (252 / n_obs) - 1
+            net_ret = (1 + net).prod() ** (252 / n_obs) - 1
+        else:
+            gross_ret = net_ret = pd.Series(0.0, index=gross.columns)
+        turnover = trade.iloc[min_history:].abs().sum()
+        annual_turnover = turnover / years if years > 0 else turnover * 0.0
+        
+        for k, (vol_floor, vol_cap, max_leverage) in enumerate(cells):
+            rows.append({
+                'lambda_decay': lambda_decay,
+                'vol_floor': vol_floor,
+                'vol_cap': vol_cap,
+                'max_leverage': max_leverage,
+                'realized_vol': gross_vol[k],
+                'vol_error': gross_vol[k] - target_vol,
+                'abs_vol_error': abs(gross_vol[k] - target_vol),
+                'annual_turnover': annual_turnover[k],
+                'gross_sharpe': gross_ret[k] / gross_vol[k] if gross_vol[k] > 0 else 0,
+                'sharpe': net_ret[k] / net_vol[k] if net_vol[k] > 0 else 0,
+            })
+    
+    return pd.DataFrame(rows)
@@ -7,6 +7,8 @@ import numpy as np
 import sys
 
 sys.path.append("src")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.core.series_cache import load_series
 try:
     from build_hookcore_v12 import run_strategy
 except Exception as e:
@@ -188,6 +190,8 @@ def run_strategy_adapter(df, **kwargs):
 
 # ----------------- CONFIG -----------------
 EXCEL = r"Data\copper\pricing\pricing_values.xlsx"
+# Canonical series via its .npy cache (no Excel/CSV parse); Excel is only read if missing
+CANONICAL_CSV = r"Data\copper\pricing\canonical\copper_lme_3mo.canonical.csv"
 PRICE_COL = "copper_lme_3mo"
 DATE_COL = None  # set to "Date" if your sheet has an explicit date column
 SHEET = 0  # or "Raw"
@@ -207,15 +211,18 @@ EXEC_MODE = "T"
 # ----------------- RUN -----------------
 def main():
     # --- load data ---
-    df_raw = pd.read_excel(EXCEL, sheet_name=SHEET)
-    if DATE_COL and (DATE_COL in df_raw.columns):
-        df_raw[DATE_COL] = pd.to_datetime(df_raw[DATE_COL])
-        df_raw = df_raw.set_index(DATE_COL).sort_index()
+    if os.path.exists(CANONICAL_CSV):
+        price = load_series(CANONICAL_CSV).rename("Price")
     else:
-        # assume the index is date-like if no explicit date col
-        df_raw.index = pd.to_datetime(df_raw.index)
-
-    price = df_raw[PRICE_COL].astype(float).rename("Price")
+        df_raw = pd.read_excel(EXCEL, sheet_name=SHEET)
+        if DATE_COL and (DATE_COL in df_raw.columns):
+            df_raw[DATE_COL] = pd.to_datetime(df_raw[DATE_COL])
+            df_raw = df_raw.set_index(DATE_COL).sort_index()
+        else:
+            # assume the index is date-like if no explicit date col
+            df_raw.index = pd.to_datetime(df_raw.index)
+
+        price = df_raw[PRICE_COL].astype(float).rename("Price")
     df = pd.DataFrame({"Price": price})
     df["ret"] = df["Price"].pct_change().fillna(0.0)
     df.index = pd.to_datetime(df.index, utc=False).tz_localize(None)
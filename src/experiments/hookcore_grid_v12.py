@@ -1,8 +1,11 @@
-import os, json, math, itertools, datetime as dt
+import os, sys, json, math, itertools, datetime as dt
 import pandas as pd
 import numpy as np
 import yaml
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.core.series_cache import load_series
+
 # ---------- Core helpers (copied from build_hookcore_v12, trimmed to be self-contained) ----------
 # Force datetime index
 
@@ -177,15 +180,20 @@ def main():
 
     data_file = base_cfg["data"]["file"]
     price_col = base_cfg["data"]["price_col"]
+    canonical_csv = base_cfg["data"].get("canonical_csv")
 
-    dfp = pd.read_excel(data_file)
-    if "date" in dfp.columns:
-        dfp["date"] = pd.to_datetime(dfp["date"])
-        dfp = dfp.set_index("date").sort_index()
+    if canonical_csv and os.path.exists(canonical_csv):
+        # .npy cache next to the canonical CSV: loads without parsing (built on first use)
+        price = load_series(canonical_csv).rename(price_col)
     else:
-        dfp.index = pd.to_datetime(dfp.index)
+        dfp = pd.read_excel(data_file)
+        if "date" in dfp.columns:
+            dfp["date"] = pd.to_datetime(dfp["date"])
+            dfp = dfp.set_index("date").sort_index()
+        else:
+            dfp.index = pd.to_datetime(dfp.index)
 
-    price = dfp[price_col].astype(float)
+        price = dfp[price_col].astype(float)
 
     # ---- Grid definitions ----
     rsi_lengths = [3, 4, 5]
@@ -11,6 +11,8 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 
+from src.core.metrics import metrics_dict
+
 
 def blend_sleeves_equal_weight(sleeve_pnls: Dict[str, pd.Series]) -> pd.Series:
     """
@@ -53,25 +55,12 @@ def calculate_sleeve_attribution(
     
     def calc_metrics(pnl: pd.Series) -> Dict:
         """Calculate key metrics for a PnL series"""
-        pnl = pnl.dropna()
-        if len(pnl) == 0:
-            return {
-                'sharpe': 0.0,
-                'annual_return': 0.0,
-                'annual_vol': 0.0,
-                'days': 0
-            }
-        
-        mean_ret = pnl.mean()
-        std_ret = pnl.std()
-        
-        sharpe = (mean_ret / std_ret) * np.sqrt(252) if std_ret > 0 else 0.0
-        
+        m = metrics_dict(pnl)
         return {
-            'sharpe': float(sharpe),
-            'annual_return': float(mean_ret * 252),
-            'annual_vol': float(std_ret * np.sqrt(252)),
-            'days': int(len(pnl))
+            'sharpe': m['sharpe'],
+            'annual_return': m['mean_return'],  # Arithmetic (mean × 252)
+            'annual_vol': m['annual_vol'],
+            'days': m['obs']
         }
     
     attribution = {}
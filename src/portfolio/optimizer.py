@@ -0,0 +1,287 @@
+"""
+Portfolio Weight Optimizer - N-Sleeve Constrained Weights
+----------------------------------------------------------
+Max-Sharpe, min-variance and max-diversification weights for any number of
+sleeves, under sum-to-one, per-sleeve bounds and fixed weights.
+
+Grids (see weight_search.py) stop scaling past three or four sleeves, so
+this solves the problem directly: projected gradient descent with analytic
+gradients of each objective on the sleeve mean vector / covariance, and an
+exact projection onto {sum(w) = 1, lower <= w <= upper}. Fixed weights are
+removed from the free variables and reduce the budget the others share.
+
+Objectives (w = weights, mu = mean daily PnL, Σ = covariance, s = sqrt(diag Σ)):
+    max_sharpe           maximize  w·mu / sqrt(w'Σw)
+    min_variance         minimize  w'Σw
+    max_diversification  maximize  w·s / sqrt(w'Σw)
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.portfolio.weight_search import blend_moments
+
+
+OBJECTIVES = ('max_sharpe', 'min_variance', 'max_diversification')
+
+
+def load_component_pnls(
+    components: Dict[str, dict],
+    base_path: Path = Path('.'),
+) -> pd.DataFrame:
+    """
+    Load sleeve PnLs from a YAML `components` block.
+
+    Each component needs `path` (daily_series.csv relative to base_path) and
+    optionally `pnl_col` (default 'pnl_gross').
+
+    Args:
+        components: {sleeve name: {'path': ..., 'pnl_col': ...}}
+        base_path: Root that component paths are relative to
+
+    Returns:
+        pd.DataFrame: PnL per sleeve over the date range all sleeves cover
+            (latest start to earliest end); a missing PnL inside that range
+            means the sleeve was flat and is filled with 0, as in blend_moments
+    """
+    pnls = {}
+    for name, component in components.items():
+        file_path = Path(base_path) / component['path']
+        if not file_path.exists():
+            raise FileNotFoundError(f"Component file not found: {file_path}")
+
+        pnl_col = component.get('pnl_col', 'pnl_gross')
+        df = pd.read_csv(file_path, parse_dates=['date'], index_col='date')
+        if pnl_col not in df.columns:
+            raise KeyError(f"PnL column '{pnl_col}' not found in {file_path}")
+        pnls[name] = df[pnl_col]
+
+    start = max(pnl.first_valid_index() for pnl in pnls.values())
+    end = min(pnl.last_valid_index() for pnl in pnls.values())
+    return pd.DataFrame(pnls).sort_index().loc[start:end].fillna(0)
+
+
+def project_to_capped_simplex(
+    v: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    total: float = 1.0,
+) -> np.ndarray:
+    """
+    Euclidean projection onto {sum(w) = total, lower <= w <= upper}.
+
+    The projection is clip(v - tau, lower, upper) for the shift tau that
+    makes the weights sum to total; the sum is monotone in tau, so tau is
+    found by bisection.
+    """
+    lo = np.min(v - upper)
+    hi = np.max(v - lower)
+    for _ in range(200):
+        tau = 0.5 * (lo + hi)
+        if np.clip(v - tau, lower, upper).sum() > total:
+            lo = tau
+        else:
+            hi = tau
+        if hi - lo < 1e-15:
+            break
+    return np.clip(v - 0.5 * (lo + hi), lower, upper)
+
+
+def _objective(
+    name: str,
+    mean: np.ndarray,
+    cov: np.ndarray,
+):
+    """
+    Objective to MINIMIZE and its analytic gradient for a weight vector.
+
+    Returns:
+        f(w) -> (value, gradient)
+    """
+    if name == 'min_variance':
+        def f(w):
+            cov_w = cov @ w
+            return w @ cov_w, 2 * cov_w
+        return f
+
+    # Ratio objectives: -(w·a) / sqrt(w'Σw)
+    a = mean if name == 'max_sharpe' else np.sqrt(np.diag(cov))
+
+    def f(w):
+        cov_w = cov @ w
+        var = w @ cov_w
+        if var <= 0:
+            return 0.0, -a
+        std = np.sqrt(var)
+        numer = w @ a
+        return -numer / std, -(a / std - numer * cov_w / (std ** 3))
+    return f
+
+
+def _projected_gradient(
+    f,
+    w0: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    total: float,
+    max_iter: int,
+    tol: float,
+) -> Tuple[np.ndarray, int, bool]:
+    """
+    Projected gradient descent with backtracking line search.
+
+    The step grows ×2 after each accepted move and halves until the
+    projected step gives sufficient decrease, so it adapts to the scale of
+    daily PnL moments without tuning.
+    """
+    w = project_to_capped_simplex(w0, lower, upper, total)
+    value, grad = f(w)
+    step = 1.0
+
+    for iteration in range(1, max_iter + 1):
+        step *= 2
+        while True:
+            w_new = project_to_capped_simplex(w - step * grad, lower, upper, total)
+            move = w_new - w
+            new_value, new_grad = f(w_new)
+            if new_value <= value + grad @ move + (move @ move) / (2 * step) or step < 1e-20:
+                break
+            step *= 0.5
+
+        w, value, grad = w_new, new_value, new_grad
+        if np.max(np.abs(move)) < tol:
+            return w, iteration, True
+
+    return w, max_iter, False
+
+
+def optimize_weights(
+    pnls: pd.DataFrame,
+    objective: str = 'max_sharpe',
+    bounds: Optional[Dict[str, Sequence[float]]] = None,
+    fixed: Optional[Dict[str, float]] = None,
+    periods_per_year: int = 252,
+    max_iter: int = 10000,
+    tol: float = 1e-10,
+) -> Dict:
+    """
+    Optimal long-only, fully invested sleeve weights.
+
+    Args:
+        pnls: Daily PnL, one column per sleeve (NaN = flat, as in blends)
+        objective: 'max_sharpe', 'min_variance' or 'max_diversification'
+        bounds: {sleeve: (min, max)}; unlisted sleeves use (0, 1)
+        fixed: {sleeve: weight} held exactly (excluded from optimization)
+        periods_per_year: Annualization factor
+        max_iter: Iteration cap for the gradient solver
+        tol: Stop when no weight moves more than this
+
+    Returns:
+        Dict with:
+            weights: {sleeve: weight}
+            sharpe, annual_return, annual_vol: Blend statistics
+            diversification_ratio: w·s / sqrt(w'Σw)
+            iterations, converged: Solver diagnostics
+    """
+    mean, cov = blend_moments(pnls)
+    return optimize_weights_from_moments(
+        mean, cov, list(pnls.columns),
+        objective=objective,
+        bounds=bounds,
+        fixed=fixed,
+        periods_per_year=periods_per_year,
+        max_iter=max_iter,
+        tol=tol,
+    )
+
+
+def optimize_weights_from_moments(
+    mean: np.ndarray,
+    cov: np.ndarray,
+    names: Sequence[str],
+    objective: str = 'max_sharpe',
+    bounds: Optional[Dict[str, Sequence[float]]] = None,
+    fixed: Optional[Dict[str, float]] = None,
+    periods_per_year: int = 252,
+    max_iter: int = 10000,
+    tol: float = 1e-10,
+) -> Dict:
+    """
+    optimize_weights() on precomputed sleeve moments.
+
+    For callers that maintain mean/covariance themselves (e.g. walk-forward
+    refits from running sums) and never build the PnL window.
+
+    Args:
+        mean: Sleeve mean daily PnL, shape (n_sleeves,)
+        cov: Sleeve covariance, shape (n_sleeves, n_sleeves)
+        names: Sleeve names, in column order
+        (other arguments as optimize_weights)
+
+    Returns:
+        Dict: Same as optimize_weights()
+    """
+    assert objective in OBJECTIVES, f"objective must be one of {OBJECTIVES}, got {objective}"
+    names = list(names)
+    bounds = bounds or {}
+    fixed = fixed or {}
+
+    unknown = (set(bounds) | set(fixed)) - set(names)
+    if unknown:
+        raise KeyError(f"Unknown sleeves in bounds/fixed: {sorted(unknown)}")
+
+    # ========== SPLIT FIXED / FREE SLEEVES ==========
+    is_free = np.array([name not in fixed for name in names])
+    w_fixed = np.array([float(fixed.get(name, 0.0)) for name in names])
+    budget = 1.0 - w_fixed.sum()
+
+    lower = np.array([float(bounds.get(name, (0.0, 1.0))[0]) for name in names])[is_free]
+    upper = np.array([float(bounds.get(name, (0.0, 1.0))[1]) for name in names])[is_free]
+
+    if np.any(lower > upper) or not lower.sum() - 1e-12 <= budget <= upper.sum() + 1e-12:
+        raise ValueError(
+            f"Infeasible constraints: free sleeves must sum to {budget:.4f} "
+            f"within bounds summing to [{lower.sum():.4f}, {upper.sum():.4f}]"
+        )
+
+    # ========== SOLVE OVER FREE SLEEVES ==========
+    iterations, converged = 0, True
+    weights = w_fixed.copy()
+
+    if is_free.any():
+        full_f = _objective(objective, mean, cov)
+
+        def free_f(w_free):
+            w = w_fixed.copy()
+            w[is_free] = w_free
+            value, grad = full_f(w)
+            return value, grad[is_free]
+
+        w0 = np.full(is_free.sum(), budget / is_free.sum())
+        w_free, iterations, converged = _projected_gradient(
+            free_f, w0, lower, upper, budget, max_iter, tol
+        )
+        weights[is_free] = w_free
+
+    # ========== BLEND STATISTICS ==========
+    blend_mean = weights @ mean
+    blend_std = np.sqrt(max(weights @ cov @ weights, 0.0))
+    sharpe = blend_mean / blend_std * np.sqrt(periods_per_year) if blend_std > 0 else 0.0
+    div_ratio = weights @ np.sqrt(np.diag(cov)) / blend_std if blend_std > 0 else 0.0
+
+    return {
+        'objective': objective,
+        'weights': {name: float(w) for name, w in zip(names, weights)},
+        'sharpe': float(sharpe),
+        'annual_return': float(blend_mean * periods_per_year),
+        'annual_vol': float(blend_std * np.sqrt(periods_per_year)),
+        'diversification_ratio': float(div_ratio),
+        'iterations': int(iterations),
+        'converged': bool(converged),
+    }
@@ -7,9 +7,31 @@ from .blender import (
     calculate_sleeve_attribution,
     calculate_correlation_matrix
 )
+from .weight_search import (
+    simplex_grid,
+    blend_moments,
+    blend_sharpes,
+    search_blend_weights
+)
+from .optimizer import (
+    load_component_pnls,
+    optimize_weights
+)
+from .walk_forward import (
+    RunningMoments,
+    walk_forward_weights
+)
 
 __all__ = [
     'blend_sleeves_equal_weight',
     'calculate_sleeve_attribution',
-    'calculate_correlation_matrix'
+    'calculate_correlation_matrix',
+    'simplex_grid',
+    'blend_moments',
+    'blend_sharpes',
+    'search_blend_weights',
+    'load_component_pnls',
+    'optimize_weights',
+    'RunningMoments',
+    'walk_forward_weights'
 ]
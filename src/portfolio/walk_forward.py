@@ -0,0 +1,197 @@
+"""
+Walk-Forward Weight Re-Estimation
+----------------------------------
+Re-fit blend weights through time instead of fitting once on IS and
+freezing them. At every refit date the optimizer sees only PnL strictly
+before that date, and the weights it returns are held until the next
+refit, so the stitched PnL is out-of-sample throughout.
+
+Design:
+- Windows: expanding (all history) or rolling (last `lookback` bars)
+- Moments from running sums: cumulative Σx and Σxxᵀ are built once, so
+  any window's mean/covariance is a difference of two prefix sums. No
+  refit touches the PnL data again.
+- Refits are independent, so they can run in a process pool (n_jobs > 1,
+  opt-in); each task ships only a mean vector and a covariance matrix.
+
+Author: Systematic Trading Team
+Date: November 2025
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.portfolio.optimizer import optimize_weights_from_moments
+
+
+class RunningMoments:
+    """
+    Prefix sums of sleeve PnL and its outer products.
+
+    Window [start, end) moments are differences of the running sums at
+    end and start, i.e. O(sleeves²) per window regardless of its length.
+    Missing PnL counts as 0 (flat), as in the blend helpers.
+
+    The sums are taken on PnL minus its full-sample column means, so
+    Σxxᵀ - n·x̄x̄ᵀ subtracts two small numbers rather than two large ones
+    (no cancellation on long or trending series).
+    """
+
+    def __init__(self, pnls: pd.DataFrame):
+        x = pnls.fillna(0).to_numpy(dtype=float)
+        n, k = x.shape
+        self.n_bars = n
+        self.center = x.mean(axis=0) if n else np.zeros(k)
+        x = x - self.center
+
+        self.sum = np.zeros((n + 1, k))
+        self.sum_sq = np.zeros((n + 1, k, k))
+        np.cumsum(x, axis=0, out=self.sum[1:])
+        np.cumsum(x[:, :, None] * x[:, None, :], axis=0, out=self.sum_sq[1:])
+
+    def window(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean vector and covariance (ddof=1) of bars [start, end).
+
+        Returns:
+            mean: Shape (n_sleeves,)
+            cov: Shape (n_sleeves, n_sleeves)
+        """
+        n = end - start
+        assert n >= 2, f"window needs at least 2 bars, got {n}"
+        total = self.sum[end] - self.sum[start]
+        total_sq = self.sum_sq[end] - self.sum_sq[start]
+        mean = total / n
+        cov = (total_sq - n * np.outer(mean, mean)) / (n - 1)
+        return mean + self.center, cov
+
+
+def refit_schedule(
+    index: pd.DatetimeIndex,
+    refit_frequency: Union[str, int] = 'M',
+    min_history: int = 252,
+) -> np.ndarray:
+    """
+    Bar positions at which weights are re-fitted.
+
+    Args:
+        index: Trading dates of the PnL panel
+        refit_frequency: Calendar period ('M', 'Q', 'Y': first bar of each
+            period) or a number of bars
+        min_history: First refit needs at least this many bars of history
+
+    Returns:
+        np.ndarray: Sorted bar positions (each >= min_history)
+    """
+    n = len(index)
+    if isinstance(refit_frequency, (int, np.integer)):
+        return np.arange(min_history, n, int(refit_frequency))
+
+    periods = index.to_period(refit_frequency)
+    new_period = np.r_[True, periods[1:] != periods[:-1]]
+    positions = np.flatnonzero(new_period)
+    return positions[positions >= min_history]
+
+
+def _fit_window(task: tuple) -> Dict:
+    """Process-pool worker: one refit from precomputed moments."""
+    mean, cov, names, kwargs = task
+    return optimize_weights_from_moments(mean, cov, names, **kwargs)
+
+
+def walk_forward_weights(
+    pnls: pd.DataFrame,
+    objective: str = 'max_sharpe',
+    window: str = 'expanding',
+    lookback: int = 756,
+    refit_frequency: Union[str, int] = 'M',
+    min_history: int = 252,
+    bounds: Optional[Dict[str, Sequence[float]]] = None,
+    fixed: Optional[Dict[str, float]] = None,
+    n_jobs: int = 1,
+) -> Dict:
+    """
+    Walk-forward blend weights and the stitched out-of-sample PnL.
+
+    Args:
+        pnls: Daily PnL, one column per sleeve, DatetimeIndex
+        objective: Optimizer objective (see optimizer.OBJECTIVES)
+        window: 'expanding' or 'rolling'
+        lookback: Rolling window length in bars (ignored when expanding)
+        refit_frequency: 'M' / 'Q' / 'Y' or a number of bars
+        min_history: Bars required before the first refit
+        bounds: {sleeve: (min, max)} per-sleeve bounds
+        fixed: {sleeve: weight} held exactly
+        n_jobs: Refit worker processes (1 = no pool). Opt in from the
+            optimizer YAML (walk_forward.n_jobs); pools pay off only for
+            many refits with many sleeves.
+
+    Returns:
+        Dict with:
+            weights: Weight path, one row per refit date (effective date)
+            daily_weights: Weights in force on each OOS bar
+            pnl: Stitched OOS PnL (weights fitted strictly before each bar)
+            fits: Per-refit diagnostics (window, in-window Sharpe, solver)
+    """
+    assert window in ('expanding', 'rolling'), \
+        f"window must be 'expanding' or 'rolling', got {window}"
+
+    names = list(pnls.columns)
+    schedule = refit_schedule(pnls.index, refit_frequency, max(min_history, 2))
+    if len(schedule) == 0:
+        raise ValueError(
+            f"No refit dates: {len(pnls)} bars, min_history={min_history}"
+        )
+
+    # ========== WINDOW MOMENTS FROM RUNNING SUMS ==========
+    moments = RunningMoments(pnls)
+    starts = np.zeros(len(schedule), dtype=int)
+    if window == 'rolling':
+        starts = np.maximum(schedule - lookback, 0)
+
+    fit_kwargs = {'objective': objective, 'bounds': bounds, 'fixed': fixed}
+    tasks = [
+        (*moments.window(start, end), names, fit_kwargs)
+        for start, end in zip(starts, schedule)
+    ]
+
+    # ========== REFITS (OPTIONAL PROCESS POOL) ==========
+    assert n_jobs >= 1, f"n_jobs must be >= 1, got {n_jobs}"
+    if n_jobs == 1:
+        fits = [_fit_window(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (4 * n_jobs))
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            fits = list(pool.map(_fit_window, tasks, chunksize=chunksize))
+
+    # ========== WEIGHT PATH & STITCHED PNL ==========
+    refit_dates = pnls.index[schedule]
+    weights = pd.DataFrame(
+        [[fit['weights'][name] for name in names] for fit in fits],
+        index=refit_dates,
+        columns=names,
+    )
+    weights.index.name = 'date'
+
+    oos = pnls.iloc[schedule[0]:]
+    daily_weights = weights.reindex(oos.index).ffill()
+    pnl = (oos.fillna(0) * daily_weights).sum(axis=1)
+    pnl.name = 'pnl'
+
+    fit_table = pd.DataFrame({
+        'window_start': pnls.index[starts],
+        'window_end': pnls.index[schedule - 1],
+        'in_sample_sharpe': [fit['sharpe'] for fit in fits],
+        'iterations': [fit['iterations'] for fit in fits],
+        'converged': [fit['converged'] for fit in fits],
+    }, index=refit_dates)
+
+    return {
+        'weights': weights,
+        'daily_weights': daily_weights,
+        'pnl': pnl,
+        'fits': fit_table,
+    }
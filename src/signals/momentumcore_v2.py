@@ -12,6 +12,9 @@ MomentumCore v2 Signal Generator - PURE SIGNAL
 Classic long-term momentum (12-month lookback) for copper markets.
 Captures persistent directional trends.
 
+Lookback studies: generate_momentum_surface() returns positions for many
+horizons in one array; generate_blended_momentum_signal() blends them.
+
 Expected Performance (after vol targeting to 10%): 
   Sharpe ~0.50-0.55 unconditional
 """
@@ -67,3 +70,68 @@ def generate_momentum_signal(
     # Vol targeting will scale this to hit 10% vol
 
     return pos_raw
+
+
+def generate_momentum_surface(
+    df: pd.DataFrame,
+    lookbacks=range(21, 505, 21),
+) -> np.ndarray:
+    """
+    Sign-of-past-return positions for many lookbacks at once.
+
+    Works on one log-price array: each horizon's past return is a strided
+    difference log(P_t) - log(P_t-L), which has the same sign as
+    P_t / P_t-L - 1 for positive prices. Same T-1 lag and warmup handling
+    as generate_momentum_signal().
+
+    Args:
+        df: DataFrame with 'price' column
+        lookbacks: Momentum lookbacks in days (default: 21, 42, ..., 504)
+
+    Returns:
+        np.ndarray: Positions in {-1, 0, +1}, shape (n_bars, n_lookbacks);
+            column j corresponds to lookbacks[j]
+    """
+    lookbacks = [int(lb) for lb in np.atleast_1d(lookbacks)]
+    log_price = np.log(df["price"].to_numpy(dtype=float))
+    n = len(log_price)
+
+    # ========== PAST RETURNS (bars × lookbacks) ==========
+    past_return = np.full((n, len(lookbacks)), np.nan)
+    for j, lb in enumerate(lookbacks):
+        if lb < n:
+            past_return[lb:, j] = log_price[lb:] - log_price[:-lb]
+
+    # Use T-1 signal for T position (no look-ahead)
+    past_return = np.vstack([np.full((1, len(lookbacks)), np.nan), past_return[:-1]])
+
+    # Sign of past return, flat during warmup
+    return np.nan_to_num(np.sign(past_return), nan=0.0)
+
+
+def generate_blended_momentum_signal(
+    df: pd.DataFrame,
+    lookbacks=(21, 63, 126, 252),
+    weights=None,
+) -> pd.Series:
+    """
+    Multi-horizon TSMOM: weighted blend of sign-of-past-return positions.
+
+    Args:
+        df: DataFrame with 'price' column
+        lookbacks: Horizons to blend (default: 1, 3, 6, 12 months)
+        weights: Weight per horizon (default: equal; normalized to sum to 1)
+
+    Returns:
+        pd.Series: Blended position signal in [-1, +1]
+    """
+    surface = generate_momentum_surface(df, lookbacks)
+
+    if weights is None:
+        weights = np.ones(surface.shape[1])
+    weights = np.asarray(weights, dtype=float)
+    assert len(weights) == surface.shape[1], \
+        f"Need one weight per lookback ({surface.shape[1]}), got {len(weights)}"
+    weights = weights / weights.sum()
+
+    return pd.Series(surface @ weights, index=df.index)
@@ -29,6 +29,9 @@ Expected Performance (after optimization & vol targeting to 10%):
 import numpy as np
 import pandas as pd
 
+from src.core.indicator_cache import cached_indicator
+from src.core.state_machine import hysteresis_positions, hold_on_schedule
+
 
 def calculate_adx_ohlc(
     high: pd.Series,
@@ -57,7 +60,27 @@ def calculate_adx_ohlc(
         
     Returns:
         pd.Series: ADX values (higher = stronger trend)
+        
+    Note:
+        Results are memoized in the process-wide indicator cache, so the
+        signal, regime statistics, validation and optimizer share one ADX
+        computation per (OHLC data, window).
     """
+    return cached_indicator(
+        'adx_ohlc',
+        (high, low, close),
+        {'window': window},
+        lambda: _compute_adx_ohlc(high, low, close, window),
+    )
+
+
+def _compute_adx_ohlc(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    window: int,
+) -> pd.Series:
+    """Uncached OHLC ADX (see calculate_adx_ohlc)."""
     # True Range (uses actual high-low spread)
     tr1 = high - low
     tr2 = (high - close.shift(1)).abs()
@@ -157,7 +180,6 @@ def generate_rangefader_signal(
     price = df["price"]
     high = df["high"]
     low = df["low"]
-    n = len(df)
     
     # ========== STEP 1: CALCULATE ADX (REGIME DETECTOR) - OHLC ==========
     # CRITICAL: This is the fix from V4
@@ -172,56 +194,21 @@ def generate_rangefader_signal(
     zscore = (price - sma) / rolling_std
     
     # ========== STEP 3: GENERATE MEAN REVERSION POSITIONS ==========
-    position_raw = np.zeros(n)
-    current_state = 0  # -1 = short, 0 = flat, +1 = long
-    
-    for i in range(max(lookback_window, adx_window * 2), n):
-        z = zscore.iloc[i]
-        choppy = is_choppy.iloc[i]
-        
-        if np.isnan(z) or np.isnan(choppy):
-            position_raw[i] = 0
-            continue
-        
-        # CRITICAL: Only trade in choppy markets
-        # This logic is CORRECT - trades when choppy = True (ADX < threshold)
-        if not choppy:
-            current_state = 0
-            position_raw[i] = 0
-            continue
-        
-        # Mean reversion state machine (only when choppy)
-        if current_state == 0:  # FLAT - need signal to enter
-            if z > zscore_entry:
-                current_state = -1  # SHORT (price too high)
-            elif z < -zscore_entry:
-                current_state = 1  # LONG (price too low)
-        
-        elif current_state == 1:  # LONG - check for exit or flip
-            if z > zscore_entry:  # Price flipped to overextended up
-                current_state = -1  # FLIP TO SHORT
-            elif z > -zscore_exit:  # Back to fair value
-                current_state = 0  # EXIT TO FLAT
-        
-        elif current_state == -1:  # SHORT - check for exit or flip
-            if z < -zscore_entry:  # Price flipped to overextended down
-                current_state = 1  # FLIP TO LONG
-            elif z < zscore_exit:  # Back to fair value
-                current_state = 0  # EXIT TO FLAT
-        
-        position_raw[i] = current_state
+    # Hysteresis state machine runs as an array kernel (see state_machine.py):
+    #   FLAT → SHORT/LONG when |Z| > entry (only when choppy)
+    #   LONG/SHORT → FLAT when Z back inside exit band, flip on opposite entry
+    #   ANY → FLAT when ADX >= threshold
+    warmup = max(lookback_window, adx_window * 2)
+    position_raw = hysteresis_positions(
+        zscore.to_numpy(dtype=float),
+        is_choppy.to_numpy(dtype=bool),
+        entry=zscore_entry,
+        exit=zscore_exit,
+        start=warmup,
+    ).astype(float)
     
     # ========== STEP 4: UPDATE FREQUENCY ==========
-    if update_frequency > 1:
-        position_final = np.zeros(n)
-        last_position = 0
-        
-        for i in range(n):
-            if i % update_frequency == 0 or i < max(lookback_window, adx_window * 2):
-                last_position = position_raw[i]
-            position_final[i] = last_position
-    else:
-        position_final = position_raw
+    position_final = hold_on_schedule(position_raw, update_frequency, warmup=warmup)
     
     # Convert to series
     position_final = pd.Series(position_final, index=df.index)
@@ -39,19 +39,18 @@ import yaml
 
 # Add paths for imports
 project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))  # src.core.* imports inside core modules
 sys.path.insert(0, str(project_root / "src" / "core"))
 sys.path.insert(0, str(project_root / "src" / "signals"))
 
 from contract import build_core
+from src.core.canonical_store import read_canonical
 from tightstocks_v1 import generate_tightstocks_v1_signal  # Same signal logic as v1
 
 
 def load_canonical_csv(path: str, required_cols: list) -> pd.DataFrame:
-    """Load and validate canonical CSV format."""
-    if not Path(path).exists():
-        raise FileNotFoundError(f"CSV not found: {path}")
-    
-    df = pd.read_csv(path, parse_dates=['date'])
+    """Load and validate canonical CSV format (store-backed, see read_canonical)."""
+    df = read_canonical(path)
     
     # Validate required columns
     missing = [c for c in required_cols if c not in df.columns]
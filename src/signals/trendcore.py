@@ -4,11 +4,16 @@ TrendCore Signal Logic (Layer B)
 ---------------------------------
 Simple moving average crossover — the backbone trend-following sleeve.
 Returns only: pos_raw (±1 or 0)
+
+generate_trendcore_grid() builds the full MA lookback × buffer position
+tensor for stability maps from a single cumulative-sum MA surface.
 """
 
 import numpy as np
 import pandas as pd
 
+from src.core.indicators import moving_average_surface
+
 
 def generate_trendcore_signal(
     df: pd.DataFrame,
@@ -60,3 +65,51 @@ def generate_trendcore_signal(
     # Flat: price in buffer zone (already initialized to 0)
 
     return pos_raw
+
+
+def generate_trendcore_grid(
+    df: pd.DataFrame,
+    ma_lookbacks=range(5, 401),
+    buffer_pcts=(0.0,),
+    ma_shift: int = 1,
+) -> np.ndarray:
+    """
+    Generate TrendCore positions for every (ma_lookback, buffer_pct) pair.
+
+    All MAs come from one cumulative-sum surface (see
+    moving_average_surface), and buffers are a broadcast comparison, so a
+    full stability map costs about the same as a single signal.
+
+    Args:
+        df: DataFrame with 'price' column
+        ma_lookbacks: MA windows to test (default: 5..400 days)
+        buffer_pcts: Buffer zones to test (e.g. [0.0, 0.005, 0.01])
+        ma_shift: Shift MA by N bars (1 = use T-1 data)
+
+    Returns:
+        np.ndarray: int8 positions in {-1, 0, +1} of shape
+            (n_bars, n_lookbacks, n_buffers); [:, i, k] matches
+            generate_trendcore_signal(df, ma_lookbacks[i], buffer_pcts[k])
+    """
+    price = df["price"]
+    ma_lookbacks = [int(w) for w in np.atleast_1d(ma_lookbacks)]
+    buffers = np.atleast_1d(np.asarray(buffer_pcts, dtype=float))
+
+    # ========== MOVING AVERAGE SURFACE ==========
+    ma = moving_average_surface(price, ma_lookbacks)  # (bars × lookbacks)
+
+    # Shift MA by N bars (use info up to T-N)
+    if ma_shift > 0:
+        ma = np.vstack([np.full((ma_shift, ma.shape[1]), np.nan), ma[:-ma_shift]])
+
+    # ========== BUFFER ZONES (bars × lookbacks × buffers) ==========
+    upper_threshold = ma[:, :, None] * (1 + buffers)
+    lower_threshold = ma[:, :, None] * (1 - buffers)
+
+    # ========== GENERATE SIGNAL ==========
+    p = price.to_numpy(dtype=float)[:, None, None]
+    pos_raw = np.zeros(upper_threshold.shape, dtype=np.int8)
+    pos_raw[p > upper_threshold] = 1
+    pos_raw[p < lower_threshold] = -1
+
+    return pos_raw
@@ -19,6 +19,78 @@ Expected Performance (after vol targeting to 10%):
 import numpy as np
 import pandas as pd
 
+from src.core.indicators import rolling_percentile_rank, rolling_vol
+
+
+def calculate_range_scale(
+    price: pd.Series,
+    range_lookback: int = 70,
+    range_threshold: float = 0.10,
+) -> pd.Series:
+    """
+    Rangebound filter: 0.3x position in a tight range, 1.0x in a wide range.
+    
+    Args:
+        price: Price series
+        range_lookback: Lookback for rolling high/low
+        range_threshold: Range (as % of low) below which positions shrink
+        
+    Returns:
+        pd.Series: Scale in [0.3, 1.0] (NaN during warmup)
+    """
+    rolling_high = price.rolling(range_lookback).max()
+    rolling_low = price.rolling(range_lookback).min()
+    price_range_pct = (rolling_high - rolling_low) / rolling_low
+    
+    return np.clip(
+        (price_range_pct - range_threshold) / range_threshold,
+        0.3,  # Minimum 30% position
+        1.0,  # Full position
+    )
+
+
+def calculate_trend_quality(
+    returns: pd.Series,
+    lookback: int = 15,
+) -> pd.Series:
+    """
+    Directional consistency: 0 = random walk, 1 = every day the same way.
+    
+    Fraction of up days in the window is a rolling sum of a boolean array
+    (windows containing a NaN return stay NaN, as with rolling().apply()).
+    
+    Args:
+        returns: Daily returns
+        lookback: Window in days
+        
+    Returns:
+        pd.Series: Trend quality in [0, 1]
+    """
+    up_days = (returns > 0).astype(float).where(returns.notna())
+    recent_rets = up_days.rolling(lookback).sum() / lookback
+    
+    return (recent_rets - 0.5).abs() * 2
+
+
+def calculate_vol_scale(
+    returns: pd.Series,
+    vol_lookback: int = 63,
+) -> np.ndarray:
+    """
+    Vol regime filter: 0.7x when vol is in its top quartile over the past year.
+    
+    Args:
+        returns: Daily returns
+        vol_lookback: Window for realized vol
+        
+    Returns:
+        np.ndarray: Scale in {0.7, 1.0}
+    """
+    vol_60d = rolling_vol(returns, vol_lookback)
+    vol_percentile = rolling_percentile_rank(vol_60d, 252, min_periods=63)
+    
+    return np.where(vol_percentile > 0.75, 0.7, 1.0)
+
 
 def generate_trendmedium_signal(
     df: pd.DataFrame,
@@ -71,40 +143,18 @@ def generate_trendmedium_signal(
 
     # ========== RANGEBOUND DETECTION ==========
     # Use shorter lookback (70d vs 100d) for medium-term focus
-    rolling_high = price.rolling(range_lookback).max()
-    rolling_low = price.rolling(range_lookback).min()
-    price_range_pct = (rolling_high - rolling_low) / rolling_low
-
-    # Scale: 0.3x position in tight range, 1.0x in wide range
-    range_scale = np.clip(
-        (price_range_pct - range_threshold) / range_threshold,
-        0.3,  # Minimum 30% position
-        1.0,  # Full position
-    )
+    range_scale = calculate_range_scale(price, range_lookback, range_threshold)
 
     # ========== TREND QUALITY FILTER ==========
     # Shorter lookback (15d vs 20d) for faster adaptation
-    recent_rets = returns.rolling(trend_quality_lookback).apply(
-        lambda x: (x > 0).sum() / len(x) if len(x) > 0 else 0.5
-    )
-
-    # Convert to quality measure (0 = random, 1 = strong trend)
-    trend_quality = (recent_rets - 0.5).abs() * 2
+    trend_quality = calculate_trend_quality(returns, trend_quality_lookback)
 
     # Scale: 0.5x for weak trends, 1.0x for strong trends
     quality_scale = 0.5 + 0.5 * trend_quality
 
     # ========== VOLATILITY REGIME ==========
     # Same as TrendCore - reduce in high vol
-    vol_60d = returns.rolling(vol_lookback).std() * np.sqrt(252)
-
-    # Calculate rolling percentile
-    vol_percentile = vol_60d.rolling(252, min_periods=63).apply(
-        lambda x: pd.Series(x).rank(pct=True).iloc[-1] if len(x) > 0 else 0.5
-    )
-
-    # Scale: 0.7x in top 25% vol, 1.0x otherwise
-    vol_scale = np.where(vol_percentile > 0.75, 0.7, 1.0)
+    vol_scale = calculate_vol_scale(returns, vol_lookback)
 
     # ========== COMBINE ALL FILTERS ==========
     # Multiply base signal by all scaling factors
@@ -114,4 +164,76 @@ def generate_trendmedium_signal(
     # Expected range: -0.5 to +0.5 (due to filters)
     # Vol targeting will scale this to hit 10% vol
 
-    return pos_final
\ No newline at end of file
+    return pos_final
+
+
+def generate_trendmedium_grid(
+    df: pd.DataFrame,
+    fast_ma: list,
+    slow_ma: list,
+    trend_quality_lookback: list,
+    vol_lookback: int = 63,
+    range_threshold: float = 0.10,
+    range_lookback: int = 70,
+) -> pd.DataFrame:
+    """
+    Generate TrendMedium v2 positions for a parameter grid in one pass.
+    
+    Every (fast_ma, slow_ma, trend_quality_lookback) combination is built
+    from shared pieces: each MA window and each quality lookback is computed
+    once, the range and vol scales once for the whole grid, and positions
+    are a broadcast product of (dates × MA pairs) and (dates × lookbacks).
+    Each column equals generate_trendmedium_signal() for that combination.
+    
+    Args:
+        df: DataFrame with 'price' column
+        fast_ma: Fast MA windows to test
+        slow_ma: Slow MA windows to test
+        trend_quality_lookback: Trend quality lookbacks to test
+        vol_lookback: Lookback for volatility calculation
+        range_threshold: Threshold for rangebound detection
+        range_lookback: Lookback for price range
+        
+    Returns:
+        pd.DataFrame: Positions, index = df.index, columns = MultiIndex
+            (fast_ma, slow_ma, trend_quality_lookback)
+    """
+    price = df["price"]
+    returns = price.pct_change()
+    
+    fast_ma = [int(w) for w in np.atleast_1d(fast_ma)]
+    slow_ma = [int(w) for w in np.atleast_1d(slow_ma)]
+    quality_lookbacks = [int(w) for w in np.atleast_1d(trend_quality_lookback)]
+    
+    # ========== SHARED PIECES ==========
+    mas = {
+        w: price.rolling(w, min_periods=w).mean().shift(1).to_numpy(dtype=float)
+        for w in sorted(set(fast_ma) | set(slow_ma))
+    }
+    range_scale = calculate_range_scale(price, range_lookback, range_threshold).to_numpy()
+    vol_scale = calculate_vol_scale(returns, vol_lookback)
+    quality_scale = np.column_stack([
+        (0.5 + 0.5 * calculate_trend_quality(returns, lb)).to_numpy()
+        for lb in quality_lookbacks
+    ])  # (dates × lookbacks)
+    
+    # ========== BASE SIGNAL PER MA PAIR (dates × pairs) ==========
+    pairs = [(f, s) for f in fast_ma for s in slow_ma]
+    ma_fast = np.column_stack([mas[f] for f, _ in pairs])
+    ma_slow = np.column_stack([mas[s] for _, s in pairs])
+    pos_raw = np.where(ma_fast > ma_slow, 1.0, np.where(ma_fast < ma_slow, -1.0, 0.0))
+    
+    # ========== COMBINE (dates × pairs × lookbacks) ==========
+    pos_final = (
+        (pos_raw * range_scale[:, None])[:, :, None]
+        * quality_scale[:, None, :]
+        * vol_scale[:, None, None]
+    )
+    
+    columns = pd.MultiIndex.from_tuples(
+        [(f, s, lb) for f, s in pairs for lb in quality_lookbacks],
+        names=['fast_ma', 'slow_ma', 'trend_quality_lookback'],
+    )
+    return pd.DataFrame(
+        pos_final.reshape(len(df), -1), index=df.index, columns=columns
+    )
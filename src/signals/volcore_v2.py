@@ -35,6 +35,9 @@ Returns: pos_raw ∈ {-1, 0, +1} (short/flat/long)
 import numpy as np
 import pandas as pd
 
+from src.core.indicators import rolling_vol
+from src.core.state_machine import min_hold_positions, min_hold_positions_batch
+
 
 def calculate_realized_vol(returns: pd.Series, window: int = 21) -> pd.Series:
     """
@@ -47,7 +50,7 @@ def calculate_realized_vol(returns: pd.Series, window: int = 21) -> pd.Series:
     Returns:
         Annualized realized vol in percentage points
     """
-    rv = returns.rolling(window=window).std() * np.sqrt(252) * 100
+    rv = rolling_vol(returns, window) * 100
     return rv
 
 
@@ -144,59 +147,73 @@ def generate_volcore_v2_signal(
     df['vol_spread_zscore'] = zscore
     
     # ========== GENERATE POSITIONS WITH PERSISTENCE ==========
-    pos_raw = pd.Series(0.0, index=df.index)
+    # Use T-1 z-score for T decision (no forward bias)
+    # Hysteresis + min holding period run as an array kernel (state_machine.py)
+    positions = min_hold_positions(
+        zscore.shift(1).to_numpy(dtype=float),
+        short_entry=short_entry_zscore,
+        long_entry=long_entry_zscore,
+        short_exit=short_exit_zscore,
+        long_exit=long_exit_zscore,
+        min_hold_days=min_hold_days,
+        longs_only=longs_only,
+        shorts_only=shorts_only,
+    )
+    pos_raw = pd.Series(positions.astype(float), index=df.index)
     
-    current_pos = 0
-    days_held = 0
+    return pos_raw, df
+
+
+def generate_volcore_v2_grid(
+    df: pd.DataFrame,
+    threshold_grid: list,
+    rv_window: int = 21,
+    zscore_lookback: int = 252,
+    min_hold_days: int = 5,
+    longs_only: bool = False,
+    shorts_only: bool = False,
+) -> pd.DataFrame:
+    """
+    Generate VolCore v2 positions for many threshold tuples in one pass.
     
-    for i in range(1, len(df)):
-        # Use T-1 z-score for T decision (no forward bias)
-        prev_zscore = zscore.iloc[i-1]
-        
-        if pd.isna(prev_zscore):
-            pos_raw.iloc[i] = current_pos
-            continue
-        
-        # Track holding period
-        if current_pos != 0:
-            days_held += 1
-        else:
-            days_held = 0
-        
-        # Position logic with hysteresis
-        new_pos = current_pos
-        
-        if current_pos == 0:  # Currently FLAT
-            # Check for entry signals
-            if prev_zscore > short_entry_zscore and not longs_only:
-                new_pos = -1  # Enter SHORT (high fear = justified)
-                days_held = 0
-            elif prev_zscore < long_entry_zscore and not shorts_only:
-                new_pos = 1   # Enter LONG (complacent = risk-on)
-                days_held = 0
-                
-        elif current_pos == 1:  # Currently LONG
-            if days_held >= min_hold_days:
-                # Check for exit or flip
-                if prev_zscore > long_exit_zscore:
-                    new_pos = 0  # Exit long
-                if prev_zscore > short_entry_zscore and not longs_only:
-                    new_pos = -1  # Flip to short
-                    days_held = 0
-                    
-        elif current_pos == -1:  # Currently SHORT
-            if days_held >= min_hold_days:
-                # Check for exit or flip
-                if prev_zscore < short_exit_zscore:
-                    new_pos = 0  # Exit short
-                if prev_zscore < long_entry_zscore and not shorts_only:
-                    new_pos = 1  # Flip to long
-                    days_held = 0
+    The vol spread z-score is computed once and every tuple is evaluated by
+    the batched state machine kernel, so IS/OOS threshold sweeps no longer
+    pay a full signal build per combination.
+    
+    Args:
+        df: DataFrame with columns ['ret', 'iv'] (see generate_volcore_v2_signal)
+        threshold_grid: List of (short_entry, long_entry, short_exit, long_exit)
+        rv_window: Window for realized vol calculation
+        zscore_lookback: Window for z-score standardization
+        min_hold_days: Minimum days to hold position
+        longs_only: If True, only take long positions
+        shorts_only: If True, only take short positions
         
-        pos_raw.iloc[i] = new_pos
-        current_pos = new_pos
+    Returns:
+        pd.DataFrame: Positions in {-1, 0, +1}, index = df.index,
+            one column per threshold tuple (column label = the tuple)
+    """
+    for col in ['ret', 'iv']:
+        if col not in df.columns:
+            raise ValueError(f"Missing required column '{col}'")
     
-    return pos_raw, df
+    rv = calculate_realized_vol(df['ret'], window=rv_window)
+    zscore, _ = calculate_vol_spread_zscore(df['iv'], rv, lookback=zscore_lookback)
+    
+    thresholds = np.asarray(threshold_grid, dtype=float).reshape(-1, 4)
+    positions = min_hold_positions_batch(
+        zscore.shift(1).to_numpy(dtype=float),
+        thresholds,
+        min_hold_days=min_hold_days,
+        longs_only=longs_only,
+        shorts_only=shorts_only,
+    )
+    
+    columns = pd.MultiIndex.from_arrays(
+        thresholds.T,
+        names=['short_entry', 'long_entry', 'short_exit', 'long_exit'],
+    )
+    return pd.DataFrame(positions.astype(float), index=df.index, columns=columns)
 
 
 # Backward compatibility alias
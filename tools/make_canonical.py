@@ -1,6 +1,93 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.core.canonical_store import (
+    CSV_SUFFIX,
+    STORE_FILENAME,
+    canonical_value_column,
+    pq,
+    write_canonical_store,
+)
+
+
+def extract_canonical_block(df, date_col, fields, max_drop_frac=0.05, value_column=canonical_value_column):
+    """
+    Convert several raw Excel columns to canonical frames in one pass.
+
+    The date column is parsed once and the rows are sorted once; the value
+    columns are converted to numeric together as a block. Each field then
+    keeps its own rows with a valid date and value (first row wins on
+    duplicate dates), exactly as a per-field conversion would.
+
+    Args:
+        df: Raw sheet
+        date_col: Name of date column (case-insensitive)
+        fields: Series column names (case-insensitive)
+        max_drop_frac: Warn when a field drops more than this fraction of rows
+        value_column: Field name -> canonical value column name
+
+    Returns:
+        Dict[str, pd.DataFrame]: {field: frame with 'date' + value column}
+    """
+    cols = {c.lower(): c for c in df.columns}
+    dcol = cols.get(date_col.lower(), date_col)
+    scols = [cols.get(field.lower(), field) for field in fields]
+
+    # ========== ONE PASS: DATES, ORDER, VALUES ==========
+    dates = pd.to_datetime(df[dcol], errors="coerce")
+    order = np.argsort(dates.to_numpy(), kind="stable")  # NaT sorts last
+    dates = dates.iloc[order].reset_index(drop=True)
+    values = df[scols].iloc[order].apply(pd.to_numeric, errors="coerce").reset_index(drop=True)
+
+    valid_date = dates.notna().to_numpy()
+    before = len(df)
+
+    # ========== PER FIELD: MASK ONLY ==========
+    frames = {}
+    for field, scol in zip(fields, scols):
+        value_col = value_column(field)
+        keep = valid_date & values[scol].notna().to_numpy()
+        out = pd.DataFrame({"date": dates[keep], value_col: values[scol][keep]})
+        out = out.drop_duplicates(subset=["date"])
+
+        after = len(out)
+        drop_frac = 0 if before == 0 else (before - after) / before
+        if drop_frac > max_drop_frac:
+            print(
+                f"[WARN] Dropped {before-after} rows ({drop_frac:.1%}) for {field}. Check mapping/units."
+            )
+        frames[field] = out
+
+    return frames
+
+
+def write_canonical_csvs(frames, out_dir, max_workers=None):
+    """
+    Write {field: frame} to <out_dir>/<field>.canonical.csv concurrently.
+
+    Returns:
+        Dict[str, Path]: {field: written CSV}
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {field: out_dir / f"{field}{CSV_SUFFIX}" for field in frames}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            field: pool.submit(frame.to_csv, paths[field], index=False)
+            for field, frame in frames.items()
+        }
+        for field, future in futures.items():
+            future.result()
+            value_col = [c for c in frames[field].columns if c != "date"][0]
+            print(f"[OK] {field}: wrote {len(frames[field])} rows -> {paths[field]} (column: '{value_col}')")
+
+    return paths
+
 
 def make_canonical_from_raw(df, date_col, series_col, out_csv, max_drop_frac=0.05):
     """
@@ -10,40 +97,16 @@ def make_canonical_from_raw(df, date_col, series_col, out_csv, max_drop_frac=0.0
     - 'impliedvol' or 'iv' → column named 'iv'
     - 'volume' → column named 'volume'
     - everything else → column named 'price'
-    """
-    cols = {c.lower(): c for c in df.columns}
-    dcol = cols.get(date_col.lower(), date_col)
-    scol = cols.get(series_col.lower(), series_col)
-
-    # Determine output column name based on series type
-    series_lower = series_col.lower()
-    if "impliedvol" in series_lower or series_lower.endswith("_iv"):
-        value_col = "iv"
-    elif "volume" in series_lower:
-        value_col = "volume"
-    else:
-        value_col = "price"
 
-    out = df[[dcol, scol]].rename(columns={dcol: "date", scol: value_col})
-    out["date"] = pd.to_datetime(out["date"], errors="coerce")
-    out[value_col] = pd.to_numeric(out[value_col], errors="coerce")
-
-    before = len(out)
-    out = out.dropna(subset=["date", value_col])
-    out = out.sort_values("date").drop_duplicates(subset=["date"])
-    after = len(out)
-    drop_frac = 0 if before == 0 else (before - after) / before
+    Returns the canonical frame (date + value column) that was written.
+    """
+    out = extract_canonical_block(df, date_col, [series_col], max_drop_frac)[series_col]
 
     out_csv = Path(out_csv)
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-
-    if drop_frac > max_drop_frac:
-        print(
-            f"[WARN] Dropped {before-after} rows ({drop_frac:.1%}) for {series_col}. Check mapping/units."
-        )
-
     out.to_csv(out_csv, index=False)
-    print(f"[OK] {series_col}: wrote {after} rows -> {out_csv} (column: '{value_col}')")
+    print(f"[OK] {series_col}: wrote {len(out)} rows -> {out_csv} (column: '{out.columns[1]}')")
+    return out
 
 
 def excel_to_canonical(excel_path, sheet, date_col, fields, out_dir):
@@ -53,9 +116,15 @@ def excel_to_canonical(excel_path, sheet, date_col, fields, out_dir):
         sheet_name=sheet,
         na_values=["#N/A", "N/A", "#N/A N/A", "#VALUE!", "NA", "-", ""],
     )
-    for field in fields:
-        out_csv = out_dir / f"{field}.canonical.csv"
-        make_canonical_from_raw(df, date_col, field, out_csv, max_drop_frac=0.20)
+    series = extract_canonical_block(df, date_col, fields, max_drop_frac=0.20)
+    write_canonical_csvs(series, out_dir)
+
+    # Typed columnar store (all fields, one file) for fast build startup
+    if pq is None:
+        print(f"[SKIP] pyarrow not installed: {STORE_FILENAME} not written (CSVs only)")
+    else:
+        store = write_canonical_store(series, out_dir / STORE_FILENAME)
+        print(f"[OK] canonical store: {len(series)} fields -> {store}")
 
 
 if __name__ == "__main__":
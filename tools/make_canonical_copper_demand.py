@@ -9,17 +9,36 @@ Date: November 18, 2025
 from pathlib import Path
 import pandas as pd
 
+# Shared single-pass extraction (tools/make_canonical.py)
+from make_canonical import extract_canonical_block, write_canonical_csvs
+
+
+def demand_value_column(series_col):
+    """
+    Canonical value column for demand data, from the series name:
+    - 'demand' or 'balance' or 'proxy' → 'demand_index'
+    - 'impliedvol' or 'iv' → 'iv'
+    - 'volume' → 'volume'
+    - 'stocks' → 'stocks'
+    - everything else → 'price'
+    """
+    series_lower = series_col.lower()
+    if "demand" in series_lower or "balance" in series_lower or "proxy" in series_lower:
+        return "demand_index"
+    elif "impliedvol" in series_lower or series_lower.endswith("_iv"):
+        return "iv"
+    elif "volume" in series_lower:
+        return "volume"
+    elif "stocks" in series_lower:
+        return "stocks"
+    return "price"
+
 
 def make_canonical_from_raw(df, date_col, series_col, out_csv, max_drop_frac=0.05):
     """
     Convert raw Excel data to canonical CSV format.
 
-    For demand data, auto-detects series type from column name:
-    - 'demand' or 'balance' or 'proxy' → column named 'demand_index'
-    - 'impliedvol' or 'iv' → column named 'iv'
-    - 'volume' → column named 'volume'
-    - 'stocks' → column named 'stocks'
-    - everything else → column named 'price'
+    For demand data, the value column is named by demand_value_column().
     
     Args:
         df: DataFrame with raw data
@@ -28,49 +47,17 @@ def make_canonical_from_raw(df, date_col, series_col, out_csv, max_drop_frac=0.0
         out_csv: Output path for canonical CSV
         max_drop_frac: Max fraction of rows that can be dropped (warning threshold)
     """
-    cols = {c.lower(): c for c in df.columns}
-    dcol = cols.get(date_col.lower(), date_col)
-    scol = cols.get(series_col.lower(), series_col)
-
-    # Determine output column name based on series type
-    series_lower = series_col.lower()
-    if "demand" in series_lower or "balance" in series_lower or "proxy" in series_lower:
-        value_col = "demand_index"
-    elif "impliedvol" in series_lower or series_lower.endswith("_iv"):
-        value_col = "iv"
-    elif "volume" in series_lower:
-        value_col = "volume"
-    elif "stocks" in series_lower:
-        value_col = "stocks"
-    else:
-        value_col = "price"
-
-    # Create output dataframe with canonical column names
-    out = df[[dcol, scol]].rename(columns={dcol: "date", scol: value_col})
-    out["date"] = pd.to_datetime(out["date"], errors="coerce")
-    out[value_col] = pd.to_numeric(out[value_col], errors="coerce")
-
-    # Clean data
-    before = len(out)
-    out = out.dropna(subset=["date", value_col])
-    out = out.sort_values("date").drop_duplicates(subset=["date"])
-    after = len(out)
-    drop_frac = 0 if before == 0 else (before - after) / before
+    out = extract_canonical_block(
+        df, date_col, [series_col], max_drop_frac, value_column=demand_value_column
+    )[series_col]
 
     # Create output directory if needed
     out_csv = Path(out_csv)
     out_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    # Warn if too many rows dropped
-    if drop_frac > max_drop_frac:
-        print(
-            f"[WARN] Dropped {before-after} rows ({drop_frac:.1%}) for {series_col}. "
-            f"Check mapping/units."
-        )
-
     # Write canonical CSV
     out.to_csv(out_csv, index=False)
-    print(f"[OK] {series_col}: wrote {after} rows -> {out_csv} (column: '{value_col}')")
+    print(f"[OK] {series_col}: wrote {len(out)} rows -> {out_csv} (column: '{out.columns[1]}')")
 
 
 def excel_to_canonical(excel_path, sheet, date_col, fields, out_dir):
@@ -97,10 +84,11 @@ def excel_to_canonical(excel_path, sheet, date_col, fields, out_dir):
     print(f"[INFO] Available columns: {list(df.columns)}")
     print()
     
-    # Convert each field to canonical format
-    for field in fields:
-        out_csv = out_dir / f"{field}.canonical.csv"
-        make_canonical_from_raw(df, date_col, field, out_csv, max_drop_frac=0.20)
+    # Convert all fields in one pass, write CSVs concurrently
+    frames = extract_canonical_block(
+        df, date_col, fields, max_drop_frac=0.20, value_column=demand_value_column
+    )
+    write_canonical_csvs(frames, out_dir)
 
 
 if __name__ == "__main__":